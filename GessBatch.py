@@ -0,0 +1,129 @@
+# Description: Houses the NumPy batch board engine, which stores many Gess boards in one uint8 array of shape
+#              (N, 20, 20) and runs piece-footprint extraction, ring detection and win detection for the whole batch
+#              in single vectorized calls. Cells are 0 for empty, 1 for black and 2 for white. Index [n, row, column]
+#              is the space in row row + 1 and column COLUMNS[column] of board n, so rows increase from bottom to top.
+
+import numpy as np
+
+from GessGame import WIDTH
+
+
+# Values of the cells of a batch.
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+# Value of each player's color in a batch.
+COLOR_VALUES = {"BLACK": BLACK, "WHITE": WHITE}
+
+# Values of the game states returned by BoardBatch.get_game_states, and the GessGame state each stands for.
+UNFINISHED = 0
+BLACK_WON = 1
+WHITE_WON = 2
+GAME_STATES = ("UNFINISHED", "BLACK_WON", "WHITE_WON")
+
+# Number of bytes holding a 400-bit bitboard.
+BITBOARD_BYTES = (WIDTH * WIDTH + 7) // 8
+
+
+def bitboards_to_array(bitboards):
+    """Returns a (N, 20, 20) bool array of the spaces set in each of a list of bitboards."""
+    data = b"".join(bitboard.to_bytes(BITBOARD_BYTES, "little") for bitboard in bitboards)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8).reshape(-1, BITBOARD_BYTES), axis=1, bitorder="little")
+    return bits[:, :WIDTH * WIDTH].reshape(-1, WIDTH, WIDTH).astype(bool)
+
+
+def array_to_bitboards(array):
+    """Returns the bitboard of the spaces set in each board of a (N, 20, 20) bool array."""
+    packed = np.packbits(array.reshape(-1, WIDTH * WIDTH), axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+class BoardBatch:
+    """
+    This class holds a batch of boards as a single (N, 20, 20) uint8 array of cells.
+    Every method works on the whole batch at once, so looping over boards in Python is never needed.
+    """
+    def __init__(self, cells):
+        """Instantiates a BoardBatch from a (N, 20, 20) array of cells, or a single (20, 20) board."""
+        cells = np.asarray(cells, dtype=np.uint8)
+        if cells.ndim == 2:
+            cells = cells[np.newaxis]
+        if cells.shape[1:] != (WIDTH, WIDTH):
+            raise ValueError("Cells must have the shape (N, 20, 20).")
+        self._cells = cells
+
+    @classmethod
+    def from_boards(cls, boards):
+        """Returns a BoardBatch holding the stones of a list of Board objects."""
+        black = bitboards_to_array([board.get_stones("BLACK") for board in boards])
+        white = bitboards_to_array([board.get_stones("WHITE") for board in boards])
+        return cls(black * np.uint8(BLACK) + white * np.uint8(WHITE))
+
+    @classmethod
+    def from_games(cls, games):
+        """Returns a BoardBatch holding the boards of a list of GessGame objects."""
+        return cls.from_boards([game.get_board() for game in games])
+
+    def __len__(self):
+        """Returns the number of boards in the batch."""
+        return len(self._cells)
+
+    def get_cells(self):
+        """Get method for the (N, 20, 20) array of cells."""
+        return self._cells
+
+    def get_stones(self, color):
+        """Returns a (N, 20, 20) bool array of a player's stones."""
+        return self._cells == COLOR_VALUES[color]
+
+    def get_bitboards(self, color):
+        """Returns the bitboard of a player's stones on each board, as used by Board."""
+        return array_to_bitboards(self.get_stones(color))
+
+    def get_footprints(self, rows, columns):
+        """
+        Returns the (N, 3, 3) cells of the 3x3 area centered on one space per board, given as arrays of row
+            and column indices, with [n, 0, 0] the bottom left space of board n's area.
+        Centers must be inside the edges of the board, so rows and columns are from 1 to 18.
+        """
+        rows = np.asarray(rows)[:, np.newaxis, np.newaxis] + np.arange(-1, 2)[:, np.newaxis]
+        columns = np.asarray(columns)[:, np.newaxis, np.newaxis] + np.arange(-1, 2)
+        return self._cells[np.arange(len(self._cells))[:, np.newaxis, np.newaxis], rows, columns]
+
+    def get_all_footprints(self):
+        """
+        Returns a read-only (N, 18, 18, 3, 3) view of the 3x3 area centered on every space inside the edges,
+            where [n, row - 1, column - 1] is the area centered on row index row and column index column.
+        """
+        return np.lib.stride_tricks.sliding_window_view(self._cells, (3, 3), axis=(1, 2))
+
+    def find_rings(self, color):
+        """
+        Returns a (N, 20, 20) bool array of every ring center of a player, c3 through r18: an empty space with
+            the player's stones on all eight sides, as checked by Board.is_a_ring.
+        """
+        stones = self.get_stones(color)
+        rings = np.zeros(self._cells.shape, dtype=bool)
+        centers = self._cells[:, 2:18, 2:18] == EMPTY
+        for vertical in (-1, 0, 1):
+            for horizontal in (-1, 0, 1):
+                if vertical != 0 or horizontal != 0:
+                    centers &= stones[:, 2 + vertical:18 + vertical, 2 + horizontal:18 + horizontal]
+        rings[:, 2:18, 2:18] = centers
+        return rings
+
+    def count_rings(self, color):
+        """Returns the number of rings a player has on each board."""
+        return self.find_rings(color).sum(axis=(1, 2))
+
+    def get_game_states(self):
+        """
+        Returns the game state of each board as UNFINISHED, BLACK_WON or WHITE_WON, checking black's rings
+            first as GessGame.make_move does.
+        """
+        black_rings = self.count_rings("BLACK")
+        white_rings = self.count_rings("WHITE")
+        states = np.full(len(self._cells), UNFINISHED, dtype=np.uint8)
+        states[white_rings == 0] = BLACK_WON
+        states[black_rings == 0] = WHITE_WON
+        return states
@@ -0,0 +1,116 @@
+import random
+import unittest
+from GessGame import *
+
+try:
+    import numpy as np
+    from GessBatch import *
+except ImportError:
+    np = None
+
+
+def random_games(count, seed, max_moves=12):
+    """
+    Returns games played with random legal moves, each stopped after a random number of moves below max_moves.
+    Shared with the other testers that need assorted positions.
+    """
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        game = GessGame()
+        for _ in range(rng.randrange(max_moves)):
+            if game.get_game_state() != "UNFINISHED":
+                break
+            game.make_move(*rng.choice(game.legal_moves()))
+        games.append(game)
+    return games
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestGessBatch(unittest.TestCase):
+    """
+    Contains unit tests for GessBatch.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO CONVERSIONS:
+    """
+    # Tests relating to bitboards_to_array and array_to_bitboards.
+    def test_1_bitboards_to_array(self):
+        # Testing that a bitboard is unpacked to the right spaces and packed back the same.
+        board = Board()
+        array = bitboards_to_array([board.get_stones("BLACK")])
+        output = [bool(array[0, 6, 2]), bool(array[0, 6, 3]), int(array.sum())]
+
+        self.assertEqual(output, [True, False, 43])
+        self.assertEqual(array_to_bitboards(array), [board.get_stones("BLACK")])
+
+    """
+    TESTS RELATING TO BOARDBATCH CLASS:
+    """
+    # Tests relating to from_boards.
+    def test_1_from_boards(self):
+        # Testing that each cell matches the board's space.
+        board = Board()
+        batch = BoardBatch.from_boards([board])
+        cells = batch.get_cells()
+        output = [int(cells[0, 6, 2]), int(cells[0, 13, 2]), int(cells[0, 9, 9]), len(batch)]
+
+        self.assertEqual(output, [BLACK, WHITE, EMPTY, 1])
+        self.assertEqual(batch.get_bitboards("WHITE"), [board.get_stones("WHITE")])
+
+    def test_2_from_boards(self):
+        # Testing that cells with the wrong shape are rejected.
+        with self.assertRaises(ValueError):
+            BoardBatch(np.zeros((2, 19, 20)))
+
+    # Tests relating to get_footprints.
+    def test_1_get_footprints(self):
+        # Testing the footprint of the black ring at l3 and of the piece at c6.
+        batch = BoardBatch.from_boards([Board(), Board()])
+        output = batch.get_footprints([2, 5], [11, 2])
+
+        self.assertEqual(output[0].tolist(), [[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+        self.assertEqual(output[1].tolist(), [[0, 0, 0], [0, 0, 0], [0, 1, 0]])
+
+    # Tests relating to get_all_footprints.
+    def test_1_get_all_footprints(self):
+        # Testing that the footprints of every center line up with get_footprints.
+        games = random_games(4, 1)
+        batch = BoardBatch.from_games(games)
+        footprints = batch.get_all_footprints()
+        rows = np.array([1, 5, 18, 9])
+        columns = np.array([1, 17, 9, 18])
+
+        self.assertEqual(footprints.shape, (4, 18, 18, 3, 3))
+        self.assertTrue((footprints[np.arange(4), rows - 1, columns - 1] == batch.get_footprints(rows, columns)).all())
+
+    # Tests relating to find_rings.
+    def test_1_find_rings(self):
+        # Testing that the rings found for a batch match the Board's own ring check on every board.
+        games = random_games(30, 2)
+        batch = BoardBatch.from_games(games)
+        for color in ("BLACK", "WHITE"):
+            output = array_to_bitboards(batch.find_rings(color))
+            expected = [game.get_board().find_rings(color) for game in games]
+
+            self.assertEqual(output, expected)
+
+    # Tests relating to get_game_states.
+    def test_1_get_game_states(self):
+        # Testing the state of the starting board, and of boards missing black's, white's or both players' rings.
+        boards = [Board(), Board(), Board(), Board()]
+        boards[1].clear_area("l3")
+        boards[2].clear_area("l18")
+        boards[3].clear_area("l3")
+        boards[3].clear_area("l18")
+        output = BoardBatch.from_boards(boards).get_game_states().tolist()
+
+        self.assertEqual(output, [UNFINISHED, WHITE_WON, BLACK_WON, WHITE_WON])
+
+
+if __name__ == "__main__":
+    unittest.main()
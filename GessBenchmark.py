@@ -0,0 +1,211 @@
+# Description: Houses the benchmark suite for the Gess rules engine. Each benchmark times one core operation,
+#              or complete random games, on a fixed set of positions reached by seeded random play, so runs with
+#              the same seed time the same work. Results are JSON, and can be compared against a saved baseline
+#              to flag the benchmarks that got slower.
+#              Run from the command line with: python GessBenchmark.py --output baseline.json
+#              then, after a change: python GessBenchmark.py --baseline baseline.json
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from GessGame import COORDINATES, GessGame, get_offset
+
+
+# Most random moves played from the start to reach each position of the set.
+MAX_POSITION_PLIES = 40
+# Random games are stopped after this many moves.
+MAX_GAME_MOVES = 300
+# Share a benchmark may get slower than its baseline before it is flagged as a regression.
+REGRESSION_THRESHOLD = 0.10
+
+
+def make_positions(count, seed=0, max_plies=MAX_POSITION_PLIES):
+    """
+    Returns a list of count positions, as to_fen text, each reached by playing a seeded random number of random
+        legal moves from the start. Positions where the game ended are skipped, so every position has moves.
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = GessGame()
+        for ply in range(rng.randint(0, max_plies)):
+            moves = list(game.iter_legal_square_moves(distinct=True))
+            if len(moves) == 0:
+                break
+            start, end = rng.choice(moves)
+            game.make_square_move(start, end)
+            if game.get_game_state() != "UNFINISHED":
+                break
+        if game.get_game_state() == "UNFINISHED" and len(game.legal_moves()) > 0:
+            positions.append(game.to_fen())
+    return positions
+
+
+def play_random_game(seed):
+    """Plays a game of random legal moves from a seed, returning the number of moves made."""
+    rng = random.Random(seed)
+    game = GessGame()
+    made = 0
+    while game.get_game_state() == "UNFINISHED" and made < MAX_GAME_MOVES:
+        moves = list(game.iter_legal_square_moves(distinct=True))
+        if len(moves) == 0:
+            break
+        start, end = rng.choice(moves)
+        game.make_square_move(start, end)
+        made += 1
+    return made
+
+
+def make_move(item):
+    """Makes a (game, start, end) move with make_move."""
+    item[0].make_move(item[1], item[2])
+
+
+def clone_games(items):
+    """Returns the (game, start, end) items with a clone of each game, so every run makes its moves on fresh games."""
+    return [(game.clone(), start, end) for game, start, end in items]
+
+
+def get_slides(games, rng, long):
+    """
+    Returns up to 50 (game, start, end) items per game for legal moves whose piece slides at most 3 spaces, or more
+        than 3 spaces if long is True. Only the ends the pieces actually stop on are chosen, so the distance to the
+        end is the length of the slide.
+    """
+    items = []
+    for game in games:
+        slides = [(game, COORDINATES[start], COORDINATES[end])
+                  for start, end in game.iter_legal_square_moves(distinct=True)
+                  if (max(abs(offset) for offset in get_offset(COORDINATES[start], COORDINATES[end])) > 3) == long]
+        items.extend(rng.sample(slides, min(50, len(slides))))
+    return items
+
+
+def build_benchmarks(positions, seed=0, games=20):
+    """
+    Returns a dictionary of each benchmark's name to an (operation, items, setup) tuple, where timing the benchmark
+        calls operation once with each item. Items are built from the positions and the seed only. setup is None, or
+        a function that turns the items into the ones a run uses, which is called before each run and isn't timed.
+    """
+    rng = random.Random(seed)
+    position_games = [GessGame.from_fen(position) for position in positions]
+    boards = [game.get_board() for game in position_games]
+
+    pieces = []
+    for game in position_games:
+        for start, end in rng.sample(game.legal_moves(), min(20, len(game.legal_moves()))):
+            pieces.append((game.get_board().get_piece(start), end))
+
+    return {
+        "game_init": (lambda item: GessGame(), range(200), None),
+        "get_neighbors": (lambda item: item[0].get_neighbors(item[1]),
+                          [(board, COORDINATES[rng.randrange(21, 379)]) for board in boards for index in range(20)],
+                          None),
+        "check_rings": (lambda item: item[0].check_rings(item[1]),
+                        [(board, color) for board in boards for color in ("BLACK", "WHITE")], None),
+        "can_piece_move_to": (lambda item: item[0].can_piece_move_to(item[1]), pieces, None),
+        "make_move_short": (make_move, get_slides(position_games, rng, False), clone_games),
+        "make_move_long": (make_move, get_slides(position_games, rng, True), clone_games),
+        "random_game": (play_random_game, [seed * 1000 + index for index in range(games)], None),
+    }
+
+
+def time_benchmark(operation, items, repeats=5, setup=None):
+    """
+    Calls operation with every item, repeats times, returning the fewest seconds per call of any run.
+    The fastest run is the one least disturbed by the rest of the machine. If setup is given, each run calls operation
+        with the items setup returns instead, and the time setup takes isn't counted.
+    """
+    items = list(items)
+    if len(items) == 0:
+        return None
+
+    best = None
+    for repeat in range(repeats):
+        run_items = items if setup is None else setup(items)
+        start_time = time.perf_counter()
+        for item in run_items:
+            operation(item)
+        elapsed = time.perf_counter() - start_time
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / len(items)
+
+
+def run_benchmarks(seed=0, positions=20, repeats=5, names=None, games=20):
+    """
+    Runs the benchmarks on a set of seeded positions, or only the benchmarks named, returning a report dictionary
+        with the seconds per operation and operations per second of each benchmark.
+    """
+    benchmarks = build_benchmarks(make_positions(positions, seed), seed, games)
+    if names is not None:
+        unknown = [name for name in names if name not in benchmarks]
+        if len(unknown) > 0:
+            raise ValueError("Unknown benchmarks: " + ", ".join(unknown))
+
+    results = {}
+    for name, (operation, items, setup) in benchmarks.items():
+        if names is not None and name not in names:
+            continue
+        items = list(items)
+        seconds = time_benchmark(operation, items, repeats, setup)
+        results[name] = {"seconds": seconds, "per_second": 1 / seconds if seconds else None, "items": len(items)}
+
+    return {"seed": seed, "positions": positions, "repeats": repeats, "games": games,
+            "python": platform.python_version(), "results": results}
+
+
+def compare_reports(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compares the seconds per operation of a report against a baseline report, returning a list of the benchmarks
+        that got slower by more than the threshold share. Benchmarks missing from either report are skipped.
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["seconds"]
+        after = result["seconds"]
+        if before and after and after > before * (1 + threshold):
+            regressions.append({"benchmark": name, "baseline": before, "seconds": after,
+                                "change": after / before - 1})
+    return regressions
+
+
+def main(arguments=None):
+    """
+    Runs the benchmarks from the command line, printing the report as JSON.
+    Returns the report, which holds the regressions against the baseline if one is given.
+    """
+    parser = argparse.ArgumentParser(description="Time the core operations of the Gess rules engine.")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the positions and moves timed")
+    parser.add_argument("--positions", type=int, default=20, help="number of positions to time operations on")
+    parser.add_argument("--repeats", type=int, default=5, help="runs of each benchmark, the fastest is kept")
+    parser.add_argument("--games", type=int, default=20, help="number of complete random games to time")
+    parser.add_argument("--only", nargs="+", default=None, help="names of the benchmarks to run")
+    parser.add_argument("--output", default=None, help="file to write the report to, such as a new baseline")
+    parser.add_argument("--baseline", default=None, help="report file to compare the results against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="share a benchmark may slow down before it is flagged")
+    options = parser.parse_args(arguments)
+
+    report = run_benchmarks(options.seed, options.positions, options.repeats, options.only, options.games)
+    if options.baseline is not None:
+        with open(options.baseline) as baseline_file:
+            report["regressions"] = compare_reports(report, json.load(baseline_file), options.threshold)
+    if options.output is not None:
+        with open(options.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return report
+
+
+if __name__ == "__main__":
+    # Exits with 1 when a benchmark regressed, so the suite can gate a build.
+    sys.exit(1 if main().get("regressions") else 0)
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from GessGame import *
+from GessBenchmark import *
+
+
+class TestGessBenchmark(unittest.TestCase):
+    """
+    Contains unit tests for GessBenchmark.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO THE POSITION SET:
+    """
+    # Tests relating to make_positions.
+    def test_1_make_positions(self):
+        # Testing that the same seed gives the same unfinished positions.
+        output = make_positions(5, 3)
+
+        self.assertEqual(output, make_positions(5, 3))
+        self.assertEqual([GessGame.from_fen(position).get_game_state() for position in output], ["UNFINISHED"] * 5)
+
+    """
+    TESTS RELATING TO RUNNING BENCHMARKS:
+    """
+    # Tests relating to build_benchmarks.
+    def test_1_build_benchmarks(self):
+        # Testing that every benchmark has items, and that the short and long slides are split by how far they slide.
+        benchmarks = build_benchmarks(make_positions(3, 2), 2, 2)
+        output = [len(list(items)) > 0 for operation, items, setup in benchmarks.values()]
+        slides = {}
+        for name in ("make_move_short", "make_move_long"):
+            landings = [(start, game.clone().try_move(start, end).get_landing())
+                        for game, start, end in benchmarks[name][1]]
+            slides[name] = [max(abs(offset) for offset in get_offset(start, landing)) for start, landing in landings]
+
+        self.assertEqual(output, [True] * len(benchmarks))
+        self.assertEqual([max(slides["make_move_short"]) <= 3, min(slides["make_move_long"]) > 3], [True, True])
+
+    def test_2_build_benchmarks(self):
+        # Testing that the make_move benchmarks make their moves on clones, leaving the positions' games alone.
+        operation, items, setup = build_benchmarks(make_positions(3, 0), 0, 1)["make_move_long"]
+        positions = [game.to_fen() for game, start, end in items]
+        time_benchmark(operation, items, 2, setup)
+        output = [game.to_fen() for game, start, end in items]
+
+        self.assertEqual(output, positions)
+
+    # Tests relating to run_benchmarks.
+    def test_1_run_benchmarks(self):
+        # Testing that the report holds a positive time for each benchmark named.
+        report = run_benchmarks(seed=2, positions=2, repeats=1, names=["game_init", "make_move_short"], games=1)
+        output = sorted(name for name, result in report["results"].items() if result["seconds"] > 0)
+
+        self.assertEqual(output, ["game_init", "make_move_short"])
+
+    def test_2_run_benchmarks(self):
+        # Testing that an unknown benchmark name is rejected.
+        with self.assertRaises(ValueError):
+            run_benchmarks(positions=1, repeats=1, names=["teleport"], games=1)
+
+    # Tests relating to compare_reports.
+    def test_1_compare_reports(self):
+        # Testing that only the benchmark slower by more than the threshold is flagged.
+        baseline = {"results": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}}
+        report = {"results": {"a": {"seconds": 1.05}, "b": {"seconds": 1.5}, "c": {"seconds": 9.0}}}
+        output = [regression["benchmark"] for regression in compare_reports(report, baseline, 0.1)]
+
+        self.assertEqual(output, ["b"])
+
+    # Tests relating to main.
+    def test_1_main(self):
+        # Testing that a report written as a baseline has no regressions against a huge threshold.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            arguments = ["--positions", "2", "--repeats", "1", "--games", "1", "--only", "check_rings"]
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(arguments + ["--output", path])
+                output = main(arguments + ["--baseline", path, "--threshold", "1000"])
+            with open(path) as baseline_file:
+                saved = json.load(baseline_file)
+
+        self.assertEqual(output["regressions"], [])
+        self.assertEqual(list(saved["results"]), ["check_rings"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,338 @@
+# Description: Houses the alpha-beta search engine that picks moves for a GessGame.
+#              The engine searches with negamax alpha-beta and iterative deepening, stopping at a time or node limit,
+#              and remembers searched positions in a bounded transposition table keyed by the game's Zobrist hash.
+
+import time
+from itertools import islice
+
+from GessGame import (AREA_MASKS, COORDINATES, INTERIOR_MASK, RING_WINDOWS, WIDTH, get_pattern_mask,
+                      get_ring_centers, opponent_of)
+
+
+# Score of a won game. Wins found sooner score higher, so the engine takes the quickest win.
+WIN_SCORE = 100000
+# Scores at least this far from zero are wins or losses, whose distance to the end of the game depends on the ply.
+WIN_BOUND = WIN_SCORE // 2
+# Score of each ring a player has, on top of one point per stone.
+RING_SCORE = 20
+# Moves tried in the order they are generated, one move from the end of the search, before the rest are sorted.
+QUICK_MOVES = 8
+
+# Transposition table entry flags, telling if a stored score is exact or only a bound.
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when it runs out of time or nodes, to unwind back to the root."""
+
+
+def count_stones(stones):
+    """Returns the number of stones on a bitboard."""
+    return bin(stones).count("1")
+
+
+def evaluate(game):
+    """Scores a game's position from the point of view of the player to move, counting stones and rings."""
+    board = game.get_board()
+    player = game.get_current_player()
+    opponent = opponent_of(player)
+    stones = count_stones(board.get_stones(player)) - count_stones(board.get_stones(opponent))
+    rings = count_stones(board.get_ring_squares(player)) - count_stones(board.get_ring_squares(opponent))
+    return stones + RING_SCORE * rings
+
+
+def score_move(board, player, start, end):
+    """
+    Returns the stone and ring score of the position a square index move leads to, from the point of view of the
+        player making it, without making the move. The end must be the space the piece stops on, as the moves of
+        iter_legal_square_moves with distinct=True are. A move that ends the game scores WIN_SCORE if the player
+        wins, and -WIN_SCORE if the player loses.
+    The new bitboards are worked out the same way make_move changes them: the start and landing areas are cleared,
+        the piece's stones are placed around the landing space and off the edges, and the rings are checked again
+        only around the two areas.
+    """
+    opponent = opponent_of(player)
+    own = board.get_stones(player)
+    other = board.get_stones(opponent)
+    landing_area = AREA_MASKS[end]
+    placed = get_pattern_mask(board.get_pattern(start, player)) << (end - WIDTH - 1)
+    own = (own & ~AREA_MASKS[start] & ~landing_area | placed) & INTERIOR_MASK
+    other &= ~landing_area
+    occupied = own | other
+
+    window = RING_WINDOWS[start] | RING_WINDOWS[end]
+    own_rings = board.get_ring_squares(player) & ~window | get_ring_centers(own, occupied, window)
+    other_rings = board.get_ring_squares(opponent) & ~window | get_ring_centers(other, occupied, window)
+    # Black losing its last ring is checked first, as in make_move.
+    black_rings, white_rings = (own_rings, other_rings) if player == "BLACK" else (other_rings, own_rings)
+    if black_rings == 0:
+        return WIN_SCORE if player == "WHITE" else -WIN_SCORE
+    elif white_rings == 0:
+        return WIN_SCORE if player == "BLACK" else -WIN_SCORE
+    return count_stones(own) - count_stones(other) + RING_SCORE * (count_stones(own_rings) - count_stones(other_rings))
+
+
+def to_table_score(score, ply):
+    """Returns a score found at a ply as stored in the transposition table, with wins counted from the position."""
+    if score >= WIN_BOUND:
+        return score + ply
+    elif score <= -WIN_BOUND:
+        return score - ply
+    return score
+
+
+def from_table_score(score, ply):
+    """Returns a score stored in the transposition table as a score at a ply, undoing to_table_score."""
+    if score >= WIN_BOUND:
+        return score - ply
+    elif score <= -WIN_BOUND:
+        return score + ply
+    return score
+
+
+class SearchResult:
+    """
+    This class holds the outcome of a search: the best move found, its score, and statistics about the search.
+    """
+    def __init__(self, best_move, score, depth, nodes, elapsed):
+        """Instantiates a SearchResult with the best move, its score, the depth completed, nodes searched and seconds taken."""
+        self._best_move = best_move
+        self._score = score
+        self._depth = depth
+        self._nodes = nodes
+        self._elapsed = elapsed
+
+    def get_best_move(self):
+        """Get method for the best (start, end) move, or None if there was no legal move."""
+        return self._best_move
+
+    def get_score(self):
+        """Get method for the best move's score, from the point of view of the player to move."""
+        return self._score
+
+    def get_depth(self):
+        """Get method for the deepest search depth that was completed."""
+        return self._depth
+
+    def get_nodes(self):
+        """Get method for the number of positions searched."""
+        return self._nodes
+
+    def get_elapsed(self):
+        """Get method for the number of seconds the search took."""
+        return self._elapsed
+
+    def get_nodes_per_second(self):
+        """Returns the number of positions searched per second."""
+        if self._elapsed <= 0:
+            return 0.0
+        return self._nodes / self._elapsed
+
+
+class TranspositionTable:
+    """
+    This class stores search results by position hash in a fixed number of slots, so memory stays bounded.
+    When two positions share a slot, the new entry replaces the old one if it comes from a newer search or
+        was searched at least as deep, keeping the more expensive results around.
+    """
+    def __init__(self, size=1 << 16):
+        """Instantiates a TranspositionTable with a number of slots."""
+        self._size = size
+        self._slots = [None] * size
+        # Counter of the searches run, so entries left over from an older search can always be replaced.
+        self._generation = 0
+
+    def new_search(self):
+        """Marks the start of a new search, making the existing entries replaceable."""
+        self._generation += 1
+
+    def get(self, key):
+        """Returns the (depth, score, flag, move) entry stored for a position hash, or None if there isn't one."""
+        entry = self._slots[key % self._size]
+        if entry is not None and entry[0] == key:
+            return entry[1:5]
+        return None
+
+    def store(self, key, depth, score, flag, move):
+        """Stores a search result for a position hash, following the table's replacement policy."""
+        index = key % self._size
+        entry = self._slots[index]
+        if entry is None or entry[5] != self._generation or depth >= entry[1] or entry[0] == key:
+            self._slots[index] = (key, depth, score, flag, move, self._generation)
+
+
+class GessEngine:
+    """
+    This is the class that picks moves for a GessGame. find_best_move searches the game's position one depth at
+        a time, keeping the best move of the deepest completed search once the time or node limit is reached.
+    Moves are tried on the game itself with push_square_move and pop_move, and the game is always restored afterwards.
+        The moves one move from the end of the search are scored with score_move instead, without being made.
+    The search works with square index moves, and only the best move is turned back into coordinates.
+    """
+    def __init__(self, time_limit=0.2, node_limit=None, max_depth=32, table_size=1 << 16):
+        """
+        Instantiates a GessEngine with a time limit in seconds, an optional node limit, the deepest depth to search,
+        and the number of transposition table slots.
+        """
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+        self._max_depth = max_depth
+        self._table = TranspositionTable(table_size)
+        self._nodes = 0
+        self._deadline = None
+        # Best square index move of the last completed search at the root, or None if the root had no legal move.
+        self._root_move = None
+
+    def order_moves(self, game, moves, first_move=None):
+        """
+        Sorts square index moves so first_move comes first, followed by captures with the most opposing stones taken.
+        Moves come from iter_legal_square_moves with distinct=True, so each end is the space where the piece lands.
+        """
+        board = game.get_board()
+        opponent_stones = board.get_stones(opponent_of(game.get_current_player()))
+
+        # Most moves take nothing, so only the captures are counted and sorted, and the rest keep their order.
+        first = []
+        captures = []
+        quiet = []
+        for move in moves:
+            if move == first_move:
+                first.append(move)
+            elif opponent_stones & AREA_MASKS[move[1]]:
+                captures.append(move)
+            else:
+                quiet.append(move)
+        captures.sort(key=lambda move: -count_stones(opponent_stones & AREA_MASKS[move[1]]))
+        return first + captures + quiet
+
+    def iter_frontier_moves(self, game):
+        """
+        Generator that yields the square index moves of a position one move from the end of the search.
+        Most of these positions are cut off by one of their first moves, so the first QUICK_MOVES are tried as they
+            are generated, and only the rest are sorted by order_moves.
+        """
+        moves = game.iter_legal_square_moves(distinct=True)
+        yield from islice(moves, QUICK_MOVES)
+        yield from self.order_moves(game, moves)
+
+    def check_limits(self):
+        """Raises SearchTimeout once the search is past its time or node limit."""
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise SearchTimeout()
+        elif self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+    def negamax(self, game, depth, alpha, beta, ply):
+        """Returns the score of the game's position for the player to move, searching depth moves ahead."""
+        self._nodes += 1
+        self.check_limits()
+
+        if depth == 0:
+            return evaluate(game)
+
+        key = game.position_hash()
+        original_alpha = alpha
+        table_move = None
+        entry = self._table.get(key)
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, table_move = entry
+            entry_score = from_table_score(entry_score, ply)
+            # The root is always searched, since a score without a move to go with it is no use there.
+            if entry_depth >= depth and ply > 0:
+                if entry_flag == EXACT:
+                    return entry_score
+                elif entry_flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                elif entry_flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        if depth == 1:
+            moves = self.iter_frontier_moves(game)
+        else:
+            moves = self.order_moves(game, game.iter_legal_square_moves(distinct=True), table_move)
+
+        player = game.get_current_player()
+        board = game.get_board()
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in moves:
+            # The positions one move from the end of the search are scored straight from the bitboards.
+            if depth == 1:
+                self._nodes += 1
+                self.check_limits()
+                score = score_move(board, player, move[0], move[1])
+                if score == WIN_SCORE:
+                    score -= ply
+                elif score == -WIN_SCORE:
+                    score += ply
+            else:
+                game.push_square_move(move[0], move[1])
+                try:
+                    # A move that ends the game is scored right away, as the player to move doesn't change.
+                    if game.get_game_state() != "UNFINISHED":
+                        score = WIN_SCORE - ply if game.get_game_state() == player + "_WON" else ply - WIN_SCORE
+                    else:
+                        score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1)
+                finally:
+                    game.pop_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        # Without any legal move, the position is scored as it stands.
+        if best_move is None:
+            if ply == 0:
+                self._root_move = None
+            return evaluate(game)
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        # Wins and losses are stored counted from this position, so a transposition at another ply reads them right.
+        self._table.store(key, depth, to_table_score(best_score, ply), flag, best_move)
+        if ply == 0:
+            self._root_move = best_move
+        return best_score
+
+    def find_best_move(self, game):
+        """Searches a game's position with iterative deepening, returning a SearchResult for the player to move."""
+        start_time = time.perf_counter()
+        self._deadline = None if self._time_limit is None else start_time + self._time_limit
+        self._nodes = 0
+        self._table.new_search()
+
+        best_move = None
+        best_score = 0
+        completed_depth = 0
+        if game.get_game_state() == "UNFINISHED":
+            for depth in range(1, self._max_depth + 1):
+                self._root_move = None
+                try:
+                    score = self.negamax(game, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+                except SearchTimeout:
+                    break
+                # A root with no legal move has nothing to search deeper for.
+                if self._root_move is None:
+                    break
+                best_move = (COORDINATES[self._root_move[0]], COORDINATES[self._root_move[1]])
+                best_score = score
+                completed_depth = depth
+                # No deeper search can change a forced win or loss.
+                if abs(score) >= WIN_SCORE - self._max_depth:
+                    break
+
+            # Falls back to the first legal move if not even one depth could be completed.
+            if best_move is None:
+                best_move = next(game.iter_legal_moves(distinct=True), None)
+
+        return SearchResult(best_move, best_score, completed_depth, self._nodes, time.perf_counter() - start_time)
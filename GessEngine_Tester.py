@@ -0,0 +1,181 @@
+import unittest
+from GessGame import *
+from GessEngine import *
+from GessBenchmark import make_positions
+
+
+def winning_game():
+    """
+    Returns a game where black can break white's only ring, centered at j10, by moving the piece at j6 north.
+    Shared with the other testers of move pickers.
+    """
+    game = GessGame()
+    board = game.get_board()
+    board.set_stones("BLACK", 0)
+    board.set_stones("WHITE", 0)
+    board.place_pattern(get_square("d4"), RING_PATTERN, "BLACK")
+    board.place_pattern(get_square("j6"), 0o220, "BLACK")
+    board.place_pattern(get_square("j10"), RING_PATTERN, "WHITE")
+    board.check_rings("BLACK")
+    board.check_rings("WHITE")
+    return game
+
+
+class TestGessEngine(unittest.TestCase):
+    """
+    Contains unit tests for GessEngine.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO EVALUATE:
+    """
+    # Tests relating to evaluate.
+    def test_1_evaluate(self):
+        # Testing that the starting position is even.
+        game = GessGame()
+        output = evaluate(game)
+
+        self.assertEqual(output, 0)
+
+    def test_2_evaluate(self):
+        # Testing that the score is from the point of view of the player to move.
+        game = winning_game()
+        black_score = evaluate(game)
+        game._current_player = "WHITE"
+        white_score = evaluate(game)
+
+        self.assertEqual(black_score, 2)
+        self.assertEqual(white_score, -2)
+
+    # Tests relating to score_move.
+    def test_1_score_move(self):
+        # Testing that scoring a move from the bitboards matches making it and evaluating the position it leads to.
+        output = []
+        for game in [GessGame.from_fen(position) for position in make_positions(6, 6)] + [winning_game()]:
+            player = game.get_current_player()
+            for start, end in game.iter_legal_square_moves(distinct=True):
+                score = score_move(game.get_board(), player, start, end)
+                game.push_square_move(start, end)
+                if game.get_game_state() == "UNFINISHED":
+                    output.append(score == -evaluate(game))
+                else:
+                    output.append(score == (WIN_SCORE if game.get_game_state() == player + "_WON" else -WIN_SCORE))
+                game.pop_move()
+
+        self.assertEqual(output, [True] * len(output))
+        self.assertGreater(len(output), 1000)
+
+    # Tests relating to to_table_score and from_table_score.
+    def test_1_to_table_score(self):
+        # Testing that a win is stored counted from the position, and read back at another ply with its distance kept.
+        stored = to_table_score(WIN_SCORE - 5, 3)
+        output = [stored, from_table_score(stored, 1), from_table_score(to_table_score(5 - WIN_SCORE, 3), 1),
+                  from_table_score(to_table_score(40, 3), 1)]
+
+        self.assertEqual(output, [WIN_SCORE - 2, WIN_SCORE - 3, 3 - WIN_SCORE, 40])
+
+    """
+    TESTS RELATING TO TRANSPOSITIONTABLE CLASS:
+    """
+    # Tests relating to get and store.
+    def test_1_store(self):
+        # Testing that a stored entry can be read back, and a different hash in the same slot is not returned.
+        table = TranspositionTable(8)
+        table.store(3, 2, 10, EXACT, ("c3", "c6"))
+        output = [table.get(3), table.get(11)]
+
+        self.assertEqual(output, [(2, 10, EXACT, ("c3", "c6")), None])
+
+    def test_2_store(self):
+        # Testing that a shallower entry doesn't replace a deeper one from the same search, but does from an older one.
+        table = TranspositionTable(8)
+        table.store(3, 4, 10, EXACT, None)
+        table.store(11, 1, 5, EXACT, None)
+        same_search = table.get(3)
+        table.new_search()
+        table.store(11, 1, 5, EXACT, None)
+        output = [same_search, table.get(3), table.get(11)]
+
+        self.assertEqual(output, [(4, 10, EXACT, None), None, (1, 5, EXACT, None)])
+
+    """
+    TESTS RELATING TO GESSENGINE CLASS:
+    """
+    # Tests relating to find_best_move.
+    def test_1_find_best_move(self):
+        # Testing that the engine finds the move that breaks the opponent's last ring.
+        game = winning_game()
+        engine = GessEngine(time_limit=None, max_depth=2)
+        result = engine.find_best_move(game)
+        game.make_move(*result.get_best_move())
+
+        self.assertEqual(game.get_game_state(), "BLACK_WON")
+        self.assertEqual(result.get_score(), WIN_SCORE)
+        self.assertEqual(result.get_depth(), 1)
+
+    def test_2_find_best_move(self):
+        # Testing that the search leaves the game as it found it, and returns a legal move.
+        game = GessGame()
+        start = game.position_hash()
+        engine = GessEngine(time_limit=None, node_limit=300)
+        result = engine.find_best_move(game)
+
+        self.assertEqual(game.position_hash(), start)
+        self.assertEqual(game.get_current_player(), "BLACK")
+        self.assertIn(result.get_best_move(), game.legal_moves())
+        self.assertLessEqual(result.get_nodes(), 300)
+
+    def test_3_find_best_move(self):
+        # Testing that a finished game has no best move.
+        game = GessGame()
+        game.resign_game()
+        result = GessEngine().find_best_move(game)
+
+        self.assertEqual(result.get_best_move(), None)
+
+    def test_4_find_best_move(self):
+        # Testing that searching the same position twice with one engine, which finds the root in its table, works.
+        game = GessGame()
+        engine = GessEngine(time_limit=None, max_depth=2)
+        output_1 = engine.find_best_move(game)
+        output_2 = engine.find_best_move(game)
+
+        self.assertEqual(output_2.get_best_move(), output_1.get_best_move())
+        self.assertEqual(output_2.get_depth(), 2)
+
+    def test_5_find_best_move(self):
+        # Testing that one engine can play both sides of a game for several moves.
+        game = GessGame()
+        engine = GessEngine(time_limit=None, node_limit=1000)
+        output = []
+        for _ in range(8):
+            if game.get_game_state() != "UNFINISHED":
+                break
+            move = engine.find_best_move(game).get_best_move()
+            output.append(move in game.legal_moves())
+            game.make_move(*move)
+
+        self.assertEqual(output, [True] * len(output))
+        self.assertGreater(len(output), 1)
+
+    def test_6_find_best_move(self):
+        # Testing that depth 2 is reached within 2000 nodes, with only the root's moves made and every reply scored
+        # from the bitboards.
+        class CountingGame(GessGame):
+            def push_square_move(self, start, end):
+                pushed.append((start, end))
+                return GessGame.push_square_move(self, start, end)
+
+        game = CountingGame()
+        pushed = []
+        result = GessEngine(time_limit=None, node_limit=2000, max_depth=2).find_best_move(game)
+
+        self.assertEqual(result.get_depth(), 2)
+        self.assertLessEqual(len(pushed), len(list(game.iter_legal_square_moves(distinct=True))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Description: Houses the feature-plane encoder, which turns Boards, BoardBatches or stone bitboards into fixed-shape
+#              NumPy arrays of shape (N, len(PLANES), 20, 20) for evaluation models and the self-play writer.
+#              Every plane is built with whole-array operations over the batch, never by visiting the 400 spaces one
+#              at a time. Index [n, plane, row, column] follows the layout of GessBatch: row row + 1 and column
+#              COLUMNS[column] of board n.
+
+import numpy as np
+
+from GessGame import WIDTH
+from GessBatch import BLACK, WHITE, BoardBatch, bitboards_to_array
+
+
+# Names of the feature planes, in the order they are stacked.
+#   black and white hold each player's stones, and empty holds the spaces with neither.
+#   black_rings and white_rings hold each player's ring centers.
+#   edge holds the outermost rows and columns, where pieces can't be centered and stones are removed.
+#   black_movable and white_movable hold the centers of the pieces each player could pick up: a center inside the
+#   edge whose 3x3 area has a stone of the player around the center and no stone of the opponent.
+PLANES = ("black", "white", "empty", "black_rings", "white_rings", "edge", "black_movable", "white_movable")
+PLANE_INDEX = {name: index for index, name in enumerate(PLANES)}
+
+# (20, 20) bool array of the edge spaces, which is the same for every board.
+EDGE_MASK = np.ones((WIDTH, WIDTH), dtype=bool)
+EDGE_MASK[1:WIDTH - 1, 1:WIDTH - 1] = False
+
+
+def find_movable_centers(own, other):
+    """
+    Returns a (N, 20, 20) bool array of the piece centers a player could pick up, given (N, 20, 20) bool arrays of
+        the player's stones and the opponent's stones.
+    """
+    inside = (slice(None), slice(1, WIDTH - 1), slice(1, WIDTH - 1))
+    around = np.zeros(own[inside].shape, dtype=bool)
+    blocked = other[inside].copy()
+    # Each shift lines the space at one offset from every center up with that center.
+    for vertical in (-1, 0, 1):
+        for horizontal in (-1, 0, 1):
+            rows = slice(1 + vertical, WIDTH - 1 + vertical)
+            columns = slice(1 + horizontal, WIDTH - 1 + horizontal)
+            if vertical != 0 or horizontal != 0:
+                around |= own[:, rows, columns]
+                blocked |= other[:, rows, columns]
+    movable = np.zeros(own.shape, dtype=bool)
+    movable[inside] = around & ~blocked
+    return movable
+
+
+def encode_planes(black, white, black_rings=None, white_rings=None, dtype=np.uint8):
+    """
+    Returns the (N, len(PLANES), 20, 20) feature planes from (N, 20, 20) bool arrays of each player's stones.
+    Ring centers are found from the stones if their arrays aren't given.
+    """
+    black = np.asarray(black, dtype=bool)
+    white = np.asarray(white, dtype=bool)
+    if black_rings is None or white_rings is None:
+        batch = BoardBatch(black * np.uint8(BLACK) + white * np.uint8(WHITE))
+        black_rings = batch.find_rings("BLACK")
+        white_rings = batch.find_rings("WHITE")
+
+    planes = np.empty((len(black), len(PLANES), WIDTH, WIDTH), dtype=dtype)
+    planes[:, PLANE_INDEX["black"]] = black
+    planes[:, PLANE_INDEX["white"]] = white
+    planes[:, PLANE_INDEX["empty"]] = ~(black | white)
+    planes[:, PLANE_INDEX["black_rings"]] = black_rings
+    planes[:, PLANE_INDEX["white_rings"]] = white_rings
+    planes[:, PLANE_INDEX["edge"]] = EDGE_MASK
+    planes[:, PLANE_INDEX["black_movable"]] = find_movable_centers(black, white)
+    planes[:, PLANE_INDEX["white_movable"]] = find_movable_centers(white, black)
+    return planes
+
+
+def encode_bitboards(black, white, dtype=np.uint8):
+    """Returns the feature planes of lists of black and white stone bitboards, one pair per board."""
+    return encode_planes(bitboards_to_array(black), bitboards_to_array(white), dtype=dtype)
+
+
+def encode_boards(boards, dtype=np.uint8):
+    """Returns the feature planes of a list of Board objects, taking ring centers from each board's ring index."""
+    return encode_planes(bitboards_to_array([board.get_stones("BLACK") for board in boards]),
+                         bitboards_to_array([board.get_stones("WHITE") for board in boards]),
+                         bitboards_to_array([board.get_ring_squares("BLACK") for board in boards]),
+                         bitboards_to_array([board.get_ring_squares("WHITE") for board in boards]), dtype)
+
+
+def encode_board(board, dtype=np.uint8):
+    """Returns the (len(PLANES), 20, 20) feature planes of a single Board object."""
+    return encode_boards([board], dtype)[0]
+
+
+def encode_batch(batch, dtype=np.uint8):
+    """Returns the feature planes of every board of a BoardBatch."""
+    cells = batch.get_cells()
+    return encode_planes(cells == BLACK, cells == WHITE, batch.find_rings("BLACK"), batch.find_rings("WHITE"), dtype)
+
+
+def encode_games(games, dtype=np.uint8):
+    """Returns the feature planes of the boards of a list of GessGame objects."""
+    return encode_boards([game.get_board() for game in games], dtype)
@@ -0,0 +1,78 @@
+import unittest
+from GessGame import *
+from GessBatch_Tester import random_games
+
+try:
+    import numpy as np
+    from GessBatch import BoardBatch
+    from GessFeatures import *
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestGessFeatures(unittest.TestCase):
+    """
+    Contains unit tests for GessFeatures.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    def slow_planes(self, board):
+        """Returns a board's feature planes built one space at a time, through get_space and Piece rules."""
+        planes = np.zeros((len(PLANES), 20, 20), dtype=np.uint8)
+        for square, coordinate in enumerate(COORDINATES):
+            row, column = divmod(square, 20)
+            space = board.get_space(coordinate)
+            color = "" if space == "" else space.get_color()
+            planes[PLANE_INDEX["black"], row, column] = color == "BLACK"
+            planes[PLANE_INDEX["white"], row, column] = color == "WHITE"
+            planes[PLANE_INDEX["empty"], row, column] = color == ""
+            planes[PLANE_INDEX["black_rings"], row, column] = coordinate in board.get_rings("BLACK")
+            planes[PLANE_INDEX["white_rings"], row, column] = coordinate in board.get_rings("WHITE")
+            planes[PLANE_INDEX["edge"], row, column] = row in (0, 19) or column in (0, 19)
+            if 1 <= row <= 18 and 1 <= column <= 18:
+                for player, opponent in (("BLACK", "WHITE"), ("WHITE", "BLACK")):
+                    planes[PLANE_INDEX[player.lower() + "_movable"], row, column] = \
+                        FOOTPRINT_MOVABLE[board.get_pattern(square, player)] and \
+                        board.get_pattern(square, opponent) == 0
+        return planes
+
+    """
+    TESTS RELATING TO MODULE FUNCTIONS:
+    """
+    # Tests relating to encode_board.
+    def test_1_encode_board(self):
+        # Testing the number of spaces set in each plane of the starting position.
+        planes = encode_board(Board())
+        output = [int(planes[PLANE_INDEX[name]].sum()) for name in PLANES]
+
+        self.assertEqual(planes.shape, (len(PLANES), 20, 20))
+        self.assertEqual(output[:6], [43, 43, 314, 1, 1, 76])
+        self.assertEqual(bool(planes[PLANE_INDEX["black_movable"], 2, 2]), True)
+        self.assertEqual(bool(planes[PLANE_INDEX["white_movable"], 2, 2]), False)
+
+    # Tests relating to encode_boards.
+    def test_1_encode_boards(self):
+        # Testing every plane of random positions against planes built one space at a time.
+        boards = [game.get_board() for game in random_games(12, 23, 40)]
+        planes = encode_boards(boards)
+        output = [np.array_equal(planes[index], self.slow_planes(board)) for index, board in enumerate(boards)]
+
+        self.assertEqual(output, [True] * len(boards))
+
+    # Tests relating to encode_batch and encode_bitboards.
+    def test_1_encode_batch(self):
+        # Testing that a BoardBatch and bare bitboards encode the same as the boards they came from.
+        boards = [game.get_board() for game in random_games(8, 5, 40)]
+        planes = encode_boards(boards, dtype=np.float32)
+        output = [np.array_equal(encode_batch(BoardBatch.from_boards(boards), dtype=np.float32), planes),
+                  np.array_equal(encode_bitboards([board.get_stones("BLACK") for board in boards],
+                                                  [board.get_stones("WHITE") for board in boards]), planes)]
+
+        self.assertEqual(output, [True, True])
+        self.assertEqual(planes.dtype, np.float32)
+
+if __name__ == "__main__":
+    unittest.main()
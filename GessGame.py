@@ -5,6 +5,297 @@
 #              Board is displayed with rows increasing from bottom to top, and columns lettered from left to right.
 
 
+import random
+import sys
+
+
+# Letters of the board's columns, from left to right.
+COLUMNS = "abcdefghijklmnopqrst"
+# Number of spaces in each row and column of the board.
+WIDTH = 20
+
+# Square index, (row - 1) * 20 + column, of each coordinate on the board, such as "l18".
+SQUARES = {}
+# Coordinate of each square index.
+COORDINATES = []
+for _number in range(1, WIDTH + 1):
+    for _letter in COLUMNS:
+        SQUARES[_letter + str(_number)] = len(COORDINATES)
+        COORDINATES.append(_letter + str(_number))
+
+# Vertical and horizontal step of each direction a piece can move in, with north towards row 20.
+DIRECTION_STEPS = {"N": (1, 0), "S": (-1, 0), "E": (0, 1), "W": (0, -1),
+                   "NE": (1, 1), "NW": (1, -1), "SE": (-1, 1), "SW": (-1, -1)}
+# Direction of each (vertical, horizontal) step.
+STEP_DIRECTIONS = {step: direction for direction, step in DIRECTION_STEPS.items()}
+# Change in square index of one step in each direction.
+DIRECTION_DELTAS = {direction: vertical * WIDTH + horizontal
+                    for direction, (vertical, horizontal) in DIRECTION_STEPS.items()}
+
+# Square indices of the neighbors of each square index that are on the board, in the order of Board.get_neighbors:
+# the row above from left to right, then left and right, then the row below.
+NEIGHBORS = []
+for _square in range(WIDTH * WIDTH):
+    _row, _column = divmod(_square, WIDTH)
+    NEIGHBORS.append([(_row + _vertical) * WIDTH + _column + _horizontal
+                      for _vertical in (1, 0, -1) for _horizontal in (-1, 0, 1)
+                      if (_vertical != 0 or _horizontal != 0)
+                      and 0 <= _row + _vertical < WIDTH and 0 <= _column + _horizontal < WIDTH])
+
+# Bitboard with every space on the board set.
+FULL_MASK = (1 << (WIDTH * WIDTH)) - 1
+# Bitboard of the spaces stones may occupy, everything but the outer edge.
+INTERIOR_MASK = 0
+# Bitboard of the spaces that may be the center of a ring, c3 through r18.
+RING_CENTER_MASK = 0
+for _row in range(WIDTH):
+    for _column in range(WIDTH):
+        if 1 <= _column <= 18 and 1 <= _row <= 18:
+            INTERIOR_MASK |= 1 << (_row * WIDTH + _column)
+        if 2 <= _column <= 17 and 2 <= _row <= 17:
+            RING_CENTER_MASK |= 1 << (_row * WIDTH + _column)
+
+# Offsets from a square index to its eight neighbors.
+NEIGHBOR_OFFSETS = (WIDTH - 1, WIDTH, WIDTH + 1, -1, 1, -WIDTH - 1, -WIDTH, -WIDTH + 1)
+# 9-bit pattern of a ring: all eight neighbors set, with an empty center.
+RING_PATTERN = 0o757
+# 9-bit pattern bit of the center of a piece.
+CENTER_BIT = 0o20
+
+# Bitboard of the 3x3 area centered on each square index, leaving out spaces past the board's edge.
+AREA_MASKS = [1 << _square for _square in range(WIDTH * WIDTH)]
+for _square in range(WIDTH * WIDTH):
+    for _neighbor in NEIGHBORS[_square]:
+        AREA_MASKS[_square] |= 1 << _neighbor
+# Bitboard of the ring centers whose ring can include a space of the 3x3 area centered on each square index.
+RING_WINDOWS = list(AREA_MASKS)
+for _square in range(WIDTH * WIDTH):
+    for _neighbor in NEIGHBORS[_square]:
+        RING_WINDOWS[_square] |= AREA_MASKS[_neighbor]
+    RING_WINDOWS[_square] &= RING_CENTER_MASK
+
+# Change in square index of a step in the direction of each 9-bit pattern bit, 0 for the center bit.
+PATTERN_DELTAS = [(_bit // 3 - 1) * WIDTH + _bit % 3 - 1 for _bit in range(9)]
+# Direction of each 9-bit pattern bit, "" for the center bit.
+PATTERN_DIRECTIONS = [STEP_DIRECTIONS.get((_bit // 3 - 1, _bit % 3 - 1), "") for _bit in range(9)]
+# Pattern bits in the order a Piece lists its spaces: the northern row first, each row from west to east.
+PIECE_BITS = (6, 7, 8, 3, 4, 5, 0, 1, 2)
+
+# Footprint tables, indexed by the 9-bit pattern of a piece's stones:
+#   FOOTPRINT_DIRECTIONS holds the directions the piece can move in, in the order a Piece lists them,
+#   FOOTPRINT_BITS holds the pattern bits of those directions from lowest to highest, FOOTPRINT_RANGES holds
+#   how far the piece can move, and FOOTPRINT_MOVABLE holds whether it has any stone around its center.
+FOOTPRINT_DIRECTIONS = []
+FOOTPRINT_BITS = []
+FOOTPRINT_RANGES = []
+FOOTPRINT_MOVABLE = []
+for _pattern in range(512):
+    FOOTPRINT_DIRECTIONS.append(tuple(PATTERN_DIRECTIONS[_bit] for _bit in PIECE_BITS
+                                      if _bit != 4 and _pattern >> _bit & 1))
+    FOOTPRINT_BITS.append(tuple(_bit for _bit in range(9) if _bit != 4 and _pattern >> _bit & 1))
+    # A stone in the center gives unlimited range (capped at board's limit of 20).
+    FOOTPRINT_RANGES.append(20 if _pattern & CENTER_BIT else 3)
+    FOOTPRINT_MOVABLE.append(_pattern & ~CENTER_BIT != 0)
+
+# For the direction of each pattern bit and each square index a piece can be centered on:
+#   RAYS holds the bitboard of the spaces the piece's center slides through until it reaches the board's edge,
+#   RAY_LENGTHS holds how many spaces that is, CORRIDORS holds the bitboard of every space its 3x3 area passes
+#   over on the way, and REACHES holds how many steps stay on the board at all.
+RAYS = [[0] * (WIDTH * WIDTH) for _bit in range(9)]
+RAY_LENGTHS = [[0] * (WIDTH * WIDTH) for _bit in range(9)]
+CORRIDORS = [[0] * (WIDTH * WIDTH) for _bit in range(9)]
+REACHES = [[0] * (WIDTH * WIDTH) for _bit in range(9)]
+for _bit in range(9):
+    if _bit == 4:
+        continue
+    for _square in range(WIDTH * WIDTH):
+        _row, _column = divmod(_square, WIDTH)
+        if not (1 <= _row <= 18 and 1 <= _column <= 18):
+            continue
+        # Counts the steps that stay on the board.
+        while 0 <= _row + (REACHES[_bit][_square] + 1) * (_bit // 3 - 1) < WIDTH and \
+                0 <= _column + (REACHES[_bit][_square] + 1) * (_bit % 3 - 1) < WIDTH:
+            REACHES[_bit][_square] += 1
+        # The first step is always taken, then the piece stops once its center is on the edge of the playable area.
+        for _step in range(1, REACHES[_bit][_square] + 1):
+            _next = _square + _step * PATTERN_DELTAS[_bit]
+            RAYS[_bit][_square] |= 1 << _next
+            RAY_LENGTHS[_bit][_square] = _step
+            CORRIDORS[_bit][_square] |= AREA_MASKS[_next]
+            if _next // WIDTH in (0, 1, 18, 19) or _next % WIDTH in (0, 1, 18, 19):
+                break
+
+# Random 64-bit Zobrist keys for a stone of each color on each square index, and for white being the side to move.
+# The generator is seeded so the same position hashes the same in every process.
+_zobrist_random = random.Random(20200531)
+ZOBRIST_KEYS = {color: [_zobrist_random.getrandbits(64) for _square in range(WIDTH * WIDTH)]
+                for color in ("BLACK", "WHITE")}
+ZOBRIST_WHITE_TO_MOVE = _zobrist_random.getrandbits(64)
+
+# Game states in the order they are numbered in a serialized position.
+GAME_STATES = ("UNFINISHED", "BLACK_WON", "WHITE_WON")
+# Bytes taken up by a player's bitboard in a serialized position, and by the whole position:
+# the black and white bitboards, followed by one byte holding the player to move and the game state.
+STONE_BYTES = WIDTH * WIDTH // 8
+POSITION_BYTES = 2 * STONE_BYTES + 1
+
+# Collector installed with set_metrics, or None while instrumentation is off.
+_metrics = None
+
+# Bitboards of each player's stones in the standard game setup, and the Zobrist hash of those stones.
+START_STONES = {"BLACK": 0, "WHITE": 0}
+START_HASH = 0
+for _number in range(1, 21):
+    for _letter in COLUMNS:
+        _square = SQUARES[_letter + str(_number)]
+        _color = None
+        if _number in [2, 4] and _letter in "ceghijklmnpr":
+            _color = "BLACK"
+        elif _number in [17, 19] and _letter in "ceghijklmnpr":
+            _color = "WHITE"
+        elif _number == 3 and _letter in "bcdfhijkmoqrs":
+            _color = "BLACK"
+        elif _number == 18 and _letter in "bcdfhijkmoqrs":
+            _color = "WHITE"
+        elif _number == 7 and _letter in "cfilor":
+            _color = "BLACK"
+        elif _number == 14 and _letter in "cfilor":
+            _color = "WHITE"
+        if _color is not None:
+            START_STONES[_color] |= 1 << _square
+            START_HASH ^= ZOBRIST_KEYS[_color][_square]
+
+
+def get_square(coordinate):
+    """Returns the square index, (row - 1) * 20 + column, of a coordinate on the board such as "l18"."""
+    return SQUARES[coordinate]
+
+
+def get_coordinate(square):
+    """Returns the coordinate, such as "l18", of a square index."""
+    return COORDINATES[square]
+
+
+def get_offset(start, end):
+    """
+    Returns the (vertical, horizontal) distance from the start coordinate to the end coordinate.
+    Coordinates past the board's edge, such as "c21", are worked out from their letter and number.
+    Raises ValueError if either coordinate isn't a letter followed by a number.
+    """
+    if start in SQUARES and end in SQUARES:
+        start_row, start_column = divmod(SQUARES[start], WIDTH)
+        end_row, end_column = divmod(SQUARES[end], WIDTH)
+        return end_row - start_row, end_column - start_column
+    try:
+        return int(end[1:]) - int(start[1:]), ord(end[0]) - ord(start[0])
+    except (ValueError, TypeError, IndexError):
+        raise ValueError("Not a coordinate: " + repr(start) + " or " + repr(end))
+
+
+def shift_coordinate(coordinate, direction):
+    """Returns the coordinate one step away from a coordinate in a direction, such as "NE"."""
+    vertical, horizontal = DIRECTION_STEPS[direction]
+    square = SQUARES.get(coordinate)
+    if square is not None:
+        row, column = divmod(square, WIDTH)
+        if 0 <= row + vertical < WIDTH and 0 <= column + horizontal < WIDTH:
+            return COORDINATES[square + vertical * WIDTH + horizontal]
+    return chr(ord(coordinate[0]) + horizontal) + str(int(coordinate[1:]) + vertical)
+
+
+def get_slide_length(start, bit, distance, occupied):
+    """
+    Returns how many spaces a piece centered on the start square index slides in the direction of a 9-bit
+        pattern bit before stopping, at most distance. The piece stops at the board's edge, or where its 3x3 area
+        first touches one of the occupied spaces, which must not include the piece's own stones.
+    """
+    length = RAY_LENGTHS[bit][start]
+    if distance < length:
+        length = distance
+    # Most pieces stop after their first step, which needs no more than a single check.
+    if length == 1 or occupied & AREA_MASKS[start + PATTERN_DELTAS[bit]]:
+        return 1
+
+    # Only stones in the corridor the piece sweeps over can stop it.
+    blockers = occupied & CORRIDORS[bit][start]
+    if blockers:
+        # The spaces on the ray whose 3x3 area holds a blocker are the blockers' own 3x3 areas,
+        # spread a row at a time and then a column at a time.
+        touched = blockers | blockers << 1 | blockers >> 1
+        touched = (touched | touched << WIDTH | touched >> WIDTH) & RAYS[bit][start]
+
+        # The nearest touched space is the lowest square index when sliding up the board, and the highest when down.
+        delta = PATTERN_DELTAS[bit]
+        if delta > 0:
+            steps = ((touched & -touched).bit_length() - 1 - start) // delta
+        else:
+            steps = (touched.bit_length() - 1 - start) // delta
+        if steps < length:
+            length = steps
+
+    return length
+
+
+def get_pattern_mask(pattern):
+    """Spreads a 9-bit pattern into a bitboard of the 3x3 area whose bottom left corner is square 0."""
+    return (pattern & 0o7) | (pattern >> 3 & 0o7) << WIDTH | (pattern >> 6) << (2 * WIDTH)
+
+
+def get_ring_centers(stones, occupied, area=RING_CENTER_MASK):
+    """
+    Returns a bitboard of every empty space in an area surrounded on all eight sides by a player's stones, given the
+        bitboards of the player's stones and of every stone on the board.
+    """
+    # A center survives only if the stone at each of its eight offsets is set, shifted onto the center.
+    rings = area & RING_CENTER_MASK & ~occupied
+    for offset in NEIGHBOR_OFFSETS:
+        if offset > 0:
+            rings &= stones >> offset
+        else:
+            rings &= stones << -offset
+    return rings
+
+
+def iterate_squares(mask):
+    """Yields the square index of every bit set in a bitboard, from a1 upwards."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def get_zobrist(color, stones):
+    """Returns the Zobrist hash of a player's stones on a bitboard, the XOR of each occupied square's key."""
+    keys = ZOBRIST_KEYS[color]
+    zobrist = 0
+    while stones:
+        lowest = stones & -stones
+        zobrist ^= keys[lowest.bit_length() - 1]
+        stones ^= lowest
+    return zobrist
+
+
+def opponent_of(color):
+    """Returns the color of the other player."""
+    if color == "BLACK":
+        return "WHITE"
+    return "BLACK"
+
+
+def set_metrics(metrics):
+    """
+    Installs a collector, such as GessMetrics.MoveMetrics, for the phases of make_move and the Stone and Piece
+        objects built in this process. Passing None turns instrumentation off again.
+    """
+    global _metrics
+    _metrics = metrics
+
+
+def get_metrics():
+    """Returns the installed collector, or None if instrumentation is off."""
+    return _metrics
+
+
 class Stone:
     """
     This class will house all methods and attributes associated with the stones.
@@ -12,10 +303,15 @@ class Stone:
     The Stone will be used by the Piece and Board classes, since the Stones themselves are the basis of
         how and to where a player may move.
     """
+    # A Stone is built for every stone on the board when its spaces are looked at, so each is kept small.
+    __slots__ = ("_color", "_coordinate")
+
     def __init__(self, color, coordinate):
         """Instantiates a Stone object with a color and coordinate."""
         self._color = color
         self._coordinate = coordinate
+        if _metrics is not None:
+            _metrics.count_allocation("Stone")
 
     def get_color(self):
         """Get method for Stone's color."""
@@ -36,9 +332,11 @@ class Piece:
         the methods that determine the validity of a piece and its movements.
     This class utilizes the Stone class, since a Piece is made of at least 1 stone. From this, the
         piece class is able to gather all information relating to its stones (color and coordinate).
-    The Piece class is used by the GessGame class extensively, since a new piece is created for each
-        move the player attempts to make.
+    The GessGame class moves pieces as 9-bit patterns read straight from the Board's bitboards, so the
+        Piece class is used to work with a piece's Stone objects outside of make_move.
     """
+    __slots__ = ("_center", "_piece")
+
     def __init__(self, center, spaces):
         """
         Instantiates a Piece object from the parameter piece, which is composed of Stone objects and empty strings,
@@ -46,6 +344,8 @@ class Piece:
         """
         self._center = center
         self._piece = spaces
+        if _metrics is not None:
+            _metrics.count_allocation("Piece")
 
     def get_center(self):
         """Get method for piece's center coordinate."""
@@ -58,9 +358,8 @@ class Piece:
     def is_piece_valid(self, current_player):
         """Checks if the Piece object only has empty spaces and stones of current player's color."""
         # Checks if the piece is void of any stones around its center.
-        if self._piece[0] == ["", "", ""] and self._piece[2] == ["", "", ""]:
-            if self._piece[1][0] == "" and self._piece[1][2] == "":
-                return False
+        if not FOOTPRINT_MOVABLE[self.get_pattern()]:
+            return False
 
         # Checks if the center of the piece is out of bounds on edges:
         if self._center[0] in "at" or int(self._center[1:]) in [1, 20]:
@@ -79,49 +378,29 @@ class Piece:
         # If the piece is valid, returns True.
         return True
 
+    def get_pattern(self):
+        """Returns the 9-bit pattern of the spaces of the piece that hold a stone."""
+        pattern = 0
+        # Cycles through all the spaces that make up a piece, in the order of PIECE_BITS.
+        for index, space in enumerate(self._piece[0] + self._piece[1] + self._piece[2]):
+            if space != "":
+                pattern |= 1 << PIECE_BITS[index]
+        return pattern
+
     def get_piece_directions(self):
         """Evaluates the cardinal directions that the piece is able to move."""
-        # Lists all possible directions.
-        possible_directions = ["NW", "N", "NE", "W", "", "E", "SW", "S", "SE"]
-        # Tracks the piece's possible movement directions.
-        piece_directions = []
-        # Counter to track index.
-        counter = 0
-
-        # Cycles through all the spaces that make up a piece.
-        for row in self._piece:
-            for space in row:
-                # If the space is not blank, adds the appropriate direction to the piece's possible direction
-                if space != "":
-                    piece_directions.append(possible_directions[counter])
-                    counter += 1
-                else:
-                    counter += 1
-
-        # Returns all piece directions.
-        return piece_directions
+        # Looks up the directions of the stones around the piece's center.
+        return list(FOOTPRINT_DIRECTIONS[self.get_pattern()])
 
     def get_piece_range(self):
         """Evaluates a piece's range"""
-        # If the center of the piece is blank, the range is set to 3.
-        if self._piece[1][1] == "":
-            return 3
-        # If the center of the piece has a stone, it has unlimited range (capped at board's limit of 20).
-        else:
-            return 20
+        # A piece with a stone in its center has unlimited range (capped at board's limit of 20), otherwise it is 3.
+        return FOOTPRINT_RANGES[self.get_pattern()]
 
     def get_direction_needed(self, end):
         """Gets the direction needed for a piece to move towards the end point."""
-        # Sets the piece's center letter and number
-        center_letter = self._center[0]
-        center_number = int(self._center[1:])
-        # Sets the end's letter and number
-        end_letter = end[0]
-        end_number = int(end[1:])
-
         # Finding the vertical and horizontal distances need to move from piece center to end.
-        vertical = end_number - center_number
-        horizontal = ord(end_letter) - ord(center_letter)
+        vertical, horizontal = get_offset(self._center, end)
 
         # Because of movement characteristics, absolute non-zero vertical and horizontal distance are always equal.
         if abs(vertical) != abs(horizontal) and vertical != 0 and horizontal != 0:
@@ -130,60 +409,16 @@ class Piece:
         elif vertical == 0 and horizontal == 0:
             return False
 
-        # North or South movement.
-        if horizontal == 0:
-            # Positive vertical movement means North.
-            if vertical > 0:
-                return "N"
-            # Non-positive vertical movement means South.
-            else:
-                return "S"
-        # East and West movement.
-        elif vertical == 0:
-            # Positive horizontal movement means East.
-            if horizontal > 0:
-                return "E"
-            # Non-positive horizontal movement means West.
-            else:
-                return "W"
-        # Northeast movement.
-        elif vertical > 0 and horizontal > 0:
-            return "NE"
-        # Northwest movement.
-        elif vertical > 0 and horizontal < 0:
-            return "NW"
-        # Southeast movement.
-        elif vertical < 0 and horizontal > 0:
-            return "SE"
-        # Southwest movement.
-        elif vertical < 0 and horizontal < 0:
-            return "SW"
-        else:
-            # Error message :-)
-            return "Something went wrong... You shouldn't be seeing this."
+        # Looks up the direction of a single step towards the end point.
+        return STEP_DIRECTIONS[(vertical > 0) - (vertical < 0), (horizontal > 0) - (horizontal < 0)]
 
     def get_range_needed(self, end):
         """Gets the range needed for a piece to move to the end point."""
-        # Sets the piece's center letter and number
-        center_letter = self._center[0]
-        center_number = int(self._center[1:])
-        # Sets the end's letter and number
-        end_letter = end[0]
-        end_number = int(end[1:])
-
         # Finding the vertical and horizontal distances need to move from piece center to end.
-        vertical = end_number - center_number
-        horizontal = ord(end_letter) - ord(center_letter)
-
-        # Only vertical movement is needed if there isn't horizontal movement.
-        if horizontal == 0:
-            return abs(vertical)
-        # Only horizontal movement is needed if there isn't vertical movement.
-        elif vertical == 0:
-            return abs(horizontal)
-        else:
-            # With a legal move, vertical and horizontal are equal, so it doesn't matter which is returned.
-            return abs(vertical)
+        vertical, horizontal = get_offset(self._center, end)
+
+        # With a legal move, vertical and horizontal are equal or one of them is 0, so the larger is the range.
+        return max(abs(vertical), abs(horizontal))
 
     def can_piece_move_to(self, end):
         """Determines if a piece is able to move in the direction and range of an end point."""
@@ -204,9 +439,6 @@ class Piece:
         """
         # Finding the direction the piece needs to move.
         direction = self.get_direction_needed(end)
-        # Dictionary of [horizontal, vertical] values for each cardinal direction key.
-        movements = {"N":[0, 1], "S":[0, -1], "E":[1, 0], "W":[-1, 0],
-                     "NE":[1, 1], "NW":[-1, 1], "SE":[1, -1], "SW":[-1, -1]}
 
         # Cycles through all the spaces that make up a piece.
         for row in self._piece:
@@ -215,143 +447,313 @@ class Piece:
                 if space == "":
                     pass
                 else:
-                    # Grabbing the letter and number of the old coordinate.
-                    old_coordinate_letter = space.get_coordinate()[0]
-                    old_coordinate_number = int(space.get_coordinate()[1:])
-                    # Updating the new coordinate to be moved 1 space in the desired direction.
-                    new_coordinate_letter = chr(ord(old_coordinate_letter) + movements[direction][0])
-                    new_coordinate_number = old_coordinate_number + movements[direction][1]
-
                     # Changes the coordinates of the stones in the piece to move in the desired direction.
-                    space.change_coordinate(new_coordinate_letter + str(new_coordinate_number))
+                    space.change_coordinate(shift_coordinate(space.get_coordinate(), direction))
 
         # Changes piece's center location attribute.
-        old_center_letter = self._center[0]
-        old_center_number = int(self._center[1:])
-        new_center_letter = chr(ord(old_center_letter) + movements[direction][0])
-        new_center_number = old_center_number + movements[direction][1]
-
-        self._center = new_center_letter + str(new_center_number)
+        self._center = shift_coordinate(self._center, direction)
 
 
 class Board:
     """
-    This class will create the board that the game is based off of. The board itself stores all Stone
-        objects and blank spaces. It also tracks each player's rings, and has methods to check if new
-        rings are formed, or old ones destroyed.
+    This class will create the board that the game is based off of. The board stores the stones of each
+        player as a bitboard: a single 400-bit integer per color, where bit (row - 1) * 20 + column is set
+        when that player has a stone on the square. It also tracks each player's rings, and has methods to
+        check if new rings are formed, or old ones destroyed.
+    Stone objects and blank spaces are still available through get_space and get_neighbors, but they are
+        built from the bitboards on demand, so moves never create or move Stone objects themselves.
     The GessGame class will exclusively interact with the board class.
     """
+    # Attributes are fixed with slots, keeping idle games small. See GessGame.get_memory_footprint.
+    __slots__ = ("_stones", "_view", "_hash", "_rings")
+
     def __init__(self):
-        """Instantiates a Board object, containing a dictionary that pertains to the board setup from the game rules."""
-        self._board = {}
-
-        # Cycles through all letters/numbers in the standard game setup. Places black/white stones where needed.
-        for number in range (1,21):
-            self._board[number] = []
-            for letter in "abcdefghijklmnopqrst":
-                coordinate = letter + str(number)
-                if number in [2, 4] and letter in "ceghijklmnpr":
-                    self._board[number].append(Stone("BLACK", coordinate))
-                elif number in [17, 19] and letter in "ceghijklmnpr":
-                    self._board[number].append(Stone("WHITE", coordinate))
-                elif number == 3 and letter in "bcdfhijkmoqrs":
-                    self._board[number].append(Stone("BLACK", coordinate))
-                elif number == 18 and letter in "bcdfhijkmoqrs":
-                    self._board[number].append(Stone("WHITE", coordinate))
-                elif number == 7 and letter in "cfilor":
-                    self._board[number].append(Stone("BLACK", coordinate))
-                elif number == 14 and letter in "cfilor":
-                    self._board[number].append(Stone("WHITE", coordinate))
+        """Instantiates a Board object, containing a bitboard per color that pertains to the board setup from the game rules."""
+        self._stones = {"BLACK": 0, "WHITE": 0}
+        # Stone objects built from the bitboards, rebuilt by the _board property when the stones change.
+        self._view = None
+        # Zobrist hash of the stones, updated with every change to the bitboards.
+        self._hash = 0
+
+        # Places black/white stones where needed for the standard game setup.
+        self._stones["BLACK"] = START_STONES["BLACK"]
+        self._stones["WHITE"] = START_STONES["WHITE"]
+        self._hash = START_HASH
+
+        # Tracks the centers of rings on the board as a bitboard per color, so only the centers around the spaces
+        # a move changes need to be checked again. Game starts with one ring for black/white each.
+        self._rings = {"BLACK": 1 << get_square("l3"), "WHITE": 1 << get_square("l18")}
+
+    @property
+    def _board(self):
+        """
+        Dictionary of board rows, each a list of Stone objects and empty strings, built from the bitboards.
+        The same objects are returned until the stones on the board change.
+        """
+        if self._view is None:
+            self._view = {}
+            for number in range(1, 21):
+                self._view[number] = []
+            for square, coordinate in enumerate(COORDINATES):
+                color = self.get_color(square)
+                if color is None:
+                    self._view[square // WIDTH + 1].append("")
                 else:
-                    self._board[number].append("")
+                    self._view[square // WIDTH + 1].append(Stone(color, coordinate))
+
+        return self._view
+
+    def get_stones(self, color):
+        """Returns the bitboard of a specified player's stones."""
+        return self._stones[color]
+
+    def set_stones(self, color, stones):
+        """Replaces the bitboard of a specified player's stones, updating the hash for the squares that changed."""
+        stones &= FULL_MASK
+        self._hash ^= get_zobrist(color, self._stones[color] ^ stones)
+        self._stones[color] = stones
+        self._view = None
+
+    def get_hash(self):
+        """Returns the 64-bit Zobrist hash of the stones on the board."""
+        return self._hash
 
-        # Tracks the center coordinate of rings on the board. Game starts with one ring for black/white each.
-        self._rings = {"BLACK":["l3"], "WHITE":["l18"]}
+    def get_position(self):
+        """
+        Returns the stone and ring bitboards of both players along with the hash,
+            as (black, white, black rings, white rings, hash).
+        """
+        return self._stones["BLACK"], self._stones["WHITE"], self._rings["BLACK"], self._rings["WHITE"], self._hash
+
+    def set_position(self, position):
+        """Restores the stone and ring bitboards of both players and the hash from a tuple returned by get_position."""
+        self._stones["BLACK"], self._stones["WHITE"], self._rings["BLACK"], self._rings["WHITE"], self._hash = position
+        self._view = None
+
+    def clone(self):
+        """Returns an independent copy of the board. The bitboards are immutable integers, so they are shared."""
+        board = Board()
+        board.set_position(self.get_position())
+        return board
+
+    def __deepcopy__(self, memo):
+        """Makes copy.deepcopy use clone, which copies everything the board holds."""
+        return self.clone()
+
+    def release_view(self):
+        """Drops the Stone objects built for get_space and get_neighbors. They are built again when next needed."""
+        self._view = None
+
+    def get_memory_footprint(self):
+        """
+        Returns roughly how many bytes the board takes up: the object, its bitboards, and the Stone objects built
+            for get_space and get_neighbors if there are any. Strings shared with the rest of the module aren't counted.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self._stones) + sys.getsizeof(self._rings) + \
+            sys.getsizeof(self._hash)
+        for bitboard in list(self._stones.values()) + list(self._rings.values()):
+            size += sys.getsizeof(bitboard)
+        if self._view is not None:
+            size += sys.getsizeof(self._view)
+            for row in self._view.values():
+                size += sys.getsizeof(row) + sum(sys.getsizeof(space) for space in row if space != "")
+        return size
+
+    def load_stones(self, black, white):
+        """
+        Replaces the bitboards of both players' stones, finding the hash and the rings from scratch.
+        Raises ValueError if a space holds stones of both players, or a stone is on the edge or past it.
+        """
+        if black & white:
+            raise ValueError("A space can't hold both a black and a white stone.")
+        # Moves rely on the edges being empty, as make_move always leaves them.
+        if (black | white) & ~INTERIOR_MASK:
+            raise ValueError("Stones can't be on the edge of the board.")
+        self._stones["BLACK"] = black
+        self._stones["WHITE"] = white
+        self._hash = get_zobrist("BLACK", self._stones["BLACK"]) ^ get_zobrist("WHITE", self._stones["WHITE"])
+        self.check_rings("BLACK")
+        self.check_rings("WHITE")
+        self._view = None
+
+    def to_bytes(self, current_player="BLACK", game_state="UNFINISHED"):
+        """
+        Returns the position as POSITION_BYTES bytes: the black and white bitboards, STONE_BYTES little-endian
+            bytes each, then a byte holding the game state's index in GAME_STATES times 2, plus 1 if white is to move.
+        """
+        flags = GAME_STATES.index(game_state) * 2 + (current_player == "WHITE")
+        return self._stones["BLACK"].to_bytes(STONE_BYTES, "little") + \
+            self._stones["WHITE"].to_bytes(STONE_BYTES, "little") + bytes((flags,))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns a (board, current player, game state) tuple from bytes returned by to_bytes."""
+        if len(data) != POSITION_BYTES or data[-1] >= 2 * len(GAME_STATES):
+            raise ValueError("Not a serialized position: " + repr(bytes(data[:8])) + "...")
+
+        board = cls()
+        board.load_stones(int.from_bytes(data[:STONE_BYTES], "little"),
+                          int.from_bytes(data[STONE_BYTES:2 * STONE_BYTES], "little"))
+        current_player = "WHITE" if data[-1] & 1 else "BLACK"
+        return board, current_player, GAME_STATES[data[-1] >> 1]
+
+    def to_fen(self, current_player="BLACK", game_state="UNFINISHED"):
+        """
+        Returns the position as a line of text: the rows from 20 down to 1 separated by "/", with "b" for a black
+            stone, "w" for a white stone and a number for each run of empty spaces, then "b" or "w" for the
+            player to move and the game state. The starting position's first row is "20".
+        """
+        rows = []
+        for number in range(20, 0, -1):
+            # Bits of the row's spaces from left to right.
+            black_row = self._stones["BLACK"] >> (number - 1) * WIDTH & (1 << WIDTH) - 1
+            white_row = self._stones["WHITE"] >> (number - 1) * WIDTH & (1 << WIDTH) - 1
+            # Most rows are empty.
+            if black_row | white_row == 0:
+                rows.append(str(WIDTH))
+                continue
+
+            row = ""
+            empty = 0
+            for column in range(WIDTH):
+                if black_row >> column & 1:
+                    stone = "b"
+                elif white_row >> column & 1:
+                    stone = "w"
+                else:
+                    empty += 1
+                    continue
+                if empty:
+                    row += str(empty)
+                    empty = 0
+                row += stone
+            if empty:
+                row += str(empty)
+            rows.append(row)
+
+        return "/".join(rows) + " " + current_player[0].lower() + " " + game_state
+
+    @classmethod
+    def from_fen(cls, text):
+        """Returns a (board, current player, game state) tuple from a line of text returned by to_fen."""
+        fields = text.split()
+        if len(fields) != 3 or fields[1] not in ("b", "w") or fields[2] not in GAME_STATES:
+            raise ValueError("Not a position: " + repr(text))
+        rows = fields[0].split("/")
+        if len(rows) != 20:
+            raise ValueError("A position needs 20 rows: " + repr(text))
+
+        stones = {"b": 0, "w": 0}
+        for index, row in enumerate(rows):
+            # The first row of the text is row 20 of the board.
+            square = (19 - index) * WIDTH
+            end = square + WIDTH
+            empty = ""
+            for character in row + "/":
+                if character.isdigit():
+                    empty += character
+                    continue
+                square += int(empty or 0)
+                empty = ""
+                if character == "/":
+                    break
+                elif character not in stones or square >= end:
+                    raise ValueError("Bad row " + repr(row) + " in position: " + repr(text))
+                stones[character] |= 1 << square
+                square += 1
+            if square != end:
+                raise ValueError("Row " + repr(row) + " doesn't have 20 spaces in position: " + repr(text))
+
+        board = cls()
+        board.load_stones(stones["b"], stones["w"])
+        return board, "WHITE" if fields[1] == "w" else "BLACK", fields[2]
+
+    def get_color(self, square):
+        """Returns the color of the stone on a square index, or None if the square is empty."""
+        if self._stones["BLACK"] >> square & 1:
+            return "BLACK"
+        elif self._stones["WHITE"] >> square & 1:
+            return "WHITE"
+        return None
+
+    def get_pattern(self, square, color):
+        """
+        Returns the 9-bit pattern of a player's stones in the 3x3 area centered on a square index.
+        Bit (vertical + 1) * 3 + (horizontal + 1) is set when the space at that offset from the center has a stone.
+        """
+        chunk = self._stones[color] >> (square - WIDTH - 1)
+        return (chunk & 0o7) | (chunk >> (WIDTH - 3) & 0o70) | (chunk >> (2 * WIDTH - 6) & 0o700)
 
     def get_space(self, coordinate):
         """Get method for a specific coordinate on the board."""
-        # Getting the index of the coordinate's letter. Ord has a 97 offset from 0 index for lower case letters.
-        letter_index = ord(coordinate[0]) - 97
-        # Getting the row number from the coordinate.
-        row_number = int(coordinate[1:])
+        # Looking up the row and column index of the coordinate.
+        row_index, letter_index = divmod(SQUARES[coordinate], WIDTH)
 
-        return self._board[row_number][letter_index]
+        return self._board[row_index + 1][letter_index]
 
     def get_rings(self, color):
         """Returns the ring center locations for a specified player."""
+        return [get_coordinate(square) for square in iterate_squares(self._rings[color])]
+
+    def get_ring_squares(self, color):
+        """Returns the bitboard of ring centers for a specified player."""
         return self._rings[color]
 
     def add_ring(self, coordinate, color):
         """Adds the ring center location for a specified player."""
-        if coordinate not in self._rings[color]:
-            self._rings[color].append(coordinate)
+        self._rings[color] |= 1 << get_square(coordinate)
 
     def remove_rings(self, color):
         """Removes ring for specified player."""
-        self._rings[color] = []
+        self._rings[color] = 0
 
     def get_neighbors(self, coordinate):
         """Returns all neighboring coordinates around a coordinate."""
-        neighbors = []
-
-        # Finds the Stone's coordinate letter and number
-        center_letter = coordinate[0]
-        center_number = int(coordinate[1:])
+        view = self._board
+        # Looks up the neighbors from the row above to the row below, each from left to right.
+        return [view[neighbor // WIDTH + 1][neighbor % WIDTH] for neighbor in NEIGHBORS[SQUARES[coordinate]]]
 
-        # Cycles from row to left to row to right of Stone.
-        for num in range(center_number + 1, center_number - 2, -1):
-            # Adds left/center/right letters plus row number, then appends to neighbor list.
-            neighbors.append(self.get_space(chr(ord(center_letter) - 1) + str(num)))
-            neighbors.append(self.get_space(chr(ord(center_letter)) + str(num)))
-            neighbors.append(self.get_space(chr(ord(center_letter) + 1) + str(num)))
+    def get_piece(self, coordinate):
+        """Returns the Piece centered on a coordinate, built from the Stone objects and blank spaces of its area."""
+        spaces = self.get_neighbors(coordinate)
+        spaces.insert(4, self.get_space(coordinate))
+        return Piece(coordinate, [spaces[0:3], spaces[3:6], spaces[6:]])
 
-        # Removes the coordinate itself from the neighbors list.
-        neighbors.pop(4)
-        return neighbors
+    def get_square_neighbors(self, square):
+        """Returns the square indices of all neighboring spaces around a square index."""
+        return NEIGHBORS[square]
 
     def is_a_ring(self, coordinate, color):
         """Determines if a given coordinate is a ring."""
-        # If the given coordinate is not blank, it cannot form a ring.
-        if self.get_space(coordinate) != "":
-            return False
+        return self.is_square_a_ring(SQUARES[coordinate], color)
 
-        # Getting the neighboring
-        neighbors = self.get_neighbors(coordinate)
-        for space in neighbors:
-            # If the space is blank, the spot is not a ring.
-            if space == "":
-                return False
-            elif space.get_color() != color:
-                return False
+    def is_square_a_ring(self, square, color):
+        """Determines if a given square index is a ring."""
+        # If the given square is not blank, it cannot form a ring.
+        if self.get_color(square) is not None:
+            return False
 
-        return True
+        # The ring must surround the center with stones of the player's color on all eight sides.
+        return self.get_pattern(square, color) == RING_PATTERN
 
     def clear_area(self, coordinate):
         """Clears the area around a coordinate."""
-        # Gets all neighboring spaces
-        area = self.get_neighbors(coordinate)
-        # Sets the coordinate to be blank.
-        self._board[int(coordinate[1:])][ord(coordinate[0]) - 97] = ""
-
-        # Cycles through the coordinate's neighbors, making all of their spaces blank.
-        for space in area:
-            if space == "":
-                pass
-            else:
-                space_coord = space.get_coordinate()
-                self._board[int(space_coord[1:])][ord(space_coord[0]) - 97] = ""
+        self.clear_square_area(get_square(coordinate))
+
+    def clear_square_area(self, square):
+        """Clears the 3x3 area centered on a square index."""
+        area = ~AREA_MASKS[square]
+        self.set_stones("BLACK", self._stones["BLACK"] & area)
+        self.set_stones("WHITE", self._stones["WHITE"] & area)
 
     def clear_edges(self):
         """Clears the board edges, where no Stone is allowed to be."""
-        # Clears top and bottom rows.
-        for letter in "abcdefghijklmnopqrst":
-            for number in [1, 20]:
-                self._board[number][ord(letter) - 97] = ""
+        self.set_stones("BLACK", self._stones["BLACK"] & INTERIOR_MASK)
+        self.set_stones("WHITE", self._stones["WHITE"] & INTERIOR_MASK)
 
-        # Clears left and right edges.
-        for letter in "at":
-            for number in range(1,21):
-                self._board[number][ord(letter) - 97] = ""
+    def place_pattern(self, square, pattern, color):
+        """Sets a player's stones from a 9-bit pattern in the 3x3 area centered on a square index."""
+        self.set_stones(color, self._stones[color] | get_pattern_mask(pattern) << (square - WIDTH - 1))
 
     def place_piece(self, piece):
         """Method that sets a piece in a specific location, clearing the area beforehand."""
@@ -366,84 +768,177 @@ class Board:
                 if space == "":
                     pass
                 else:
-                    # Altering the stone's coordinate to be searchable in Board's dictionary.
-                    coordinate = space.get_coordinate()
-                    coordinate_letter = ord(coordinate[0]) - 97
-                    coordinate_number = int(coordinate[1:])
-
-                    # Setting the stone at its location.
-                    self._board[coordinate_number][coordinate_letter] = space
+                    # Setting the stone's bit on its color's bitboard.
+                    color = space.get_color()
+                    self.set_stones(color, self._stones[color] | 1 << get_square(space.get_coordinate()))
 
     def does_interaction_occur(self, piece, end):
         """Checks if the currently moved piece intersects with another stone or the board's edge."""
         # After the piece is moved 1 space, checks the piece's center coordinate.
         piece_center = piece.get_center()
-        # Gets all neighboring spots on the board.
-        neighbors = self.get_neighbors(piece_center)
+        square = SQUARES[piece_center]
+        row, column = divmod(square, WIDTH)
 
         # Checking if the piece's center is at the edge of the playable area.
-        if piece_center[0] in "bs" or int(piece_center[1:]) in [2, 19]:
+        if column in (1, 18) or row in (1, 18):
             return True
         # If the piece has reached its desired end point.
         elif piece_center == end:
             return True
-        # Goes through all neighboring spots to see if they have a stone.
-        else:
-            for space in neighbors:
-                if space != "":
-                    return True
+        # Checks all neighboring spots to see if they have a stone.
+        occupied = self._stones["BLACK"] | self._stones["WHITE"]
+        return occupied & AREA_MASKS[square] & ~(1 << square) != 0
 
-        # Interaction doesn't occur
-        return False
+    def find_rings(self, color, area=RING_CENTER_MASK):
+        """Returns a bitboard of every empty space in an area surrounded on all eight sides by a player's stones."""
+        return get_ring_centers(self._stones[color], self._stones["BLACK"] | self._stones["WHITE"], area)
 
     def check_rings(self, color):
         """Checks the entire board for rings of a specific player's color."""
-        # Clears all existing rings
-        self.remove_rings(color)
-
-        # Cycling through the center locations where a ring can exist.
-        for number in range (3, 19):
-            for letter in "cdefghijklmnopqr":
-                # For readability, creates the string of the current coordinate.
-                current_coordinate = letter + str(number)
-                # Checks if the space is a ring, adding it to the player color's collection of rings.
-                if self.is_a_ring(current_coordinate, color):
-                    self.add_ring(current_coordinate, color)
+        self._rings[color] = self.find_rings(color)
+
+    def update_rings(self, area):
+        """Checks both players' rings again for the ring centers in an area, keeping the rings found elsewhere."""
+        for color in ("BLACK", "WHITE"):
+            self._rings[color] = self._rings[color] & ~area | self.find_rings(color, area)
 
     def display_board(self):
         """Print out the board. Used for testing/visualization."""
-        for number in range(20,0,-1):
+        for number in range(20, 0, -1):
             row = []
-            for space in self._board[number]:
-                if space == "":
+            for square in range((number - 1) * WIDTH, number * WIDTH):
+                color = self.get_color(square)
+                if color is None:
                     row.append(".")
-                elif space.get_color() == "BLACK":
+                elif color == "BLACK":
                     row.append("b")
-                elif space.get_color() == "WHITE":
+                elif color == "WHITE":
                     row.append("w")
             print(row)
 
 
+class MoveResult:
+    """
+    This class holds the outcome of a move made with GessGame.try_move. The reason is one of:
+        "MOVED" when the move was made, "GAME_WON" when the move was made and ended the game,
+        "GAME_OVER" when the game had already ended, "INVALID_PIECE" when the start isn't the center of one of
+        the current player's pieces, "BAD_DIRECTION" when the end isn't along a row, column or diagonal the piece
+        has a stone towards, and "OUT_OF_RANGE" when the end is further than the piece can move.
+    A move that was made also records where the piece landed, how many opposing stones it took, and how many of
+        each player's rings it destroyed.
+    """
+    __slots__ = ("_reason", "_start", "_end", "_landing", "_captured", "_rings_destroyed", "_game_state")
+
+    def __init__(self, reason, start, end, landing=None, captured=0, rings_destroyed=None, game_state=None):
+        """Instantiates a MoveResult object for a move from start to end, with a reason from the class docstring."""
+        self._reason = reason
+        self._start = start
+        self._end = end
+        self._landing = landing
+        self._captured = captured
+        self._rings_destroyed = rings_destroyed if rings_destroyed is not None else {"BLACK": 0, "WHITE": 0}
+        self._game_state = game_state
+
+    def __repr__(self):
+        """Returns the reason, move and landing space of the result."""
+        return "MoveResult(" + self._reason + ", " + str(self._start) + "-" + str(self._end) + ", landing=" + \
+            str(self._landing) + ")"
+
+    def is_legal(self):
+        """Returns True if the move was made."""
+        return self._reason in ("MOVED", "GAME_WON")
+
+    def get_reason(self):
+        """Get method for the reason the move was or wasn't made."""
+        return self._reason
+
+    def get_start(self):
+        """Get method for the move's start coordinate."""
+        return self._start
+
+    def get_end(self):
+        """Get method for the move's end coordinate, which may be past the board's edge."""
+        return self._end
+
+    def get_landing(self):
+        """Get method for the coordinate the piece landed on, or None if the move wasn't made."""
+        return self._landing
+
+    def get_captured(self):
+        """Get method for the number of opposing stones the move took off of the board."""
+        return self._captured
+
+    def get_rings_destroyed(self):
+        """Get method for a dictionary of the number of each player's rings the move destroyed."""
+        return self._rings_destroyed
+
+    def get_game_state(self):
+        """Get method for the game state after the move, or None if the move wasn't made."""
+        return self._game_state
+
+
 class GessGame:
     """
     This is the main class housing the implementation of the Gess game.
     The init method will initialize the board, game status, and current player, with get_game_status
         and resign_game methods doing as they sound.
     The make_move method houses the majority of the Gess game functionality. It makes extensive use of
-        the methods from the Stone, Piece and Board classes to deal with the intricacies of the rules
+        the bitboard methods of the Board class to deal with the intricacies of the rules
         surrounding the rules of Gess. The make_move method also makes calls to determine if a game is
         won (all rings of a certain color destroyed).
     """
+    __slots__ = ("_board", "_game_state", "_current_player", "_history")
+
     def __init__(self):
         """Instantiates a GessGame object with a new board, unifinished game state, and black up first."""
         self._board = Board()
         self._game_state = "UNFINISHED"
         self._current_player = "BLACK"
+        # Undo records of the moves made with push_move, most recent last.
+        self._history = []
+
+    def clone(self):
+        """
+        Returns an independent copy of the game, including the moves pop_move can take back.
+        The undo records only hold immutable values, so they are shared with the copy.
+        """
+        game = GessGame()
+        game._board = self._board.clone()
+        game._game_state = self._game_state
+        game._current_player = self._current_player
+        game._history = list(self._history)
+        return game
+
+    def __deepcopy__(self, memo):
+        """Makes copy.deepcopy use clone, which copies everything the game holds."""
+        return self.clone()
+
+    def get_memory_footprint(self):
+        """
+        Returns roughly how many bytes the game takes up, including its board and the undo records of push_move.
+        An idle game, with no undo records and no Stone objects built, takes up less than 1 KB.
+        """
+        size = sys.getsizeof(self) + self._board.get_memory_footprint() + sys.getsizeof(self._history)
+        for position, player, state in self._history:
+            size += sys.getsizeof(position) + sum(sys.getsizeof(value) for value in position)
+        return size
+
+    def compact(self):
+        """Drops what the game can rebuild on demand, the board's Stone objects, to make an idle game small."""
+        self._board.release_view()
 
     def get_game_state(self):
         """Get method for game state."""
         return self._game_state
 
+    def get_current_player(self):
+        """Get method for the player whose turn it is."""
+        return self._current_player
+
+    def get_board(self):
+        """Get method for the game's board."""
+        return self._board
+
     def resign_game(self):
         """Method that allows the current player to resign the game."""
         if self._current_player == "BLACK":
@@ -455,70 +950,400 @@ class GessGame:
         """Method to display board."""
         self._board.display_board()
 
+    def to_bytes(self):
+        """Returns the position, with the player to move and the game state, as bytes. See Board.to_bytes."""
+        return self._board.to_bytes(self._current_player, self._game_state)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Returns a GessGame with the position of bytes returned by to_bytes, and no moves to take back."""
+        game = cls()
+        game._board, game._current_player, game._game_state = Board.from_bytes(data)
+        return game
+
+    def to_fen(self):
+        """Returns the position, with the player to move and the game state, as a line of text. See Board.to_fen."""
+        return self._board.to_fen(self._current_player, self._game_state)
+
+    @classmethod
+    def from_fen(cls, text):
+        """Returns a GessGame with the position of a line of text returned by to_fen, and no moves to take back."""
+        game = cls()
+        game._board, game._current_player, game._game_state = Board.from_fen(text)
+        return game
+
     def make_move(self, start, end):
-        """Docstring here."""
-        # Checking if the game has been won. Returns False to indicate the game has been won.
-        if self._game_state != "UNFINISHED":
+        """
+        Moves the current player's piece centered at start towards end, stopping early if it runs into
+            another stone or the board's edge. Returns True if the move was made, None if it won the game, or False
+            if it was illegal, printing a message for an invalid piece. try_move tells the reasons apart instead.
+        """
+        start_square = SQUARES.get(start)
+        # A piece can't be centered off of the board.
+        if start_square is None:
+            if self._game_state == "UNFINISHED":
+                print("The space you chose for the piece is not valid. Please choose another spot.")
             return False
 
-        # Getting the start space and its neighbors, and combining them into a single list.
-        neighbors = self._board.get_neighbors(start)
-        center = self._board.get_space(start)
-        neighbors.insert(4, center)
-        # For readability, setting the rows of the piece to match how it will appear on the board.
-        piece_rows = [neighbors[0:3], neighbors[3:6], neighbors[6:]]
-        # Creating the Piece object.
-        piece = Piece(start, piece_rows)
-
-        # If the piece is not valid, returns False to indicate the move is invalid.
-        if piece.is_piece_valid(self._current_player) is False:
-            print("The space you chose for the piece is not valid. Please choose another spot.")
+        # An end that isn't a coordinate can't be along any direction the piece has.
+        try:
+            vertical, horizontal = get_offset(start, end)
+        except ValueError:
             return False
-        # If the end spot chosen is not valid, returns False to indicate the move is invalid.
-        elif piece.can_piece_move_to(end) is False:
-            return False
-
-        # Clears the piece's space on the board.
-        self._board.clear_area(start)
+        return self.make_offset_move(start_square, vertical, horizontal)
 
-        # Moves piece for its first step, in case the center is at board's the boundary.
-        piece.move_piece(end)
+    def make_square_move(self, start, end):
+        """Version of make_move that takes the square indices of the start and end spaces."""
+        start_row, start_column = divmod(start, WIDTH)
+        end_row, end_column = divmod(end, WIDTH)
+        return self.make_offset_move(start, end_row - start_row, end_column - start_column)
 
-        # Moves the piece until it hits another stone or hits the board's edge.
-        while self._board.does_interaction_occur(piece, end) is False:
-            piece.move_piece(end)
+    def make_offset_move(self, start_square, vertical, horizontal):
+        """
+        Moves the current player's piece centered on the start square index by a vertical and horizontal distance,
+            which may lead past the board's edge. Returns the same as make_move.
+        """
+        reason, landing = self._apply_offset_move(start_square, vertical, horizontal)
+        if reason == "MOVED":
+            return True
+        # A move that wins the game returns None.
+        elif reason == "GAME_WON":
+            return None
+        elif reason == "INVALID_PIECE":
+            print("The space you chose for the piece is not valid. Please choose another spot.")
+        return False
 
-        # Clears the area where the piece has moved to, effectively taking off the existing pieces.
-        self._board.clear_area(piece.get_center())
-        # Places the piece in its new location.
-        self._board.place_piece(piece)
+    def apply_moves(self, moves, validate=True):
+        """
+        Makes a sequence of (start, end) moves like make_move without printing, stopping at the first one that
+            isn't made. Returns a (made, reason) tuple of the number of moves made and the MoveResult reason the next
+            move wasn't made, or None if every move was made. A move that wins the game counts as made.
+        With validate False the moves are trusted to be legal, such as moves from a log this game wrote: the piece
+            and direction checks are skipped and rings are only looked for when one may have been destroyed.
+            An illegal move then leaves the game in an unknown state, although a move after the game ended still
+            stops the sequence with "GAME_OVER".
+        """
+        if not validate:
+            return self._apply_trusted_moves(moves)
+
+        made = 0
+        for start, end in moves:
+            start_square = SQUARES.get(start)
+            # A piece can't be centered off of the board.
+            if start_square is None:
+                return made, "GAME_OVER" if self._game_state != "UNFINISHED" else "INVALID_PIECE"
+            try:
+                vertical, horizontal = get_offset(start, end)
+            except ValueError:
+                return made, "GAME_OVER" if self._game_state != "UNFINISHED" else "BAD_DIRECTION"
+            reason, landing = self._apply_offset_move(start_square, vertical, horizontal)
+            if landing is None:
+                return made, reason
+            made += 1
+        return made, None
+
+    def try_move(self, start, end):
+        """
+        Version of make_move that never prints, returning a MoveResult with the reason the move was or wasn't made,
+            where the piece landed, and the stones and rings it took.
+        """
+        start_square = SQUARES.get(start)
+        # A piece can't be centered off of the board.
+        if start_square is None:
+            return MoveResult("GAME_OVER" if self._game_state != "UNFINISHED" else "INVALID_PIECE", start, end)
+
+        # An end that isn't a coordinate, such as "c3x", is refused like an end in no direction of the piece.
+        try:
+            vertical, horizontal = get_offset(start, end)
+        except ValueError:
+            return MoveResult("GAME_OVER" if self._game_state != "UNFINISHED" else "BAD_DIRECTION", start, end)
+        return self._get_move_result(start, end, start_square, vertical, horizontal)
+
+    def try_square_move(self, start, end):
+        """Version of try_move that takes the square indices of the start and end spaces."""
+        start_row, start_column = divmod(start, WIDTH)
+        end_row, end_column = divmod(end, WIDTH)
+        return self._get_move_result(COORDINATES[start], COORDINATES[end], start,
+                                     end_row - start_row, end_column - start_column)
+
+    def _get_move_result(self, start, end, start_square, vertical, horizontal):
+        """Makes a move with _apply_offset_move, returning its MoveResult."""
+        before = self._board.get_position()
+        opponent = opponent_of(self._current_player)
+        reason, landing = self._apply_offset_move(start_square, vertical, horizontal)
+        if landing is None:
+            return MoveResult(reason, start, end)
+
+        # Compares the bitboards from before the move, (black, white, black rings, white rings, hash), with the new ones.
+        after = self._board.get_position()
+        stones = 0 if opponent == "BLACK" else 1
+        captured = bin(before[stones] & ~after[stones]).count("1")
+        rings_destroyed = {"BLACK": bin(before[2] & ~after[2]).count("1"),
+                           "WHITE": bin(before[3] & ~after[3]).count("1")}
+        return MoveResult(reason, start, end, COORDINATES[landing], captured, rings_destroyed, self._game_state)
+
+    def _apply_offset_move(self, start_square, vertical, horizontal):
+        """
+        Makes a move like make_offset_move without printing anything. Returns a (reason, landing) tuple, where reason
+            is one of MoveResult's reasons and landing is the square index the piece landed on, or None if the move
+            wasn't made.
+        """
+        # Checking if the game has been won.
+        if self._game_state != "UNFINISHED":
+            return "GAME_OVER", None
+
+        board = self._board
+        player = self._current_player
+        start_row, start_column = divmod(start_square, WIDTH)
+        # Times each phase of the move when instrumentation is on.
+        metrics = _metrics
+        if metrics is not None:
+            metrics.start_move()
+
+        # Pieces can only be centered inside the edges of the board.
+        if not (1 <= start_column <= 18 and 1 <= start_row <= 18):
+            return "INVALID_PIECE", None
+
+        # Getting the 3x3 patterns of each player's stones around the start space.
+        pattern = board.get_pattern(start_square, player)
+        if metrics is not None:
+            metrics.mark("footprint")
+
+        # The piece is invalid if it has no stones around its center or holds opposing stones.
+        if not FOOTPRINT_MOVABLE[pattern] or board.get_pattern(start_square, opponent_of(player)) != 0:
+            return "INVALID_PIECE", None
+
+        distance = max(abs(vertical), abs(horizontal))
+
+        # Moves must be along a row, column or diagonal, and move at least one space.
+        if distance == 0 or (vertical != 0 and horizontal != 0 and abs(vertical) != abs(horizontal)):
+            return "BAD_DIRECTION", None
+        step_vertical = (vertical > 0) - (vertical < 0)
+        step_horizontal = (horizontal > 0) - (horizontal < 0)
+        bit = (step_vertical + 1) * 3 + step_horizontal + 1
+
+        # The piece needs a stone in the direction of movement, and a center stone to move further than 3 spaces.
+        if not pattern >> bit & 1:
+            return "BAD_DIRECTION", None
+        elif distance > FOOTPRINT_RANGES[pattern]:
+            return "OUT_OF_RANGE", None
+
+        if metrics is not None:
+            metrics.mark("validation")
+
+        # Lifts the piece off the board.
+        board.clear_square_area(start_square)
+        occupied = board.get_stones("BLACK") | board.get_stones("WHITE")
+        if metrics is not None:
+            metrics.mark("clear")
+
+        # Finds where the piece stops: at the first stone it hits, the board's edge or its end point.
+        length = get_slide_length(start_square, bit, distance, occupied)
+        square = start_square + PATTERN_DELTAS[bit] * length
+        if metrics is not None:
+            metrics.mark("slide")
+            metrics.count_slide(length)
+
+        # Takes any stones off of the area the piece lands on, then places the piece there.
+        board.clear_square_area(square)
+        if metrics is not None:
+            metrics.mark("clear")
+        board.place_pattern(square, pattern, player)
+        if metrics is not None:
+            metrics.mark("placement")
         # Clears all edges where any stones may have been moved to.
-        self._board.clear_edges()
+        board.clear_edges()
+        if metrics is not None:
+            metrics.mark("clear_edges")
 
         # UNCOMMENT BELOW IF YOU WANT THE BOARD TO BE DISPLAYED AFTER EACH MOVE IS MADE.
         # self.display_board()
 
-        # Checking the for rings of the black player.
-        self._board.check_rings("BLACK")
-        black_rings = self._board.get_rings("BLACK")
-
-        # Checking the for rings of the black player.
-        self._board.check_rings("WHITE")
-        white_rings = self._board.get_rings("WHITE")
+        # Only rings overlapping the start or landing areas can have been formed or destroyed by the move.
+        board.update_rings(RING_WINDOWS[start_square] | RING_WINDOWS[square])
+        if metrics is not None:
+            metrics.mark("rings")
 
         # If the black player has no rings, white wins.
-        if len(black_rings) == 0:
+        if board.get_ring_squares("BLACK") == 0:
             self._game_state = "WHITE_WON"
+            return "GAME_WON", square
         # If the white player has no rings, black wins.
-        elif len(white_rings) == 0:
+        elif board.get_ring_squares("WHITE") == 0:
             self._game_state = "BLACK_WON"
+            return "GAME_WON", square
 
         # If both players have rings, then this will switch the current player.
-        # Returns true to indicate the game is still continuing.
+        if self._current_player == "BLACK":
+            self._current_player = "WHITE"
         else:
-            if self._current_player == "BLACK":
-                self._current_player = "WHITE"
-                return True
+            self._current_player = "BLACK"
+        return "MOVED", square
+
+    def _apply_trusted_moves(self, moves):
+        """
+        Makes a sequence of moves trusted to be legal for apply_moves, returning the same (made, reason) tuple.
+        The moves are made on local copies of the bitboards, which are written back to the board once at the end.
+        """
+        black, white, black_rings, white_rings, position_hash = self._board.get_position()
+        start_black, start_white = black, white
+        player = self._current_player
+        game_state = self._game_state
+        # Ring centers whose 3x3 areas have changed since the rings were last looked for.
+        pending = 0
+        made = 0
+        reason = None
+
+        for start, end in moves:
+            if game_state != "UNFINISHED":
+                reason = "GAME_OVER"
+                break
+            start_square = SQUARES[start]
+            vertical, horizontal = get_offset(start, end)
+            step_vertical = (vertical > 0) - (vertical < 0)
+            step_horizontal = (horizontal > 0) - (horizontal < 0)
+            bit = (step_vertical + 1) * 3 + step_horizontal + 1
+            own, other = (black, white) if player == "BLACK" else (white, black)
+
+            # Lifts the piece, which holds none of the opponent's stones, and slides it until it stops.
+            chunk = own >> (start_square - WIDTH - 1)
+            pattern = (chunk & 0o7) | (chunk >> (WIDTH - 3) & 0o70) | (chunk >> (2 * WIDTH - 6) & 0o700)
+            own &= ~AREA_MASKS[start_square]
+            length = get_slide_length(start_square, bit, max(abs(vertical), abs(horizontal)), own | other)
+            square = start_square + PATTERN_DELTAS[bit] * length
+
+            # Places the piece over whatever it landed on, dropping any of its stones that went onto the edge.
+            own = (own & ~AREA_MASKS[square] | get_pattern_mask(pattern) << (square - WIDTH - 1)) & INTERIOR_MASK
+            other &= ~AREA_MASKS[square]
+            black, white = (own, other) if player == "BLACK" else (other, own)
+            pending |= RING_WINDOWS[start_square] | RING_WINDOWS[square]
+            made += 1
+
+            # Rings outside the changed areas are untouched, so while none of the known rings are in them, both
+            # players still have a ring and the search for new ones can wait.
+            if pending & (black_rings | white_rings) or black_rings == 0 or white_rings == 0:
+                occupied = black | white
+                black_rings = black_rings & ~pending | get_ring_centers(black, occupied, pending)
+                white_rings = white_rings & ~pending | get_ring_centers(white, occupied, pending)
+                pending = 0
+                # Black having no rings is checked first, as in _apply_offset_move.
+                if black_rings == 0:
+                    game_state = "WHITE_WON"
+                    continue
+                elif white_rings == 0:
+                    game_state = "BLACK_WON"
+                    continue
+            player = "WHITE" if player == "BLACK" else "BLACK"
+
+        # Brings the ring index up to date, and updates the hash for only the squares that changed.
+        if pending:
+            occupied = black | white
+            black_rings = black_rings & ~pending | get_ring_centers(black, occupied, pending)
+            white_rings = white_rings & ~pending | get_ring_centers(white, occupied, pending)
+        position_hash ^= get_zobrist("BLACK", start_black ^ black) ^ get_zobrist("WHITE", start_white ^ white)
+        self._board.set_position((black, white, black_rings, white_rings, position_hash))
+        self._current_player = player
+        self._game_state = game_state
+        return made, reason
+
+    def position_hash(self):
+        """Returns the 64-bit Zobrist hash of the position, covering every stone and the player to move."""
+        if self._current_player == "WHITE":
+            return self._board.get_hash() ^ ZOBRIST_WHITE_TO_MOVE
+        return self._board.get_hash()
+
+    def push_move(self, start, end):
+        """
+        Makes a move like make_move, recording what it changed so pop_move can take it back.
+        Returns the result of make_move. Nothing is recorded if the move was illegal.
+        """
+        # The bitboards are immutable integers, so the record holds the previous ones without copying them.
+        record = (self._board.get_position(), self._current_player, self._game_state)
+        result = self.make_move(start, end)
+        if result is not False:
+            self._history.append(record)
+        return result
+
+    def push_square_move(self, start, end):
+        """
+        Version of push_move that takes the square indices of the start and end spaces.
+        It never prints, since searches try moves that may turn out to be illegal.
+        """
+        record = (self._board.get_position(), self._current_player, self._game_state)
+        start_row, start_column = divmod(start, WIDTH)
+        end_row, end_column = divmod(end, WIDTH)
+        reason, landing = self._apply_offset_move(start, end_row - start_row, end_column - start_column)
+        if landing is None:
+            return False
+        self._history.append(record)
+        # A move that wins the game returns None, like make_move.
+        if reason == "GAME_WON":
+            return None
+        return True
+
+    def pop_move(self):
+        """Takes back the last move made with push_move. Returns False if there is no move to take back."""
+        if len(self._history) == 0:
+            return False
+
+        position, self._current_player, self._game_state = self._history.pop()
+        self._board.set_position(position)
+        return True
+
+    def iter_legal_moves(self, distinct=False):
+        """
+        Generator that yields every legal (start, end) move for the current player, with end on the board.
+        If distinct is True, skips the ends past the space where the piece would stop, which lead to the same position.
+        """
+        for start, end in self.iter_legal_square_moves(distinct):
+            yield COORDINATES[start], COORDINATES[end]
+
+    def iter_legal_square_moves(self, distinct=False):
+        """Version of iter_legal_moves that yields the square indices of the start and end spaces."""
+        if self._game_state != "UNFINISHED":
+            return
+
+        board = self._board
+        own = board.get_stones(self._current_player)
+        opponent = board.get_stones(opponent_of(self._current_player))
+        occupied = own | opponent
+
+        # Pieces are centered inside the edges, next to a player's stone and away from every opposing stone.
+        near_own = own
+        near_opponent = opponent
+        for offset in NEIGHBOR_OFFSETS:
+            if offset > 0:
+                near_own |= own >> offset
+                near_opponent |= opponent >> offset
             else:
-                self._current_player = "BLACK"
-                return True
+                near_own |= own << -offset
+                near_opponent |= opponent << -offset
+
+        for start in iterate_squares(near_own & ~near_opponent & INTERIOR_MASK):
+            pattern = board.get_pattern(start, self._current_player)
+            # Skips pieces that only have a stone in their center.
+            if not FOOTPRINT_MOVABLE[pattern]:
+                continue
+
+            piece_range = FOOTPRINT_RANGES[pattern]
+            # Spaces the piece would run into once it is lifted off of the board.
+            others = occupied & ~AREA_MASKS[start]
+
+            # Cycles through the directions the piece has a stone in, then through every distance in its range.
+            for bit in FOOTPRINT_BITS[pattern]:
+                # Every end past the space the piece stops at leaves the piece at that same space.
+                if distinct:
+                    length = get_slide_length(start, bit, piece_range, others)
+                else:
+                    length = min(piece_range, REACHES[bit][start])
+                delta = PATTERN_DELTAS[bit]
+                for moved in range(1, length + 1):
+                    yield start, start + moved * delta
+
+    def legal_moves(self):
+        """Returns a list of every legal (start, end) move for the current player, with end on the board."""
+        return list(self.iter_legal_moves())
+
+    def legal_square_moves(self):
+        """Version of legal_moves that lists the square indices of the start and end spaces."""
+        return list(self.iter_legal_square_moves())
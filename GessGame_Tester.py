@@ -1,3 +1,7 @@
+import contextlib
+import copy
+import io
+import random
 import unittest
 from GessGame import *
 
@@ -10,6 +14,49 @@ class TestGessGame(unittest.TestCase):
     to help track potential future implementations of tests.
     """
 
+    """
+    TESTS RELATING TO COORDINATE TABLES:
+    """
+    # Tests relating to SQUARES and COORDINATES.
+    def test_1_squares(self):
+        # Testing that coordinates and square indices map to each other.
+        output = [SQUARES["a1"], SQUARES["t1"], SQUARES["a2"], SQUARES["l18"], COORDINATES[SQUARES["l18"]]]
+
+        self.assertEqual(output, [0, 19, 20, 351, "l18"])
+        self.assertEqual(len(SQUARES), 400)
+
+    # Tests relating to NEIGHBORS.
+    def test_1_neighbors(self):
+        # Testing the neighbors of a space inside the board and of a corner.
+        output = [[COORDINATES[square] for square in NEIGHBORS[SQUARES["d5"]]],
+                  [COORDINATES[square] for square in NEIGHBORS[SQUARES["a1"]]]]
+
+        self.assertEqual(output, [["c6", "d6", "e6", "c5", "e5", "c4", "d4", "e4"], ["a2", "b2", "b1"]])
+
+    # Tests relating to get_offset.
+    def test_1_get_offset(self):
+        # Testing offsets between coordinates on the board and to a coordinate past the edge.
+        output = [get_offset("c3", "f6"), get_offset("c3", "c1"), get_offset("c3", "c22")]
+
+        self.assertEqual(output, [(3, 3), (-2, 0), (19, 0)])
+
+    # Tests relating to shift_coordinate.
+    def test_1_shift_coordinate(self):
+        # Testing a step inside the board and a step past its edge.
+        output = [shift_coordinate("c3", "NE"), shift_coordinate("c1", "S"), shift_coordinate("t5", "E")]
+
+        self.assertEqual(output, ["d4", "c0", "u5"])
+
+    # Tests relating to get_slide_length.
+    def test_1_get_slide_length(self):
+        # Testing a slide north stopped by another piece, one stopped by the edge, and one stopped by distance.
+        board = GessGame().get_board()
+        occupied = (board.get_stones("BLACK") | board.get_stones("WHITE")) & ~AREA_MASKS[SQUARES["c3"]]
+        output = [get_slide_length(SQUARES["c3"], 7, 20, occupied), get_slide_length(SQUARES["k10"], 7, 20, 0),
+                  get_slide_length(SQUARES["k10"], 1, 3, 0)]
+
+        self.assertEqual(output, [3, 9, 3])
+
     """
     TESTS RELATING TO STONE CLASS:
     """
@@ -129,6 +176,38 @@ class TestGessGame(unittest.TestCase):
 
         self.assertEqual(output, 20)
 
+    # Tests relating to get_pattern.
+    def test_1_piece_get_pattern(self):
+        # Testing that the northern row of the piece holds the highest pattern bits.
+        stone_1 = Stone("BLACK", "b3")
+        stone_2 = Stone("BLACK", "c2")
+        stone_3 = Stone("BLACK", "a1")
+        piece = Piece("b2", [["", stone_1, ""], ["", stone_2, ""], [stone_3, "", ""]])
+        output = piece.get_pattern()
+
+        self.assertEqual(output, 0o221)
+
+    # Tests relating to the footprint tables.
+    def test_1_footprint_tables(self):
+        # Testing the directions, range and movability of a ring, a lone center stone and a piece with a center.
+        output = [(FOOTPRINT_DIRECTIONS[pattern], FOOTPRINT_BITS[pattern], FOOTPRINT_RANGES[pattern],
+                   FOOTPRINT_MOVABLE[pattern]) for pattern in (RING_PATTERN, CENTER_BIT, 0o221)]
+
+        self.assertEqual(output, [(("NW", "N", "NE", "W", "E", "SW", "S", "SE"), (0, 1, 2, 3, 5, 6, 7, 8), 3, True),
+                                  ((), (), 20, False), (("N", "SW"), (0, 7), 20, True)])
+
+    def test_2_footprint_tables(self):
+        # Testing that every pattern's table entries match the Piece methods.
+        output = []
+        for pattern in range(512):
+            spaces = [Stone("BLACK", "b2") if pattern >> bit & 1 else "" for bit in PIECE_BITS]
+            piece = Piece("k10", [spaces[0:3], spaces[3:6], spaces[6:]])
+            if piece.get_pattern() != pattern or piece.get_piece_range() != FOOTPRINT_RANGES[pattern] or \
+                    piece.is_piece_valid("BLACK") != FOOTPRINT_MOVABLE[pattern]:
+                output.append(pattern)
+
+        self.assertEqual(output, [])
+
     # Tests relating to get_direction_needed.
     def test_1_get_direction_needed(self):
         # Testing when the end point is an illegal direction (not directly in cardinal path).
@@ -752,6 +831,15 @@ class TestGessGame(unittest.TestCase):
 
         self.assertEqual(output, expected)
 
+    # Tests relating to get_piece.
+    def test_1_get_piece(self):
+        # Testing that the piece built from the board has the stones around its center, and its center.
+        board = Board()
+        piece = board.get_piece("c3")
+        output = [piece.get_center(), piece.get_piece()[1][1] is board.get_space("c3"), piece.get_piece_directions()]
+
+        self.assertEqual(output, ["c3", True, ["N", "W", "E", "S"]])
+
     # Tests relating to is_a_ring.
     def test_1_is_a_ring(self):
         # Tests if the piece is not a ring if the center has a stone.
@@ -950,6 +1038,70 @@ class TestGessGame(unittest.TestCase):
 
         self.assertCountEqual(output, ["l3", "g3"])
 
+    # Tests relating to get_stones.
+    def test_1_get_stones(self):
+        # Testing that the starting bitboards hold 43 stones each, with a stone on c7 for black only.
+        board = Board()
+        black = board.get_stones("BLACK")
+        white = board.get_stones("WHITE")
+        output = [bin(black).count("1"), bin(white).count("1"), black >> get_square("c7") & 1,
+                  white >> get_square("c7") & 1]
+
+        self.assertEqual(output, [43, 43, 1, 0])
+
+    # Tests relating to get_pattern.
+    def test_1_get_pattern(self):
+        # Testing the pattern of the black ring at l3, which has every space but its center.
+        board = Board()
+        output = board.get_pattern(get_square("l3"), "BLACK")
+
+        self.assertEqual(output, RING_PATTERN)
+
+    def test_2_get_pattern(self):
+        # Testing the pattern of the piece at c6, which only has a stone to its north.
+        board = Board()
+        output = board.get_pattern(get_square("c6"), "BLACK")
+
+        self.assertEqual(output, 0o200)
+
+    # Tests relating to place_pattern.
+    def test_1_place_pattern(self):
+        # Testing that placing a pattern puts stones on the matching spaces.
+        board = Board()
+        board.place_pattern(get_square("j10"), 0o421, "WHITE")
+        output = [board.get_space("i9").get_color(), board.get_space("j10").get_color(),
+                  board.get_space("k11").get_color(), board.get_space("k9")]
+
+        self.assertEqual(output, ["WHITE", "WHITE", "WHITE", ""])
+
+    # Tests relating to find_rings.
+    def test_1_find_rings(self):
+        # Testing that the starting board has a single ring for white at l18.
+        board = Board()
+        output = list(iterate_squares(board.find_rings("WHITE")))
+
+        self.assertEqual(output, [get_square("l18")])
+
+    # Tests relating to update_rings.
+    def test_1_update_rings(self):
+        # Testing that a ring broken inside the area is removed, while a stale ring outside of it is kept.
+        board = Board()
+        board.add_ring("e10", "BLACK")
+        board.clear_area("l2")
+        board.update_rings(RING_WINDOWS[get_square("l2")])
+        output = board.get_rings("BLACK")
+
+        self.assertEqual(output, ["e10"])
+
+    def test_2_update_rings(self):
+        # Testing that a ring formed inside the area is found.
+        board = Board()
+        board.place_pattern(get_square("j10"), RING_PATTERN, "WHITE")
+        board.update_rings(RING_WINDOWS[get_square("j10")])
+        output = board.get_ring_squares("WHITE")
+
+        self.assertEqual(output, 1 << get_square("l18") | 1 << get_square("j10"))
+
     """
     TESTS RELATING TO GESSGAME CLASS
     """
@@ -1017,6 +1169,376 @@ class TestGessGame(unittest.TestCase):
         # game.make_move("c3", "c7")
         #game.make_move("c3", "c1")
 
+    def test_5_make_move(self):
+        # Testing that a piece stops when it runs into another stone, capturing the stones under it.
+        game = GessGame()
+        result = game.make_move("c3", "c12")
+        board = game._board
+        output = [result, board.get_space("c3"), board.get_space("b6").get_color(), board.get_space("c7").get_color(),
+                  board.get_space("c8"), game._current_player]
+
+        self.assertEqual(output, [True, "", "BLACK", "BLACK", "", "WHITE"])
+
+
+    # Tests relating to legal_moves.
+    def test_1_legal_moves(self):
+        # Testing the number of legal moves black has from the starting board.
+        game = GessGame()
+        output = len(game.legal_moves())
+
+        self.assertEqual(output, 1643)
+
+    def test_2_legal_moves(self):
+        # Testing that every listed move is accepted by make_move.
+        game = GessGame()
+        output = []
+        for start, end in game.legal_moves():
+            trial = copy.deepcopy(game)
+            if trial.make_move(start, end) is False:
+                output.append((start, end))
+
+        self.assertEqual(output, [])
+
+    def test_3_legal_moves(self):
+        # Testing that moves with an invalid piece, direction or range are not listed.
+        game = GessGame()
+        output = game.legal_moves()
+
+        self.assertNotIn(("c9", "c10"), output)
+        self.assertNotIn(("c6", "c5"), output)
+        self.assertNotIn(("c6", "c10"), output)
+        self.assertIn(("c6", "c9"), output)
+
+    def test_4_legal_moves(self):
+        # Testing that there are no legal moves once the game is over.
+        game = GessGame()
+        game.resign_game()
+        output = game.legal_moves()
+
+        self.assertEqual(output, [])
+
+    # Tests relating to iter_legal_moves.
+    def test_1_iter_legal_moves(self):
+        # Testing that distinct moves stop at the first end where the piece runs into a stone.
+        game = GessGame()
+        output = [end for start, end in game.iter_legal_moves(distinct=True) if start == "c3" and end[0] == "c"]
+
+        self.assertEqual(output, ["c2", "c4", "c5", "c6"])
+
+    # Tests relating to push_move and pop_move.
+    def test_1_push_move(self):
+        # Testing that a pushed move is made like make_move.
+        game = GessGame()
+        output = game.push_move("c3", "c12")
+        expected = GessGame()
+        expected.make_move("c3", "c12")
+
+        self.assertEqual(output, True)
+        self.assertEqual(game._board.get_position(), expected._board.get_position())
+
+    def test_2_push_move(self):
+        # Testing that an illegal move is not recorded.
+        game = GessGame()
+        output = [game.push_move("c6", "c5"), game.pop_move()]
+
+        self.assertEqual(output, [False, False])
+
+    def test_1_pop_move(self):
+        # Testing that popping every pushed move restores the starting game, including a won game.
+        game = GessGame()
+        start = game._board.get_position()
+        game.push_move("c3", "c12")
+        game.push_move("r18", "r15")
+        game.push_move("i2", "j3")
+        won_state = game.get_game_state()
+        output = [game.pop_move(), game.pop_move(), game.pop_move(), game.pop_move()]
+
+        self.assertEqual(won_state, "WHITE_WON")
+        self.assertEqual(output, [True, True, True, False])
+        self.assertEqual(game._board.get_position(), start)
+        self.assertEqual([game.get_game_state(), game._current_player], ["UNFINISHED", "BLACK"])
+        self.assertEqual(game._board.get_space("c3").get_color(), "BLACK")
+
+    # Tests relating to position_hash.
+    def test_1_position_hash(self):
+        # Testing that the incrementally updated hash matches one computed from scratch after a capture.
+        game = GessGame()
+        game.make_move("c3", "c12")
+        board = game._board
+        expected = get_zobrist("BLACK", board.get_stones("BLACK")) ^ get_zobrist("WHITE", board.get_stones("WHITE"))
+        output = game.position_hash()
+
+        self.assertEqual(output, expected ^ ZOBRIST_WHITE_TO_MOVE)
+
+    def test_2_position_hash(self):
+        # Testing that the same position reached by different move orders has the same hash.
+        game_1 = GessGame()
+        game_1.make_move("c3", "c5")
+        game_1.make_move("r18", "r16")
+        game_1.make_move("r3", "r5")
+        game_2 = GessGame()
+        game_2.make_move("r3", "r5")
+        game_2.make_move("r18", "r16")
+        game_2.make_move("c3", "c5")
+
+        self.assertEqual(game_1.position_hash(), game_2.position_hash())
+        self.assertNotEqual(game_1.position_hash(), GessGame().position_hash())
+
+    def test_3_position_hash(self):
+        # Testing that the hash covers the player to move, and is restored by pop_move.
+        game = GessGame()
+        start = game.position_hash()
+        game.push_move("c3", "c5")
+        moved = game.position_hash()
+        game.pop_move()
+        output = game.position_hash()
+        game._current_player = "WHITE"
+
+        self.assertNotEqual(moved, start)
+        self.assertEqual(output, start)
+        self.assertEqual(game.position_hash(), start ^ ZOBRIST_WHITE_TO_MOVE)
+
+    # Tests relating to make_square_move.
+    def test_1_make_square_move(self):
+        # Testing that a move by square index matches the same move by coordinates.
+        game_1 = GessGame()
+        game_2 = GessGame()
+        output = [game_1.make_square_move(SQUARES["c3"], SQUARES["c12"]), game_2.make_move("c3", "c12")]
+
+        self.assertEqual(output, [True, True])
+        self.assertEqual(game_1.position_hash(), game_2.position_hash())
+
+    def test_6_make_move(self):
+        # Testing that a move to an end past the board's edge is made, stopping at the edge.
+        game = GessGame()
+        output = game.make_move("c3", "c22")
+
+        self.assertEqual(output, True)
+        self.assertEqual(game._board.get_space("c6").get_color(), "BLACK")
+
+    # Tests relating to legal_square_moves.
+    def test_1_legal_square_moves(self):
+        # Testing that the moves by square index are the moves by coordinate.
+        game = GessGame()
+        output = [(COORDINATES[start], COORDINATES[end]) for start, end in game.legal_square_moves()]
+
+        self.assertEqual(output, game.legal_moves())
+
+    # Tests relating to to_bytes and from_bytes.
+    def test_1_to_bytes(self):
+        # Testing that a position after a move is restored with its rings, hash and player to move.
+        game = GessGame()
+        game.make_move("c3", "c6")
+        data = game.to_bytes()
+        output = GessGame.from_bytes(data)
+
+        self.assertEqual(len(data), POSITION_BYTES)
+        self.assertEqual(output.get_board().get_position(), game.get_board().get_position())
+        self.assertEqual(output.position_hash(), game.position_hash())
+        self.assertEqual(output.get_current_player(), "WHITE")
+
+    def test_2_to_bytes(self):
+        # Testing that a finished game keeps its state, and that data of the wrong length is rejected.
+        game = GessGame()
+        game.resign_game()
+        output = GessGame.from_bytes(game.to_bytes()).get_game_state()
+
+        self.assertEqual(output, "WHITE_WON")
+        self.assertRaises(ValueError, GessGame.from_bytes, game.to_bytes()[:-1])
+
+    # Tests relating to to_fen and from_fen.
+    def test_1_to_fen(self):
+        # Testing the rows of the starting position.
+        output = GessGame().to_fen().split("/")
+
+        self.assertEqual(output[0], "20")
+        self.assertEqual(output[1], "2w1w1wwwwwwww1w1w2")
+        self.assertEqual(output[19], "20 b UNFINISHED")
+
+    def test_2_to_fen(self):
+        # Testing that a position after a move is restored with its rings, hash and player to move.
+        game = GessGame()
+        game.make_move("r18", "r16")
+        game.make_move("c3", "c6")
+        output = GessGame.from_fen(game.to_fen())
+
+        self.assertEqual(output.to_fen(), game.to_fen())
+        self.assertEqual(output.get_board().get_position(), game.get_board().get_position())
+        self.assertEqual(output.legal_moves(), game.legal_moves())
+
+    def test_3_to_fen(self):
+        # Testing that text without 20 spaces in a row or with an unknown player is rejected.
+        text = GessGame().to_fen()
+        output = [text.replace("20", "19", 1), text.replace(" b ", " x ")]
+
+        self.assertRaises(ValueError, GessGame.from_fen, output[0])
+        self.assertRaises(ValueError, GessGame.from_fen, output[1])
+
+    def test_4_to_fen(self):
+        # Testing that positions with stones on the edge are rejected, as text and as bytes.
+        text = "/".join(["20"] * 17 + ["1bbb16", "bb1b16", "20"]) + " b UNFINISHED"
+        data = bytearray(GessGame().to_bytes())
+        data[0] |= 1
+
+        self.assertRaises(ValueError, GessGame.from_fen, text)
+        self.assertRaises(ValueError, GessGame.from_bytes, bytes(data))
+        self.assertRaises(ValueError, Board().load_stones, 1 << SQUARES["t10"], 0)
+
+    """
+    TESTS RELATING TO MOVERESULT CLASS:
+    """
+    # Tests relating to try_move.
+    def test_1_try_move(self):
+        # Testing the reason for each kind of illegal move, without anything printed.
+        game = GessGame()
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            output = [game.try_move(start, end).get_reason()
+                      for start, end in [("k10", "k12"), ("a1", "c3"), ("z3", "c3"), ("c3", "e4"), ("c3", "e5"),
+                                         ("e3", "e7"), ("c18", "c15")]]
+
+        self.assertEqual(output, ["INVALID_PIECE", "INVALID_PIECE", "INVALID_PIECE", "BAD_DIRECTION",
+                                  "BAD_DIRECTION", "OUT_OF_RANGE", "INVALID_PIECE"])
+        self.assertEqual(printed.getvalue(), "")
+        self.assertEqual(game.get_current_player(), "BLACK")
+
+    def test_2_try_move(self):
+        # Testing a legal move, which stops where the piece runs into a stone.
+        game = GessGame()
+        output = game.try_move("c3", "c12")
+
+        self.assertEqual([output.is_legal(), output.get_reason(), output.get_landing(), output.get_captured(),
+                          output.get_game_state()], [True, "MOVED", "c6", 0, "UNFINISHED"])
+
+    def test_3_try_move(self):
+        # Testing a move that takes stones and destroys the mover's own last ring, then a move after the game ended.
+        game = GessGame()
+        game.make_move("c3", "c6")
+        game.make_move("r18", "r16")
+        output_1 = game.try_move("i2", "j3")
+        output_2 = game.try_move("r16", "r15")
+
+        self.assertEqual([output_1.get_reason(), output_1.get_rings_destroyed(), output_1.get_game_state()],
+                         ["GAME_WON", {"BLACK": 1, "WHITE": 0}, "WHITE_WON"])
+        self.assertEqual([output_2.is_legal(), output_2.get_reason()], [False, "GAME_OVER"])
+
+    def test_4_try_move(self):
+        # Testing that the stones of the other player the piece lands on are counted as captured.
+        game = GessGame()
+        for start, end in [("l3", "o6"), ("k14", "l14"), ("r3", "r5"), ("g16", "g18")]:
+            game.make_move(start, end)
+        output = game.try_move("r6", "r18")
+
+        self.assertEqual([output.get_reason(), output.get_landing(), output.get_captured()], ["MOVED", "r13", 1])
+
+    def test_5_try_move(self):
+        # Testing that ends that aren't coordinates are refused, without raising or printing.
+        game = GessGame()
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            output = [game.try_move("c3", end).get_reason() for end in ("c", "", "cx", "c3x")]
+            output.append(game.make_move("c3", "cx"))
+            output.append(game.apply_moves([("c3", "c6"), ("r18", "")]))
+
+        self.assertEqual(output, ["BAD_DIRECTION"] * 4 + [False, (1, "BAD_DIRECTION")])
+        self.assertEqual(printed.getvalue(), "")
+
+    # Tests relating to try_square_move.
+    def test_1_try_square_move(self):
+        # Testing that a move by square index gives the coordinates of the move.
+        output = GessGame().try_square_move(SQUARES["c3"], SQUARES["c12"])
+
+        self.assertEqual([output.get_start(), output.get_end(), output.get_landing()], ["c3", "c12", "c6"])
+
+    # Tests relating to clone.
+    def test_1_clone(self):
+        # Testing that moves made on a clone leave the original game unchanged.
+        game = GessGame()
+        game.push_move("c3", "c6")
+        fen = game.to_fen()
+        clone = game.clone()
+        clone.make_move("r18", "r16")
+
+        self.assertEqual(game.to_fen(), fen)
+        self.assertEqual(clone.get_current_player(), "BLACK")
+        self.assertEqual(game.get_current_player(), "WHITE")
+
+    def test_2_clone(self):
+        # Testing that a clone can take back the moves made before it was cloned, without changing the original.
+        game = GessGame()
+        game.push_move("c3", "c6")
+        clone = game.clone()
+        output = clone.pop_move()
+
+        self.assertEqual(output, True)
+        self.assertEqual(clone.position_hash(), GessGame().position_hash())
+        self.assertEqual(len(game.legal_moves()), len(copy.deepcopy(game).legal_moves()))
+        self.assertEqual(game.get_board().get_space("c6").get_color(), "BLACK")
+
+    # Tests relating to get_memory_footprint.
+    def test_1_get_memory_footprint(self):
+        # Testing that an idle game takes up less than 1 KB, and that it grows while Stone objects are built.
+        game = GessGame()
+        game.make_move("c3", "c6")
+        output_1 = game.get_memory_footprint()
+        game.get_board().get_space("c6")
+        output_2 = game.get_memory_footprint()
+
+        self.assertLess(output_1, 1024)
+        self.assertGreater(output_2, output_1)
+
+    # Tests relating to compact.
+    def test_1_compact(self):
+        # Testing that compacting drops the Stone objects, which are built again when a space is looked at.
+        game = GessGame()
+        idle = game.get_memory_footprint()
+        game.get_board().get_space("c3")
+        game.compact()
+        output = [game.get_memory_footprint(), game.get_board().get_space("c3").get_color()]
+
+        self.assertEqual(output, [idle, "BLACK"])
+        self.assertEqual(hasattr(Stone("BLACK", "c3"), "__dict__"), False)
+
+    # Tests relating to apply_moves.
+    def test_1_apply_moves(self):
+        # Testing that the moves stop at the first illegal one, without anything printed.
+        game = GessGame()
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            output = game.apply_moves([("c3", "c12"), ("r18", "r16"), ("k10", "k12"), ("l3", "o6")])
+
+        self.assertEqual(output, (2, "INVALID_PIECE"))
+        self.assertEqual(printed.getvalue(), "")
+        self.assertEqual([game.get_current_player(), game.get_board().get_space("c6").get_color()], ["BLACK", "BLACK"])
+
+    def test_2_apply_moves(self):
+        # Testing trusted moves that end the game by destroying the mover's own last ring, then a move after the end.
+        game_1 = GessGame()
+        game_2 = GessGame()
+        output_1 = game_1.apply_moves([("c3", "c6"), ("r18", "r16"), ("i2", "j3"), ("r16", "r15")])
+        output_2 = game_2.apply_moves([("c3", "c6"), ("r18", "r16"), ("i2", "j3"), ("r16", "r15")], validate=False)
+
+        self.assertEqual([output_1, game_1.get_game_state()], [(3, "GAME_OVER"), "WHITE_WON"])
+        self.assertEqual([output_2, game_2.get_game_state()], [(3, "GAME_OVER"), "WHITE_WON"])
+        self.assertEqual(game_2.get_board().get_position(), game_1.get_board().get_position())
+
+    def test_3_apply_moves(self):
+        # Testing that a long game made with trusted moves ends in the same position as one made with make_move.
+        rng = random.Random(25)
+        game = GessGame()
+        moves = []
+        while len(moves) < 120:
+            # Picks a random move that doesn't end the game.
+            legal_moves = game.legal_moves()
+            rng.shuffle(legal_moves)
+            for move in legal_moves:
+                if game.push_move(*move) is True:
+                    moves.append(move)
+                    break
+                game.pop_move()
+        trusted = GessGame()
+        output = trusted.apply_moves(moves, validate=False)
+
+        self.assertEqual(output, (120, None))
+        self.assertEqual([trusted.get_board().get_position(), trusted.position_hash(), trusted.get_current_player()],
+                         [game.get_board().get_position(), game.position_hash(), game.get_current_player()])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,276 @@
+# Description: Houses the Monte Carlo Tree Search player for a GessGame.
+#              The player grows a search tree with UCT selection and finishes each new line of play with a random
+#              playout. Searches can be split across processes with root parallelism: every worker grows its own tree
+#              from the same position, and the visit counts of the root moves are added up to pick the move.
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessGame import AREA_MASKS, COORDINATES, opponent_of
+from GessEngine import SearchResult
+
+
+# Playouts longer than this many moves are stopped and scored as a draw.
+MAX_PLAYOUT_MOVES = 200
+# Number of random moves the heuristic playout looks at, taking the one that captures the most stones.
+HEURISTIC_SAMPLES = 4
+
+
+class MCTSNode:
+    """
+    This class is a node of the search tree: the position reached by a move, with the statistics of the playouts
+        that went through it. Wins are counted for the player who made the move.
+    """
+    def __init__(self, move, player, parent, moves):
+        """Instantiates an MCTSNode for a move made by player, with the legal moves of the position it reaches."""
+        self._move = move
+        self._player = player
+        self._parent = parent
+        self._untried = moves
+        self._children = []
+        self._visits = 0
+        self._wins = 0.0
+
+    def get_move(self):
+        """Get method for the move leading to this node."""
+        return self._move
+
+    def get_children(self):
+        """Get method for the node's children."""
+        return self._children
+
+    def get_visits(self):
+        """Get method for the number of playouts through this node."""
+        return self._visits
+
+    def get_wins(self):
+        """Get method for the playouts won by the player who made the node's move. Draws count as half a win."""
+        return self._wins
+
+    def select_child(self, exploration):
+        """Returns the child with the highest UCT score."""
+        log_visits = math.log(self._visits)
+        best_child = None
+        best_score = -1.0
+        for child in self._children:
+            score = child._wins / child._visits + exploration * math.sqrt(log_visits / child._visits)
+            if score > best_score:
+                best_child = child
+                best_score = score
+        return best_child
+
+    def expand(self, game, rng):
+        """
+        Makes one of the node's untried moves on the game and adds its child. Returns the new child,
+            or None if every move has been tried already.
+        """
+        if len(self._untried) == 0:
+            return None
+
+        index = rng.randrange(len(self._untried))
+        move = self._untried[index]
+        self._untried[index] = self._untried[-1]
+        self._untried.pop()
+
+        player = game.get_current_player()
+        game.push_square_move(move[0], move[1])
+        child = MCTSNode(move, player, self, list(game.iter_legal_square_moves(distinct=True)))
+        self._children.append(child)
+        return child
+
+    def update(self, winner):
+        """Adds a playout's winning color, or None for a draw, to the node's statistics."""
+        self._visits += 1
+        if winner == self._player:
+            self._wins += 1.0
+        elif winner is None:
+            self._wins += 0.5
+
+
+def choose_heuristic_move(game, moves, rng):
+    """Returns the move capturing the most opposing stones out of a few random moves."""
+    opponent_stones = game.get_board().get_stones(opponent_of(game.get_current_player()))
+    best_move = None
+    best_captures = -1
+    for _ in range(HEURISTIC_SAMPLES):
+        move = rng.choice(moves)
+        captures = bin(opponent_stones & AREA_MASKS[move[1]]).count("1")
+        if captures > best_captures:
+            best_move = move
+            best_captures = captures
+    return best_move
+
+
+def playout(game, rng, policy="random"):
+    """
+    Plays moves until the game is over, returning the winning color, or None if the playout was stopped
+        or a player had no legal moves. The game is restored afterwards.
+    """
+    moves_made = 0
+    winner = None
+    while moves_made < MAX_PLAYOUT_MOVES:
+        state = game.get_game_state()
+        if state != "UNFINISHED":
+            winner = state[:-4]
+            break
+
+        moves = list(game.iter_legal_square_moves(distinct=True))
+        if len(moves) == 0:
+            break
+        if policy == "heuristic":
+            move = choose_heuristic_move(game, moves, rng)
+        else:
+            move = rng.choice(moves)
+        game.push_square_move(move[0], move[1])
+        moves_made += 1
+
+    for _ in range(moves_made):
+        game.pop_move()
+    return winner
+
+
+def find_winning_move(game):
+    """Returns a move that wins the game for the player to move right away, or None if there isn't one."""
+    player = game.get_current_player()
+    for start, end in game.iter_legal_square_moves(distinct=True):
+        game.push_square_move(start, end)
+        state = game.get_game_state()
+        game.pop_move()
+        if state == player + "_WON":
+            return COORDINATES[start], COORDINATES[end]
+    return None
+
+
+def search_tree(game, iterations=None, time_limit=None, exploration=1.4, policy="random", seed=None):
+    """
+    Grows a search tree from the game's position until the iteration or time budget is spent.
+    Returns a dictionary of each root square index move's (visits, wins), along with the number of playouts
+        and the deepest node.
+    """
+    rng = random.Random(seed)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    root = MCTSNode(None, opponent_of(game.get_current_player()), None,
+                    list(game.iter_legal_square_moves(distinct=True)))
+
+    playouts = 0
+    deepest = 0
+    while (iterations is None or playouts < iterations) and (deadline is None or time.perf_counter() < deadline):
+        # Selection, descending through fully expanded nodes.
+        node = root
+        depth = 0
+        while len(node._untried) == 0 and len(node._children) > 0:
+            node = node.select_child(exploration)
+            game.push_square_move(node._move[0], node._move[1])
+            depth += 1
+
+        # Expansion, unless the game is over at this node.
+        if game.get_game_state() == "UNFINISHED":
+            child = node.expand(game, rng)
+            if child is not None:
+                node = child
+                depth += 1
+
+        # Simulation and backpropagation.
+        winner = playout(game, rng, policy)
+        while node is not None:
+            node.update(winner)
+            node = node._parent
+        for _ in range(depth):
+            game.pop_move()
+
+        playouts += 1
+        deepest = max(deepest, depth)
+
+        # Without legal moves there is nothing to search.
+        if len(root._children) == 0 and len(root._untried) == 0:
+            break
+
+    statistics = {}
+    for child in root._children:
+        statistics[child._move] = (child._visits, child._wins)
+    return statistics, playouts, deepest
+
+
+class MCTSPlayer:
+    """
+    This is the class that picks moves for a GessGame with Monte Carlo Tree Search.
+    The budget is a number of iterations, a time limit in seconds, or both. With more than one worker, each
+        worker process searches its own tree with its share of the iterations and the full time limit.
+    """
+    def __init__(self, iterations=None, time_limit=1.0, workers=1, exploration=1.4, policy="random", seed=None):
+        """
+        Instantiates an MCTSPlayer with its budget, the number of worker processes, the UCT exploration constant,
+        the playout policy ("random" or "heuristic"), and an optional random seed.
+        """
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._workers = workers
+        self._exploration = exploration
+        self._policy = policy
+        self._seed = seed
+        self._executor = None
+
+    def close(self):
+        """Shuts down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def find_best_move(self, game):
+        """
+        Searches a game's position, returning a SearchResult with the most visited move. The score is the move's
+        share of playouts won, the depth is the deepest node reached and the nodes are the number of playouts.
+        """
+        start_time = time.perf_counter()
+        if game.get_game_state() != "UNFINISHED":
+            return SearchResult(None, 0.0, 0, 0, time.perf_counter() - start_time)
+
+        # A move that wins right away needs no search.
+        winning_move = find_winning_move(game)
+        if winning_move is not None:
+            return SearchResult(winning_move, 1.0, 1, 0, time.perf_counter() - start_time)
+
+        if self._workers <= 1:
+            results = [search_tree(game, self._iterations, self._time_limit, self._exploration, self._policy,
+                                   self._seed)]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            futures = []
+            for worker in range(self._workers):
+                # Splits the iterations between the workers, giving the first ones any remainder.
+                iterations = None
+                if self._iterations is not None:
+                    iterations = self._iterations // self._workers + (worker < self._iterations % self._workers)
+                seed = None if self._seed is None else self._seed + worker
+                futures.append(self._executor.submit(search_tree, game, iterations, self._time_limit,
+                                                     self._exploration, self._policy, seed))
+            results = [future.result() for future in futures]
+
+        # Adds up the statistics of every worker's root moves.
+        totals = {}
+        playouts = 0
+        deepest = 0
+        for statistics, worker_playouts, worker_deepest in results:
+            playouts += worker_playouts
+            deepest = max(deepest, worker_deepest)
+            for move, (visits, wins) in statistics.items():
+                total_visits, total_wins = totals.get(move, (0, 0.0))
+                totals[move] = (total_visits + visits, total_wins + wins)
+
+        best_move = None
+        best_visits = -1
+        score = 0.0
+        for move, (visits, wins) in totals.items():
+            if visits > best_visits:
+                best_move = move
+                best_visits = visits
+                score = wins / visits
+        if best_move is None:
+            best_move = next(game.iter_legal_square_moves(distinct=True), None)
+        if best_move is not None:
+            best_move = (COORDINATES[best_move[0]], COORDINATES[best_move[1]])
+
+        return SearchResult(best_move, score, deepest, playouts, time.perf_counter() - start_time)
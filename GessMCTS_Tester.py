@@ -0,0 +1,99 @@
+import random
+import unittest
+from GessGame import *
+from GessMCTS import *
+from GessEngine_Tester import winning_game
+
+
+class TestGessMCTS(unittest.TestCase):
+    """
+    Contains unit tests for GessMCTS.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO PLAYOUTS:
+    """
+    # Tests relating to playout.
+    def test_1_playout(self):
+        # Testing that a playout finds a winner and leaves the game as it found it.
+        game = GessGame()
+        start = game.position_hash()
+        output = playout(game, random.Random(0))
+
+        self.assertIn(output, ["BLACK", "WHITE"])
+        self.assertEqual(game.position_hash(), start)
+        self.assertEqual(game.get_game_state(), "UNFINISHED")
+
+    def test_2_playout(self):
+        # Testing that a finished game returns its winner right away.
+        game = GessGame()
+        game.resign_game()
+        output = playout(game, random.Random(0), "heuristic")
+
+        self.assertEqual(output, "WHITE")
+
+    """
+    TESTS RELATING TO MCTSNODE CLASS:
+    """
+    # Tests relating to update.
+    def test_1_update(self):
+        # Testing that wins count for the player who made the move, with draws as half a win.
+        node = MCTSNode(("c3", "c6"), "BLACK", None, [])
+        node.update("BLACK")
+        node.update("WHITE")
+        node.update(None)
+        output = [node.get_visits(), node.get_wins()]
+
+        self.assertEqual(output, [3, 1.5])
+
+    # Tests relating to find_winning_move.
+    def test_1_find_winning_move(self):
+        # Testing that a move breaking the opponent's last ring is found, and that there is none at the start.
+        game = winning_game()
+        output = find_winning_move(game)
+        game.make_move(*output)
+
+        self.assertEqual(game.get_game_state(), "BLACK_WON")
+        self.assertEqual(find_winning_move(GessGame()), None)
+
+    # Tests relating to search_tree.
+    def test_1_search_tree(self):
+        # Testing that every playout is counted under one of the root moves.
+        game = GessGame()
+        statistics, playouts, deepest = search_tree(game, iterations=30, seed=1)
+        output = sum(visits for visits, wins in statistics.values())
+
+        self.assertEqual([output, playouts, deepest], [30, 30, 1])
+
+    """
+    TESTS RELATING TO MCTSPLAYER CLASS:
+    """
+    # Tests relating to find_best_move.
+    def test_1_find_best_move(self):
+        # Testing that the player takes a move that wins right away without searching.
+        game = winning_game()
+        player = MCTSPlayer(iterations=400, time_limit=None, seed=2)
+        result = player.find_best_move(game)
+        game.make_move(*result.get_best_move())
+
+        self.assertEqual(game.get_game_state(), "BLACK_WON")
+        self.assertEqual(result.get_nodes(), 0)
+
+    def test_2_find_best_move(self):
+        # Testing that the iterations are split between worker processes and added back up.
+        game = GessGame()
+        player = MCTSPlayer(iterations=21, time_limit=None, workers=2, seed=3)
+        try:
+            result = player.find_best_move(game)
+        finally:
+            player.close()
+
+        self.assertEqual(result.get_nodes(), 21)
+        self.assertIn(result.get_best_move(), game.legal_moves())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# Description: Houses the MoveMetrics collector for instrumenting GessGame.make_move in production.
+#              Once installed with GessGame.set_metrics, it records the time and calls of each phase of every move,
+#              how far pieces slide, and how many Stone and Piece objects are built. The data is available as a
+#              snapshot dictionary or in the Prometheus text format. With no collector installed, make_move only
+#              checks that none is installed once per phase.
+
+import time
+
+
+# Phases of make_move, in the order they run. A move that turns out to be illegal stops after validation.
+PHASES = ("footprint", "validation", "clear", "slide", "placement", "clear_edges", "rings")
+# Classes whose objects are counted as they are built.
+ALLOCATION_TYPES = ("Stone", "Piece")
+
+
+class MoveMetrics:
+    """
+    This class collects the time and number of calls of each phase of make_move, the number of moves started and
+        spaces slid, and the number of Stone and Piece objects built.
+    A phase's time runs from the end of the phase before it, so the phases of a move add up to the whole move.
+    """
+    def __init__(self):
+        """Instantiates a MoveMetrics object with every count at 0."""
+        self._clock = time.perf_counter
+        self._last = 0.0
+        self.reset()
+
+    def reset(self):
+        """Sets every count and time back to 0."""
+        self._moves = 0
+        self._slide_steps = 0
+        self._seconds = {phase: 0.0 for phase in PHASES}
+        self._calls = {phase: 0 for phase in PHASES}
+        self._allocations = {name: 0 for name in ALLOCATION_TYPES}
+
+    def start_move(self):
+        """Starts timing a move's first phase."""
+        self._moves += 1
+        self._last = self._clock()
+
+    def mark(self, phase):
+        """Ends a phase of the current move, adding the time since the last phase ended to it."""
+        now = self._clock()
+        self._seconds[phase] += now - self._last
+        self._calls[phase] += 1
+        self._last = now
+
+    def count_slide(self, steps):
+        """Adds the spaces a piece slid to the total, which stands in for the iterations of a step-by-step slide."""
+        self._slide_steps += steps
+
+    def count_allocation(self, name):
+        """Counts an object of a class in ALLOCATION_TYPES being built."""
+        self._allocations[name] += 1
+
+    def snapshot(self):
+        """Returns a dictionary of every count and time, which later moves don't change."""
+        return {"moves": self._moves, "slide_steps": self._slide_steps,
+                "phases": {phase: {"seconds": self._seconds[phase], "calls": self._calls[phase]} for phase in PHASES},
+                "allocations": dict(self._allocations)}
+
+    def to_prometheus(self, prefix="gess"):
+        """Returns every count and time in the Prometheus text exposition format, with metric names after prefix."""
+        lines = ["# HELP " + prefix + "_make_move_moves_total Moves started with make_move.",
+                 "# TYPE " + prefix + "_make_move_moves_total counter",
+                 prefix + "_make_move_moves_total " + str(self._moves),
+                 "# HELP " + prefix + "_make_move_slide_steps_total Spaces slid by the pieces moved.",
+                 "# TYPE " + prefix + "_make_move_slide_steps_total counter",
+                 prefix + "_make_move_slide_steps_total " + str(self._slide_steps),
+                 "# HELP " + prefix + "_make_move_phase_seconds_total Seconds spent in each phase of make_move.",
+                 "# TYPE " + prefix + "_make_move_phase_seconds_total counter"]
+        for phase in PHASES:
+            lines.append(prefix + '_make_move_phase_seconds_total{phase="' + phase + '"} ' + repr(self._seconds[phase]))
+        lines += ["# HELP " + prefix + "_make_move_phase_calls_total Calls of each phase of make_move.",
+                  "# TYPE " + prefix + "_make_move_phase_calls_total counter"]
+        for phase in PHASES:
+            lines.append(prefix + '_make_move_phase_calls_total{phase="' + phase + '"} ' + str(self._calls[phase]))
+        lines += ["# HELP " + prefix + "_allocations_total Stone and Piece objects built.",
+                  "# TYPE " + prefix + "_allocations_total counter"]
+        for name in ALLOCATION_TYPES:
+            lines.append(prefix + '_allocations_total{type="' + name + '"} ' + str(self._allocations[name]))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,91 @@
+import unittest
+from GessGame import *
+from GessMetrics import *
+
+
+class TestGessMetrics(unittest.TestCase):
+    """
+    Contains unit tests for GessMetrics.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+    def tearDown(self):
+        # Turns instrumentation back off for the other tests.
+        set_metrics(None)
+
+    """
+    TESTS RELATING TO MOVEMETRICS CLASS:
+    """
+    # Tests relating to set_metrics.
+    def test_1_set_metrics(self):
+        # Testing that make_move records nothing until a collector is installed.
+        metrics = MoveMetrics()
+        GessGame().make_move("c3", "c6")
+        output_1 = metrics.snapshot()["moves"]
+        set_metrics(metrics)
+        output_2 = get_metrics()
+
+        self.assertEqual(output_1, 0)
+        self.assertIs(output_2, metrics)
+
+    # Tests relating to snapshot.
+    def test_1_snapshot(self):
+        # Testing the phase calls of two legal moves, with the piece sliding 3 and then 2 spaces.
+        metrics = MoveMetrics()
+        set_metrics(metrics)
+        game = GessGame()
+        game.make_move("c3", "c6")
+        game.make_move("r18", "r16")
+        output = metrics.snapshot()
+
+        self.assertEqual(output["moves"], 2)
+        self.assertEqual(output["slide_steps"], 5)
+        self.assertEqual({phase: counts["calls"] for phase, counts in output["phases"].items()},
+                         {"footprint": 2, "validation": 2, "clear": 4, "slide": 2, "placement": 2,
+                          "clear_edges": 2, "rings": 2})
+        self.assertEqual(min(counts["seconds"] for counts in output["phases"].values()) > 0, True)
+
+    def test_2_snapshot(self):
+        # Testing that an illegal move stops after its footprint, and that allocations are counted.
+        metrics = MoveMetrics()
+        set_metrics(metrics)
+        game = GessGame()
+        game.make_move("c3", "e2")
+        game.get_board().get_space("c3")
+        Piece("c3", [["", "", ""], ["", "", ""], ["", "", ""]])
+        output = metrics.snapshot()
+
+        self.assertEqual(output["moves"], 1)
+        self.assertEqual(output["phases"]["footprint"]["calls"], 1)
+        self.assertEqual(output["phases"]["validation"]["calls"], 0)
+        self.assertEqual(output["allocations"]["Piece"], 1)
+        self.assertEqual(output["allocations"]["Stone"], bin(game.get_board().get_stones("BLACK")).count("1") +
+                         bin(game.get_board().get_stones("WHITE")).count("1"))
+
+    # Tests relating to reset.
+    def test_1_reset(self):
+        # Testing that reset sets the counts back to 0.
+        metrics = MoveMetrics()
+        set_metrics(metrics)
+        GessGame().make_move("c3", "c6")
+        metrics.reset()
+        output = metrics.snapshot()
+
+        self.assertEqual([output["moves"], output["slide_steps"], output["phases"]["rings"]["calls"]], [0, 0, 0])
+
+    # Tests relating to to_prometheus.
+    def test_1_to_prometheus(self):
+        # Testing the sample lines for a move and a phase.
+        metrics = MoveMetrics()
+        set_metrics(metrics)
+        GessGame().make_move("c3", "c6")
+        output = metrics.to_prometheus().split("\n")
+
+        self.assertIn("gess_make_move_moves_total 1", output)
+        self.assertIn('gess_make_move_phase_calls_total{phase="clear"} 2', output)
+        self.assertIn("# TYPE gess_make_move_phase_seconds_total counter", output)
+        self.assertEqual(output[-1], "")
+
+if __name__ == "__main__":
+    unittest.main()
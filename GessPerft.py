@@ -0,0 +1,210 @@
+# Description: Houses the perft tool, which counts the positions reachable in exactly a number of moves from a GessGame
+#              position. The counts check the rules engine against the reference rules: the "fast" generator lists
+#              moves with iter_legal_square_moves and makes them with push_square_move, while the "reference"
+#              generator reads each piece's Stone objects from the board's spaces, applies the rules to them directly,
+#              and makes moves by sliding the Piece a space at a time, without the bitboard tables and slide and ring
+#              shortcuts make_move relies on. The two must always agree. Divide mode breaks the count down by first
+#              move, and the first moves can be split across worker processes.
+#              Run from the command line with: python GessPerft.py --depth 2 --divide --workers 4
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessGame import COORDINATES, WIDTH, GessGame
+
+
+# Move generators by the name used on the command line.
+GENERATORS = ("fast", "reference")
+
+
+def get_reference_moves(game):
+    """
+    Returns the list of a game's legal (start, end) square index moves with end on the board, worked out from the
+        Stone objects of each Piece rather than from the bitboard tables, in the order of iter_legal_square_moves.
+    """
+    moves = []
+    if game.get_game_state() != "UNFINISHED":
+        return moves
+    board = game.get_board()
+    player = game.get_current_player()
+    # Pieces can only be centered inside the edges of the board.
+    for row in range(1, WIDTH - 1):
+        for column in range(1, WIDTH - 1):
+            start = row * WIDTH + column
+            spaces = board.get_piece(COORDINATES[start]).get_piece()
+            stones = [space for space_row in spaces for space in space_row if space != ""]
+            # A piece holds only the player's stones, and at least one of them around its center.
+            if any(stone.get_color() != player for stone in stones) or \
+                    len(stones) == (1 if spaces[1][1] != "" else 0):
+                continue
+            # A stone in the center lets the piece move as far as the board allows, otherwise it moves up to 3.
+            piece_range = WIDTH if spaces[1][1] != "" else 3
+
+            # Directions in the order of their pattern bits: the southern row first, each row from west to east.
+            for vertical in (-1, 0, 1):
+                for horizontal in (-1, 0, 1):
+                    # The piece moves towards a side of its area holding a stone. Rows of spaces run north first.
+                    if (vertical == 0 and horizontal == 0) or spaces[1 - vertical][1 + horizontal] == "":
+                        continue
+                    distance = 1
+                    while distance <= piece_range and 0 <= row + distance * vertical < WIDTH and \
+                            0 <= column + distance * horizontal < WIDTH:
+                        moves.append((start, start + distance * (vertical * WIDTH + horizontal)))
+                        distance += 1
+    return moves
+
+
+def make_reference_move(game, start, end):
+    """
+    Returns a new GessGame with a legal square index move made on a copy of the game's position the way make_move
+        made moves before the board became bitboards: the Piece of Stone objects slides one space at a time until
+        it touches a stone, reaches the edge or reaches the end, is placed there, and every ring is checked again.
+    """
+    board = game.get_board().clone()
+    piece = board.get_piece(COORDINATES[start])
+    end = COORDINATES[end]
+    board.clear_area(piece.get_center())
+
+    # Moves the piece for its first step, then until it hits another stone or the board's edge.
+    piece.move_piece(end)
+    while not board.does_interaction_occur(piece, end):
+        piece.move_piece(end)
+    board.place_piece(piece)
+    board.clear_edges()
+
+    board.check_rings("BLACK")
+    board.check_rings("WHITE")
+    current_player = game.get_current_player()
+    game_state = "UNFINISHED"
+    # Black losing its last ring is checked first, so a move that breaks both players' last rings is a win for white.
+    if len(board.get_rings("BLACK")) == 0:
+        game_state = "WHITE_WON"
+    elif len(board.get_rings("WHITE")) == 0:
+        game_state = "BLACK_WON"
+    else:
+        current_player = "WHITE" if current_player == "BLACK" else "BLACK"
+    return GessGame.from_bytes(board.to_bytes(current_player, game_state))
+
+
+def iter_children(game, moves, generator="fast"):
+    """
+    Generator that yields the game after each of a list of square index moves, made the way a generator in
+        GENERATORS makes them. The fast generator makes each move on the game itself with push_square_move and takes
+        it back once the next one is asked for, while the reference generator yields new games from
+        make_reference_move and leaves the game alone.
+    """
+    for start, end in moves:
+        if generator == "reference":
+            yield make_reference_move(game, start, end)
+        else:
+            game.push_square_move(start, end)
+            try:
+                yield game
+            finally:
+                game.pop_move()
+
+
+def get_moves(game, generator="fast"):
+    """
+    Returns the list of a game's legal (start, end) square index moves with end on the board, from a generator in
+        GENERATORS. Both generators give the same moves in the same order.
+    """
+    if generator == "fast":
+        return list(game.iter_legal_square_moves())
+    elif generator == "reference":
+        return get_reference_moves(game)
+    raise ValueError("Unknown generator: " + str(generator))
+
+
+def perft(game, depth, generator="fast"):
+    """
+    Returns the number of move sequences of exactly depth moves from the game's position, which is left as it was.
+    A game that ends before depth moves adds nothing to the count.
+    """
+    if depth == 0:
+        return 1
+    moves = get_moves(game, generator)
+    # Each legal move leads to exactly one position, so the last moves are counted without being made.
+    if depth == 1:
+        return len(moves)
+
+    count = 0
+    for child in iter_children(game, moves, generator):
+        count += perft(child, depth - 1, generator)
+    return count
+
+
+def perft_subtree(data, start, end, depth, generator):
+    """
+    Returns perft of depth - 1 moves after a first move from a position serialized with GessGame.to_bytes.
+    Runs in a worker process, so it takes and returns only plain values.
+    """
+    game = GessGame.from_bytes(data)
+    return perft(next(iter_children(game, [(start, end)], generator)), depth - 1, generator)
+
+
+def divide(game, depth, generator="fast", workers=1):
+    """
+    Returns a dictionary of each first move, as a start-end string, to the number of move sequences of exactly depth
+        moves starting with it. With more than one worker, the first moves are split across worker processes.
+    """
+    if depth < 1:
+        raise ValueError("Divide needs a depth of at least 1.")
+    moves = get_moves(game, generator)
+    names = [COORDINATES[start] + "-" + COORDINATES[end] for start, end in moves]
+
+    if workers <= 1:
+        counts = [perft(child, depth - 1, generator) for child in iter_children(game, moves, generator)]
+    else:
+        data = game.to_bytes()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(perft_subtree, [data] * len(moves), [move[0] for move in moves],
+                                       [move[1] for move in moves], [depth] * len(moves), [generator] * len(moves),
+                                       chunksize=max(1, len(moves) // (workers * 8))))
+
+    return dict(zip(names, counts))
+
+
+def run_perft(game, depth, generator="fast", workers=1, show_divide=False):
+    """
+    Counts the move sequences of exactly depth moves from a game's position, returning a report dictionary with the
+        count, the seconds taken and the sequences counted per second, and the divide counts if asked for.
+    """
+    start_time = time.perf_counter()
+    if workers > 1 or show_divide:
+        counts = divide(game, depth, generator, workers) if depth > 0 else {}
+        nodes = sum(counts.values()) if depth > 0 else 1
+    else:
+        counts = None
+        nodes = perft(game, depth, generator)
+    elapsed = time.perf_counter() - start_time
+
+    report = {"fen": game.to_fen(), "depth": depth, "generator": generator, "workers": workers, "nodes": nodes,
+              "seconds": elapsed, "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0}
+    if show_divide:
+        report["divide"] = counts
+    return report
+
+
+def main(arguments=None):
+    """Runs perft from the command line, printing the report as JSON."""
+    parser = argparse.ArgumentParser(description="Count the Gess positions reachable in a number of moves.")
+    parser.add_argument("--depth", type=int, default=2, help="number of moves to count sequences of")
+    parser.add_argument("--fen", default=None, help="position to start from, as written by GessGame.to_fen")
+    parser.add_argument("--generator", choices=GENERATORS, default="fast", help="move generator to count with")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes for the first moves")
+    parser.add_argument("--divide", action="store_true", help="break the count down by first move")
+    options = parser.parse_args(arguments)
+
+    game = GessGame() if options.fen is None else GessGame.from_fen(options.fen)
+    report = run_perft(game, options.depth, options.generator, options.workers, options.divide)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return report
+
+
+if __name__ == "__main__":
+    main()
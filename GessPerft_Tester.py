@@ -0,0 +1,89 @@
+import random
+import unittest
+from GessGame import *
+from GessPerft import *
+
+
+class TestGessPerft(unittest.TestCase):
+    """
+    Contains unit tests for GessPerft.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO COUNTING POSITIONS:
+    """
+    # Tests relating to get_moves.
+    def test_1_get_moves(self):
+        # Testing that the fast generator gives the moves the reference generator finds through the rules.
+        rng = random.Random(5)
+        output = []
+        for index in range(4):
+            game = GessGame()
+            for ply in range(rng.randint(1, 12)):
+                moves = get_moves(game)
+                if game.get_game_state() != "UNFINISHED" or len(moves) == 0:
+                    break
+                game.make_square_move(*rng.choice(moves))
+            output.append(get_moves(game) == get_moves(game, "reference"))
+
+        self.assertEqual(output, [True] * 4)
+
+    def test_2_get_moves(self):
+        # Testing that an unknown generator is rejected.
+        with self.assertRaises(ValueError):
+            get_moves(GessGame(), "magic")
+
+    def test_3_get_moves(self):
+        # Testing that the reference generator doesn't depend on the footprint tables, so it catches a bad table.
+        saved = list(FOOTPRINT_RANGES)
+        FOOTPRINT_RANGES[:] = [3] * len(saved)
+        try:
+            output = [len(get_moves(GessGame())), len(get_moves(GessGame(), "reference"))]
+        finally:
+            FOOTPRINT_RANGES[:] = saved
+
+        self.assertNotEqual(output[0], output[1])
+        self.assertEqual(output[1], 1643)
+
+    # Tests relating to perft.
+    def test_1_perft(self):
+        # Testing the counts from the start, which leave the game as it was.
+        game = GessGame()
+        output = [perft(game, 0), perft(game, 1), perft(game, 1, "reference")]
+
+        self.assertEqual(output, [1, 1643, 1643])
+        self.assertEqual(game.position_hash(), GessGame().position_hash())
+
+    def test_2_perft(self):
+        # Testing that a finished game has no moves to count.
+        game = GessGame()
+        game.resign_game()
+        output = [perft(game, 1), perft(game, 1, "reference")]
+
+        self.assertEqual(output, [0, 0])
+
+    # Tests relating to divide.
+    def test_1_divide(self):
+        # Testing that the counts by first move add up to perft, with and without worker processes.
+        game = GessGame()
+        game.make_move("c3", "c6")
+        output_1 = divide(game, 2)
+        output_2 = divide(game, 2, workers=2)
+
+        self.assertEqual(sum(output_1.values()), perft(game, 2))
+        self.assertEqual(output_1, output_2)
+        self.assertEqual(len(output_1), perft(game, 1))
+
+    # Tests relating to run_perft.
+    def test_1_run_perft(self):
+        # Testing the report of a divided count.
+        output = run_perft(GessGame(), 1, show_divide=True)
+
+        self.assertEqual([output["nodes"], output["divide"]["c3-c6"], output["nodes_per_second"] > 0],
+                         [1643, 1, True])
+
+if __name__ == "__main__":
+    unittest.main()
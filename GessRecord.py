@@ -0,0 +1,169 @@
+# Description: Houses the game record format for GessGames, with a streaming reader and a replayer.
+#              A record is a block of header lines such as [White "greedy"], then the moves as start-end pairs
+#              separated by whitespace, such as c3-c6 r18-r16, and a line holding only the END_MARK that ends it.
+#              Blank lines only make records easier to read. Archives hold any number of records and are read one
+#              line at a time, so they never need to fit in memory.
+#              Run from the command line with: python GessRecord.py games.gess
+
+import argparse
+import json
+import re
+import sys
+
+from GessGame import GessGame
+
+
+# Moves written on each line of a record.
+MOVES_PER_LINE = 10
+# The line that ends every record, even one with no headers or no moves.
+END_MARK = "*"
+# A header line: a name, then its value as a double-quoted JSON string.
+HEADER_PATTERN = re.compile(r'^\[(\w+) (".*")\]$')
+# A move: the start and end coordinates joined by a dash. Whether they are on the board is left to make_move.
+MOVE_PATTERN = re.compile(r"^([a-z]\d+)-([a-z]\d+)$")
+
+
+def parse_move(text):
+    """Returns the (start, end) coordinates of a move written as start-end, raising ValueError if it is malformed."""
+    match = MOVE_PATTERN.match(text)
+    if match is None:
+        raise ValueError("Not a move: " + repr(text))
+    return match.group(1), match.group(2)
+
+
+def format_record(headers, moves):
+    """
+    Returns the text of a record from a dictionary of headers and a list of moves, each a (start, end) tuple or a
+        start-end string. The text ends with the END_MARK line, then a blank line before the next record.
+    """
+    lines = ["[" + name + " " + json.dumps(str(value)) + "]" for name, value in headers.items()]
+    if len(lines) > 0:
+        lines.append("")
+    moves = [move if isinstance(move, str) else move[0] + "-" + move[1] for move in moves]
+    for first in range(0, len(moves), MOVES_PER_LINE):
+        lines.append(" ".join(moves[first:first + MOVES_PER_LINE]))
+    lines.append(END_MARK)
+    return "\n".join(lines) + "\n\n"
+
+
+def write_records(records, output):
+    """
+    Writes (headers, moves) records to an open text file or a path, one after another.
+    Returns the number of records written.
+    """
+    if isinstance(output, str):
+        with open(output, "w") as output_file:
+            return write_records(records, output_file)
+
+    count = 0
+    for headers, moves in records:
+        output.write(format_record(headers, moves))
+        count += 1
+    return count
+
+
+def read_records(source):
+    """
+    Generator that yields a (headers, moves) tuple for each record of an open text file or a path, where headers
+        is a dictionary and moves is a list of (start, end) tuples.
+    Lines are read one at a time. A record ends at an END_MARK line, so records with no headers, no moves or
+        neither are read back as they were written. A record missing its END_MARK ends at the next header line after
+        its moves, or at the end of the file. Blank lines are skipped.
+    Lines starting with "#" are comments. Raises ValueError with the line number of a malformed line.
+    """
+    if isinstance(source, str):
+        with open(source) as source_file:
+            yield from read_records(source_file)
+        return
+
+    headers = {}
+    moves = []
+    # Whether any line of the record being read has been seen, so a record with nothing in it is still yielded.
+    started = False
+    for number, line in enumerate(source, 1):
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+
+        if line == END_MARK:
+            yield headers, moves
+            headers = {}
+            moves = []
+            started = False
+            continue
+
+        started = True
+        match = HEADER_PATTERN.match(line)
+        if match is not None:
+            # A header after the moves starts the next record, even if the END_MARK was left out.
+            if len(moves) > 0:
+                yield headers, moves
+                headers = {}
+                moves = []
+            try:
+                headers[match.group(1)] = json.loads(match.group(2))
+            except ValueError:
+                raise ValueError("Bad header on line " + str(number) + ": " + repr(line))
+            continue
+
+        for text in line.split():
+            try:
+                moves.append(parse_move(text))
+            except ValueError:
+                raise ValueError("Bad move on line " + str(number) + ": " + repr(text))
+
+    # The last record may be missing its END_MARK.
+    if started:
+        yield headers, moves
+
+
+def replay_moves(moves, game=None, validate=True):
+    """
+    Makes a list of (start, end) moves on a new GessGame, or on the game given, through apply_moves, stopping at the
+        first move that is illegal. With validate False the moves are trusted to be legal, as in apply_moves.
+    Returns a dictionary with the final game state, the player to move, the number of moves made, and the index of
+        the illegal move and the MoveResult reason it wasn't made, which are None if every move was made.
+    """
+    if game is None:
+        game = GessGame()
+
+    made, reason = game.apply_moves(moves, validate)
+    return {"state": game.get_game_state(), "player": game.get_current_player(), "moves": made,
+            "illegal": None if reason is None else made, "reason": reason}
+
+
+def replay_records(source):
+    """
+    Generator that replays each record of an open text file or a path, yielding a (headers, result) tuple,
+        where result is the dictionary returned by replay_moves.
+    """
+    for headers, moves in read_records(source):
+        yield headers, replay_moves(moves)
+
+
+def main(arguments=None):
+    """Replays the records of archives from the command line, printing a summary as JSON."""
+    parser = argparse.ArgumentParser(description="Replay the Gess game records of archive files.")
+    parser.add_argument("archives", nargs="+", help="record files to replay")
+    parser.add_argument("--show-illegal", action="store_true", help="print each record with an illegal move")
+    options = parser.parse_args(arguments)
+
+    summary = {"records": 0, "moves": 0, "illegal": 0, "states": {"UNFINISHED": 0, "BLACK_WON": 0, "WHITE_WON": 0}}
+    for archive in options.archives:
+        for index, (headers, result) in enumerate(replay_records(archive)):
+            summary["records"] += 1
+            summary["moves"] += result["moves"]
+            summary["states"][result["state"]] += 1
+            if result["illegal"] is not None:
+                summary["illegal"] += 1
+                if options.show_illegal:
+                    sys.stdout.write(json.dumps({"archive": archive, "record": index, "headers": headers,
+                                                 "illegal": result["illegal"], "reason": result["reason"]}) + "\n")
+
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
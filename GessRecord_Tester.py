@@ -0,0 +1,125 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from GessGame import *
+from GessRecord import *
+
+
+class TestGessRecord(unittest.TestCase):
+    """
+    Contains unit tests for GessRecord.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO THE RECORD FORMAT:
+    """
+    # Tests relating to parse_move.
+    def test_1_parse_move(self):
+        # Testing a move on the board and a move to an end past the board's edge.
+        output = [parse_move("c3-c6"), parse_move("c3-c22")]
+
+        self.assertEqual(output, [("c3", "c6"), ("c3", "c22")])
+
+    def test_2_parse_move(self):
+        # Testing that text without a dash between two coordinates is rejected.
+        with self.assertRaises(ValueError):
+            parse_move("c3c6")
+
+    # Tests relating to format_record.
+    def test_1_format_record(self):
+        # Testing the header lines, that moves wrap after MOVES_PER_LINE moves, and the END_MARK line.
+        output = format_record({"Black": "random", "Round": 2}, [("c3", "c6")] * (MOVES_PER_LINE + 1))
+
+        self.assertEqual(output.split("\n"), ['[Black "random"]', '[Round "2"]', "",
+                                              " ".join(["c3-c6"] * MOVES_PER_LINE), "c3-c6", END_MARK, "", ""])
+
+    def test_2_format_record(self):
+        # Testing that a record with no headers and no moves is only its END_MARK line.
+        output = format_record({}, [])
+
+        self.assertEqual(output, END_MARK + "\n\n")
+
+    # Tests relating to read_records.
+    def test_1_read_records(self):
+        # Testing that written records are read back, including a header after moves that are missing their END_MARK.
+        records = [({"Black": "random"}, [("c3", "c6"), ("r18", "r16")]), ({"Note": 'says "hi"'}, [("c3", "c22")])]
+        text = format_record(*records[0]).replace(END_MARK + "\n", "") + "# comment\n" + format_record(*records[1])
+        output = list(read_records(io.StringIO(text)))
+
+        self.assertEqual(output, records)
+
+    def test_2_read_records(self):
+        # Testing that a malformed move is reported with its line number.
+        with self.assertRaises(ValueError) as context:
+            list(read_records(io.StringIO('[Black "random"]\n\nc3-c6 c3\n')))
+
+        self.assertIn("line 3", str(context.exception))
+
+    def test_3_read_records(self):
+        # Testing that records are streamed from a path, the first one before the rest of the file is read.
+        records = [({"Game": str(index)}, [("c3", "c6")]) for index in range(3)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.gess")
+            write_records(records, path)
+            with open(path, "a") as archive:
+                archive.write("not a move\n")
+            reader = read_records(path)
+            output = next(reader)
+
+            self.assertEqual(output, records[0])
+            with self.assertRaises(ValueError):
+                list(reader)
+
+    def test_4_read_records(self):
+        # Testing that records with headers only, moves only or neither are read back as they were written.
+        records = [({"Event": "resigned"}, []), ({}, [("c3", "c6")]), ({}, []), ({"A": "1"}, [("c3", "c6")]),
+                   ({"Event": "last"}, [])]
+        text = io.StringIO()
+        count = write_records(records, text)
+        output = list(read_records(io.StringIO(text.getvalue())))
+
+        self.assertEqual(output, records)
+        self.assertEqual(count, len(output))
+
+    """
+    TESTS RELATING TO REPLAYING RECORDS:
+    """
+    # Tests relating to replay_moves.
+    def test_1_replay_moves(self):
+        # Testing a record that destroys black's own last ring.
+        output = replay_moves([("c3", "c6"), ("r18", "r16"), ("i2", "j3")])
+
+        self.assertEqual(output, {"state": "WHITE_WON", "player": "BLACK", "moves": 3, "illegal": None,
+                                  "reason": None})
+
+    def test_2_replay_moves(self):
+        # Testing that replaying stops at the index of the first illegal move, without printing anything.
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            output = replay_moves([("c3", "c6"), ("c6", "c9"), ("r18", "r16")])
+
+        self.assertEqual(output, {"state": "UNFINISHED", "player": "WHITE", "moves": 1, "illegal": 1,
+                                  "reason": "INVALID_PIECE"})
+        self.assertEqual(printed.getvalue(), "")
+
+    # Tests relating to main.
+    def test_1_main(self):
+        # Testing the summary of an archive with a finished record and a record with an illegal move.
+        records = [({}, [("c3", "c6"), ("r18", "r16"), ("i2", "j3")]), ({}, [("c3", "c6"), ("c6", "c9")])]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.gess")
+            write_records(records, path)
+            with contextlib.redirect_stdout(io.StringIO()) as printed:
+                output = main([path])
+
+        self.assertEqual(output, {"records": 2, "moves": 4, "illegal": 1,
+                                  "states": {"UNFINISHED": 1, "BLACK_WON": 0, "WHITE_WON": 1}})
+        self.assertEqual(json.loads(printed.getvalue()), output)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+# Description: Houses the self-play pipeline that turns GessGames played by a policy against itself into training data.
+#              Every position of every game becomes a record of its feature planes, the player to move, the move chosen
+#              and the game's final outcome. Records are appended to fixed-size shards of .npy files, one file per
+#              field, which readers can open with np.load(..., mmap_mode="r"). A manifest lists the finished shards.
+#              Only the shard being filled and the game being played are held in memory.
+#              Run from the command line with: python GessSelfPlay.py --games 100 --output selfplay
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from GessGame import SQUARES, GessGame
+from GessFeatures import PLANES, encode_bitboards
+from GessSimulator import MAX_GAME_MOVES, make_policy
+
+
+# Records in each shard. Only the last shard written by close may hold fewer.
+SHARD_SIZE = 4096
+# Name of the manifest file in a shard directory.
+MANIFEST_NAME = "manifest.json"
+# Values of the player to move and of the final outcome in a record.
+SIDES = {"BLACK": 0, "WHITE": 1}
+OUTCOMES = {"BLACK_WON": 1, "WHITE_WON": -1, "DRAW": 0}
+# Shape and type of each field of a record, saved as shard-NNNNN.<field>.npy.
+#   planes holds the position's feature planes from GessFeatures, [plane, row index, column index].
+#   move holds the square indices of the start and end spaces, with -1 for an end past the board's edge.
+FIELDS = {"planes": ((len(PLANES), 20, 20), np.uint8), "side": ((), np.int8), "move": ((2,), np.int16),
+          "outcome": ((), np.int8)}
+
+
+def encode_positions(positions):
+    """Returns the feature planes of a list of positions, each starting with its black and white bitboards."""
+    return encode_bitboards([position[0] for position in positions], [position[1] for position in positions])
+
+
+def play_selfplay_game(index, policy="engine", seed=None, time_limit=0.2, node_limit=None, max_moves=MAX_GAME_MOVES):
+    """
+    Plays one game with the same policy on both sides, returning its positions and their moves, and the result.
+    Each position is a (black, white, side, start, end) tuple of the bitboards before the move, the player to move
+        and the square indices of the move. The result is the final game state, or "DRAW" if the game was stopped.
+    """
+    game_seed = None if seed is None else seed * 1000003 + index
+    policies = {"BLACK": make_policy(policy, game_seed, time_limit, node_limit),
+                "WHITE": make_policy(policy, None if game_seed is None else game_seed + 1, time_limit, node_limit)}
+    game = GessGame()
+    positions = []
+    while game.get_game_state() == "UNFINISHED" and len(positions) < max_moves:
+        player = game.get_current_player()
+        move = policies[player].choose_move(game)
+        if move is None:
+            break
+        board = game.get_board()
+        position = (board.get_stones("BLACK"), board.get_stones("WHITE"), SIDES[player],
+                    SQUARES[move[0]], SQUARES.get(move[1], -1))
+        if not game.try_move(move[0], move[1]).is_legal():
+            break
+        positions.append(position)
+
+    result = game.get_game_state()
+    return positions, "DRAW" if result == "UNFINISHED" else result
+
+
+def play_selfplay_games(indices, policy, seed, time_limit, node_limit, max_moves):
+    """Plays a batch of games in one worker process, returning their positions and results."""
+    return [play_selfplay_game(index, policy, seed, time_limit, node_limit, max_moves) for index in indices]
+
+
+class ShardWriter:
+    """
+    This class appends records to numbered shards in a directory. Records are buffered in arrays of SHARD_SIZE
+        records, and each full buffer is saved as one .npy file per field, then added to the manifest.
+    Shards are never rewritten once saved, and a writer opened on a directory with a manifest carries on after its
+        last shard.
+    """
+    def __init__(self, directory, shard_size=SHARD_SIZE):
+        """
+        Instantiates a ShardWriter for a directory, which is made if it doesn't exist.
+        Raises ValueError if the directory's manifest describes fields with other shapes or types than FIELDS,
+            as shards written before a change to the record format would be.
+        """
+        self._directory = directory
+        self._shard_size = shard_size
+        os.makedirs(directory, exist_ok=True)
+        fields = {name: {"shape": list(shape), "dtype": np.dtype(dtype).name}
+                  for name, (shape, dtype) in FIELDS.items()}
+        if os.path.exists(os.path.join(directory, MANIFEST_NAME)):
+            self._manifest = read_manifest(directory)
+            # Shards of another record format can't share a manifest with the new ones.
+            if self._manifest.get("fields") != fields:
+                raise ValueError("The shards in " + directory + " have the fields "
+                                 + json.dumps(self._manifest.get("fields")) + ", not " + json.dumps(fields))
+        else:
+            self._manifest = {"fields": fields, "shards": [], "records": 0}
+        self._buffers = {name: np.zeros((shard_size,) + shape, dtype=dtype) for name, (shape, dtype) in FIELDS.items()}
+        self._count = 0
+
+    def get_manifest(self):
+        """Get method for the manifest dictionary of the shards saved so far."""
+        return self._manifest
+
+    def write(self, planes, sides, moves, outcomes):
+        """
+        Appends records given as arrays of planes, sides, moves and outcomes with the same first dimension,
+            saving a shard each time the buffer fills.
+        """
+        written = 0
+        while written < len(planes):
+            size = min(len(planes) - written, self._shard_size - self._count)
+            end = self._count + size
+            self._buffers["planes"][self._count:end] = planes[written:written + size]
+            self._buffers["side"][self._count:end] = sides[written:written + size]
+            self._buffers["move"][self._count:end] = moves[written:written + size]
+            self._buffers["outcome"][self._count:end] = outcomes[written:written + size]
+            self._count = end
+            written += size
+            if self._count == self._shard_size:
+                self.flush()
+
+    def write_game(self, positions, result):
+        """Appends a record for each position of a game played by play_selfplay_game, with the game's outcome."""
+        if len(positions) == 0:
+            return
+        self.write(encode_positions(positions), [position[2] for position in positions],
+                   [(position[3], position[4]) for position in positions], [OUTCOMES[result]] * len(positions))
+
+    def flush(self):
+        """Saves the buffered records as the next shard, even if the buffer isn't full, and updates the manifest."""
+        if self._count == 0:
+            return
+        name = "shard-%05d" % len(self._manifest["shards"])
+        files = {}
+        for field, buffer in self._buffers.items():
+            files[field] = name + "." + field + ".npy"
+            np.save(os.path.join(self._directory, files[field]), buffer[:self._count])
+        self._manifest["shards"].append({"name": name, "records": self._count, "files": files})
+        self._manifest["records"] += self._count
+        self._count = 0
+
+        # Replaces the manifest in one step, so readers never see a partly written one.
+        path = os.path.join(self._directory, MANIFEST_NAME)
+        with open(path + ".tmp", "w") as manifest_file:
+            json.dump(self._manifest, manifest_file, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """Saves any buffered records as a last, smaller shard."""
+        self.flush()
+
+
+def read_manifest(directory):
+    """Returns the manifest dictionary of a shard directory."""
+    with open(os.path.join(directory, MANIFEST_NAME)) as manifest_file:
+        return json.load(manifest_file)
+
+
+def load_shards(directory, mmap_mode="r"):
+    """
+    Returns a list with a dictionary of each field's array for every shard listed in a directory's manifest.
+    The arrays are memory-mapped read-only by default, so only the parts used are read from disk.
+    """
+    return [{field: np.load(os.path.join(directory, file), mmap_mode=mmap_mode)
+             for field, file in shard["files"].items()} for shard in read_manifest(directory)["shards"]]
+
+
+def run_selfplay(games, output, policy="engine", workers=1, seed=None, time_limit=0.2, node_limit=None,
+                 max_moves=MAX_GAME_MOVES, shard_size=SHARD_SIZE, batch_size=4):
+    """
+    Plays a number of self-play games across worker processes, writing their records to shards in the output
+        directory. Returns a summary dictionary with the games, records and shards written and the time taken.
+    """
+    batches = [range(first, min(first + batch_size, games)) for first in range(0, games, batch_size)]
+    arguments = (policy, seed, time_limit, node_limit, max_moves)
+    writer = ShardWriter(output, shard_size)
+    records = writer.get_manifest()["records"]
+    start_time = time.perf_counter()
+    executor = None
+    try:
+        if workers <= 1:
+            finished = (play_selfplay_games(batch, *arguments) for batch in batches)
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            finished = executor.map(play_selfplay_games, batches,
+                                    *[[argument] * len(batches) for argument in arguments])
+        for played in finished:
+            for positions, result in played:
+                writer.write_game(positions, result)
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - start_time
+    manifest = writer.get_manifest()
+    return {"games": games, "records": manifest["records"] - records, "shards": len(manifest["shards"]),
+            "seconds": elapsed, "output": output}
+
+
+def main(arguments=None):
+    """Runs self-play from the command line, printing the summary as JSON."""
+    parser = argparse.ArgumentParser(description="Write Gess self-play games as NumPy training shards.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--output", default="selfplay", help="directory to write the shards and manifest to")
+    parser.add_argument("--policy", default="engine", help="policy playing both sides, as in GessSimulator")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for reproducible games")
+    parser.add_argument("--time-limit", type=float, default=0.2, help="seconds per engine or mcts move")
+    parser.add_argument("--node-limit", type=int, default=None, help="nodes per engine move, or mcts iterations")
+    parser.add_argument("--max-moves", type=int, default=MAX_GAME_MOVES, help="moves before a game is a draw")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="records in each shard")
+    options = parser.parse_args(arguments)
+
+    summary = run_selfplay(options.games, options.output, options.policy, options.workers, options.seed,
+                           options.time_limit, options.node_limit, options.max_moves, options.shard_size)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import unittest
+from GessGame import *
+
+try:
+    import numpy as np
+    from GessSelfPlay import *
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestGessSelfPlay(unittest.TestCase):
+    """
+    Contains unit tests for GessSelfPlay.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    def records(self, count, outcome=1):
+        """Returns count records of the starting position, numbered by their move's start square."""
+        planes = np.repeat(encode_positions([(START_STONES["BLACK"], START_STONES["WHITE"])]), count, axis=0)
+        moves = np.array([(index, index + 1) for index in range(count)], dtype=np.int16)
+        return planes, np.zeros(count, dtype=np.int8), moves, np.full(count, outcome, dtype=np.int8)
+
+    """
+    TESTS RELATING TO MODULE FUNCTIONS:
+    """
+    # Tests relating to play_selfplay_game.
+    def test_1_play_selfplay_game(self):
+        # Testing that replaying a game's moves from each recorded position reproduces the next position.
+        positions, result = play_selfplay_game(0, "random", seed=3, max_moves=30)
+        game = GessGame()
+        output = []
+        for black, white, side, start, end in positions:
+            board = game.get_board()
+            output.append((black, white, side) == (board.get_stones("BLACK"), board.get_stones("WHITE"),
+                                                   SIDES[game.get_current_player()]))
+            game.make_square_move(start, end)
+
+        self.assertEqual(output, [True] * len(positions))
+        self.assertEqual(result, "DRAW" if game.get_game_state() == "UNFINISHED" else game.get_game_state())
+
+    # Tests relating to load_shards.
+    def test_1_load_shards(self):
+        # Testing that records are split into full shards and a last partial one, and loaded memory-mapped.
+        with tempfile.TemporaryDirectory() as directory:
+            writer = ShardWriter(directory, shard_size=4)
+            planes, sides, moves, outcomes = self.records(10)
+            writer.write(planes[:3], sides[:3], moves[:3], outcomes[:3])
+            writer.write(planes[3:], sides[3:], moves[3:], outcomes[3:])
+            writer.close()
+            shards = load_shards(directory)
+            output = [[len(shard["move"]) for shard in shards], isinstance(shards[0]["planes"], np.memmap),
+                      np.concatenate([shard["move"][:, 0] for shard in shards]).tolist(),
+                      read_manifest(directory)["records"]]
+            del shards
+
+        self.assertEqual(output, [[4, 4, 2], True, list(range(10)), 10])
+
+    def test_2_load_shards(self):
+        # Testing that a writer opened on an existing directory adds shards after the ones already written.
+        with tempfile.TemporaryDirectory() as directory:
+            for outcome in (1, -1):
+                writer = ShardWriter(directory, shard_size=4)
+                writer.write(*self.records(5, outcome))
+                writer.close()
+            output = [[shard["outcome"][0] for shard in load_shards(directory)], sorted(os.listdir(directory))[:1]]
+
+        self.assertEqual(output, [[1, 1, -1, -1], ["manifest.json"]])
+
+    # Tests relating to ShardWriter.
+    def test_1_shard_writer(self):
+        # Testing that a directory of shards with another record format is refused instead of added to.
+        with tempfile.TemporaryDirectory() as directory:
+            writer = ShardWriter(directory, shard_size=4)
+            writer.write(*self.records(2))
+            writer.close()
+            manifest = read_manifest(directory)
+            manifest["fields"]["planes"]["shape"] = [2, 20, 20]
+            with open(os.path.join(directory, MANIFEST_NAME), "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+
+            self.assertRaises(ValueError, ShardWriter, directory)
+
+    # Tests relating to run_selfplay.
+    def test_1_run_selfplay(self):
+        # Testing that every position of the games played is written, with planes matching the start position.
+        with tempfile.TemporaryDirectory() as directory:
+            summary = run_selfplay(2, directory, "random", seed=5, max_moves=20, shard_size=16)
+            shards = load_shards(directory)
+            planes = np.concatenate([shard["planes"] for shard in shards])
+            output = [summary["records"], len(planes), summary["shards"], len(shards)]
+            first = planes[0].copy()
+            del shards, planes
+
+        self.assertEqual(output[0], output[1])
+        self.assertEqual(output[2], output[3])
+        self.assertTrue(np.array_equal(first, encode_positions([(START_STONES["BLACK"], START_STONES["WHITE"])])[0]))
+
+    def test_2_run_selfplay(self):
+        # Testing self-play with the default engine policy, where each engine picks every move of its side.
+        with tempfile.TemporaryDirectory() as directory:
+            summary = run_selfplay(2, directory, seed=1, time_limit=None, node_limit=100, max_moves=12)
+            shards = load_shards(directory)
+            output = [summary["records"], sum(len(shard["move"]) for shard in shards)]
+            del shards
+
+        self.assertEqual(output[0], output[1])
+        self.assertGreater(output[0], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,289 @@
+# Description: Houses the asyncio game server that hosts many GessGame sessions at once.
+#              Clients connect over TCP or a Unix socket and send one JSON object per line, such as
+#              {"op": "move", "session": "abc", "start": "c3", "end": "c6"}, getting one JSON object per line back.
+#              Spectators of a session are sent every change to it. Engine moves are searched in worker processes,
+#              so a long search never holds up the other sessions.
+#              Run from the command line with: python GessServer.py --port 8765   or   python GessServer.py --unix gess.sock
+
+import argparse
+import asyncio
+import json
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from GessGame import GessGame
+from GessEngine import GessEngine
+
+
+# Longest request line a client may send, in bytes.
+MAX_LINE_BYTES = 1 << 16
+# A coordinate in a move request: a letter and a number, which may lead past the board's edge, such as "c21".
+COORDINATE_PATTERN = re.compile(r"[a-z]\d+")
+
+
+def find_engine_move(data, time_limit, node_limit=None):
+    """
+    Returns the (start, end) move the GessEngine picks for a position serialized with GessGame.to_bytes, or None.
+    Runs in a worker process, so it takes and returns only plain values.
+    """
+    engine = GessEngine(time_limit=time_limit, node_limit=node_limit)
+    return engine.find_best_move(GessGame.from_bytes(data)).get_best_move()
+
+
+class GameSession:
+    """
+    This class holds one hosted game: the GessGame, the moves made in it, and the spectators to send its changes to.
+    The lock keeps moves in order while an engine move is being searched.
+    """
+    def __init__(self, session_id):
+        """Instantiates a GameSession with a new game and no spectators."""
+        self._session_id = session_id
+        self._game = GessGame()
+        self._moves = []
+        self._spectators = set()
+        self._lock = asyncio.Lock()
+
+    def get_session_id(self):
+        """Get method for the session's ID."""
+        return self._session_id
+
+    def get_game(self):
+        """Get method for the session's game."""
+        return self._game
+
+    def get_moves(self):
+        """Get method for the list of moves made, each a start-end string."""
+        return self._moves
+
+    def get_spectators(self):
+        """Get method for the set of spectating connections' writers."""
+        return self._spectators
+
+    def get_lock(self):
+        """Get method for the lock held while the game is changed."""
+        return self._lock
+
+    def get_state(self):
+        """Returns a dictionary of the session's position, player to move, game state and moves."""
+        return {"session": self._session_id, "fen": self._game.to_fen(),
+                "current_player": self._game.get_current_player(), "game_state": self._game.get_game_state(),
+                "moves": list(self._moves)}
+
+
+class GessServer:
+    """
+    This class serves GessGame sessions to clients speaking line-delimited JSON. Every request has an "op":
+        "new" starts a session, with an optional "session" ID. "state" returns a session's state.
+        "move" makes a move from "start" to "end". "engine" has the GessEngine make the next move.
+        "resign" resigns for the player to move. "spectate" and "unspectate" start and stop sending a
+        connection every change to a session. "close" ends a session.
+    Responses repeat the request's "id" if it had one, and hold "ok" with either the result or an "error".
+    """
+    def __init__(self, engine_time_limit=0.2, engine_node_limit=None, workers=1, executor=None):
+        """
+        Instantiates a GessServer. Engine moves are searched in a pool of worker processes, or in the executor
+            given, which the server won't shut down.
+        """
+        self._engine_time_limit = engine_time_limit
+        self._engine_node_limit = engine_node_limit
+        self._workers = workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._sessions = {}
+        # IDs of the sessions each spectating connection's writer watches, so a disconnect only visits those.
+        self._watching = {}
+        self._servers = []
+
+    def get_sessions(self):
+        """Get method for the dictionary of sessions by ID."""
+        return self._sessions
+
+    async def start_tcp(self, host="127.0.0.1", port=8765):
+        """Starts listening on a TCP host and port, returning the asyncio server. Port 0 picks a free port."""
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path):
+        """Starts listening on a Unix socket path, returning the asyncio server."""
+        server = await asyncio.start_unix_server(self.handle_connection, path, limit=MAX_LINE_BYTES)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        """Stops listening, and shuts down the worker processes if the server started them."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def handle_connection(self, reader, writer):
+        """Answers a connection's requests one line at a time until it disconnects."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(self.encode({"ok": False, "error": "request line too long"}))
+                    break
+                if not line:
+                    break
+                if line.strip() == b"":
+                    continue
+                writer.write(self.encode(await self.handle_line(line, writer)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # A connection that leaves stops spectating every session.
+            for session_id in self._watching.pop(writer, ()):
+                if session_id in self._sessions:
+                    self._sessions[session_id].get_spectators().discard(writer)
+            writer.close()
+
+    async def handle_line(self, line, writer=None):
+        """Returns the response to a request line, holding an error if it wasn't a JSON object."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "request is not JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request is not a JSON object"}
+
+        response = await self.handle_request(request, writer)
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_request(self, request, writer=None):
+        """Returns the response to a request dictionary from the connection with the writer given."""
+        op = request.get("op")
+        if op == "new":
+            session_id = str(request.get("session") or uuid.uuid4().hex)
+            if session_id in self._sessions:
+                return {"ok": False, "error": "session already exists: " + session_id}
+            self._sessions[session_id] = GameSession(session_id)
+            return dict(self._sessions[session_id].get_state(), ok=True)
+
+        if op not in ("state", "move", "engine", "resign", "spectate", "unspectate", "close"):
+            return {"ok": False, "error": "unknown op: " + str(op)}
+        session = self._sessions.get(str(request.get("session")))
+        if session is None:
+            return {"ok": False, "error": "no such session: " + str(request.get("session"))}
+
+        if op == "state":
+            return dict(session.get_state(), ok=True)
+        elif op == "move":
+            if not isinstance(request.get("start"), str) or not isinstance(request.get("end"), str):
+                return {"ok": False, "error": "a move needs a start and an end"}
+            if COORDINATE_PATTERN.fullmatch(request["start"]) is None or \
+                    COORDINATE_PATTERN.fullmatch(request["end"]) is None:
+                return {"ok": False, "error": "a move's start and end must be coordinates such as c3"}
+            async with session.get_lock():
+                return self.apply_move(session, request["start"], request["end"])
+        elif op == "engine":
+            return await self.apply_engine_move(session)
+        elif op == "resign":
+            async with session.get_lock():
+                if session.get_game().get_game_state() != "UNFINISHED":
+                    return dict(session.get_state(), ok=False, error="game is over")
+                session.get_game().resign_game()
+                self.broadcast(session, "resign")
+                return dict(session.get_state(), ok=True)
+        elif op == "spectate":
+            if writer is not None:
+                session.get_spectators().add(writer)
+                self._watching.setdefault(writer, set()).add(session.get_session_id())
+            return dict(session.get_state(), ok=True)
+        elif op == "unspectate":
+            session.get_spectators().discard(writer)
+            self._watching.get(writer, set()).discard(session.get_session_id())
+            return {"ok": True, "session": session.get_session_id()}
+        else:
+            del self._sessions[session.get_session_id()]
+            self.broadcast(session, "close")
+            return {"ok": True, "session": session.get_session_id()}
+
+    def apply_move(self, session, start, end):
+        """Makes a move in a session, sending it to the spectators if it was made, and returns the response."""
+        result = session.get_game().try_move(start, end)
+        if not result.is_legal():
+            return dict(session.get_state(), ok=False, error=result.get_reason())
+
+        session.get_moves().append(start + "-" + end)
+        self.broadcast(session, "move")
+        return dict(session.get_state(), ok=True, landing=result.get_landing(), captured=result.get_captured(),
+                    rings_destroyed=result.get_rings_destroyed())
+
+    async def apply_engine_move(self, session):
+        """
+        Searches the engine's move for a session in a worker process and makes it, returning the response.
+        The session's lock is held during the search, so no other move can change the position under it.
+        """
+        async with session.get_lock():
+            game = session.get_game()
+            if game.get_game_state() != "UNFINISHED":
+                return dict(session.get_state(), ok=False, error="GAME_OVER")
+
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            move = await asyncio.get_running_loop().run_in_executor(
+                self._executor, find_engine_move, game.to_bytes(), self._engine_time_limit, self._engine_node_limit)
+            if move is None:
+                return dict(session.get_state(), ok=False, error="no legal move")
+            response = self.apply_move(session, move[0], move[1])
+            response["start"], response["end"] = move
+            return response
+
+    def broadcast(self, session, event):
+        """Sends an event with a session's state to each of its spectators, dropping any that have disconnected."""
+        if len(session.get_spectators()) == 0:
+            return
+        line = self.encode(dict(session.get_state(), event=event))
+        for writer in list(session.get_spectators()):
+            if writer.is_closing():
+                session.get_spectators().discard(writer)
+            else:
+                writer.write(line)
+
+    @staticmethod
+    def encode(message):
+        """Returns a message dictionary as a line of JSON bytes."""
+        return (json.dumps(message) + "\n").encode()
+
+
+async def serve(host="127.0.0.1", port=8765, unix=None, engine_time_limit=0.2, workers=1):
+    """Runs a GessServer on a TCP port, or a Unix socket path if one is given, until it is cancelled."""
+    server = GessServer(engine_time_limit=engine_time_limit, workers=workers)
+    if unix is not None:
+        listener = await server.start_unix(unix)
+    else:
+        listener = await server.start_tcp(host, port)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(arguments=None):
+    """Runs the server from the command line."""
+    parser = argparse.ArgumentParser(description="Serve Gess games over line-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="Unix socket path to listen on instead of TCP")
+    parser.add_argument("--engine-time-limit", type=float, default=0.2, help="seconds per engine move")
+    parser.add_argument("--workers", type=int, default=1, help="number of engine worker processes")
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix, options.engine_time_limit, options.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from GessGame import *
+from GessServer import *
+
+
+class TestGessServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Contains unit tests for GessServer.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+    async def asyncSetUp(self):
+        # Searches engine moves in a thread with a small node limit, to keep the tests fast.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.server = GessServer(engine_time_limit=5.0, engine_node_limit=50, executor=self.executor)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        self.executor.shutdown()
+
+    async def send(self, reader, writer, request):
+        # Sends a request line, returning the response line.
+        writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    """
+    TESTS RELATING TO GESSSERVER CLASS:
+    """
+    # Tests relating to handle_request.
+    async def test_1_handle_request(self):
+        # Testing a new session, a legal move and an illegal move.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        output_1 = await self.server.handle_request({"op": "move", "session": "a", "start": "c3", "end": "c12"})
+        output_2 = await self.server.handle_request({"op": "move", "session": "a", "start": "c6", "end": "c9"})
+
+        self.assertEqual([output_1["ok"], output_1["landing"], output_1["current_player"], output_1["moves"]],
+                         [True, "c6", "WHITE", ["c3-c12"]])
+        self.assertEqual([output_2["ok"], output_2["error"], output_2["moves"]], [False, "INVALID_PIECE", ["c3-c12"]])
+
+    async def test_2_handle_request(self):
+        # Testing errors for an unknown op, a missing session and a session ID that is taken.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        output = [await self.server.handle_request({"op": "fly", "session": "a"}),
+                  await self.server.handle_request({"op": "state", "session": "b"}),
+                  await self.server.handle_request({"op": "new", "session": "a"})]
+
+        self.assertEqual([response["ok"] for response in output], [False, False, False])
+
+    async def test_3_handle_request(self):
+        # Testing that a resignation ends the game, and that the game then takes no moves.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        output_1 = await self.server.handle_request({"op": "resign", "session": "a"})
+        output_2 = await self.server.handle_request({"op": "move", "session": "a", "start": "c3", "end": "c6"})
+
+        self.assertEqual([output_1["ok"], output_1["game_state"]], [True, "WHITE_WON"])
+        self.assertEqual([output_2["ok"], output_2["error"]], [False, "GAME_OVER"])
+
+    async def test_4_handle_request(self):
+        # Testing that the engine makes a legal move for the player to move.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        legal_moves = GessGame().legal_moves()
+        output = await self.server.handle_request({"op": "engine", "session": "a"})
+
+        self.assertEqual(output["ok"], True)
+        self.assertIn((output["start"], output["end"]), legal_moves)
+        self.assertEqual(output["current_player"], "WHITE")
+
+    async def test_5_handle_request(self):
+        # Testing that closing a session removes it.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        output = await self.server.handle_request({"op": "close", "session": "a"})
+
+        self.assertEqual(output["ok"], True)
+        self.assertEqual(self.server.get_sessions(), {})
+
+    async def test_6_handle_request(self):
+        # Testing that moves with malformed coordinates are refused without changing the game.
+        await self.server.handle_request({"op": "new", "session": "a"})
+        output = [await self.server.handle_request({"op": "move", "session": "a", "start": "c3", "end": end})
+                  for end in ("c", "", "cx", "c3x")]
+
+        self.assertEqual([response["ok"] for response in output], [False] * 4)
+        self.assertEqual(self.server.get_sessions()["a"].get_state()["moves"], [])
+
+    # Tests relating to handle_line.
+    async def test_1_handle_line(self):
+        # Testing that the request's id is repeated, and that a line that isn't a JSON object is rejected.
+        output = [await self.server.handle_line(b'{"op": "new", "id": 7}'), await self.server.handle_line(b"[1]"),
+                  await self.server.handle_line(b"{oops")]
+
+        self.assertEqual([output[0]["ok"], output[0]["id"]], [True, 7])
+        self.assertEqual([output[1]["ok"], output[2]["ok"]], [False, False])
+
+    # Tests relating to start_tcp.
+    async def test_1_start_tcp(self):
+        # Testing a player and a spectator on separate connections, with the spectator sent the player's move.
+        listener = await self.server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        player = await asyncio.open_connection("127.0.0.1", port)
+        spectator = await asyncio.open_connection("127.0.0.1", port)
+
+        await self.send(*player, {"op": "new", "session": "a"})
+        output_1 = await self.send(*spectator, {"op": "spectate", "session": "a"})
+        output_2 = await self.send(*player, {"op": "move", "session": "a", "start": "c3", "end": "c6"})
+        output_3 = json.loads(await asyncio.wait_for(spectator[0].readline(), 5))
+        for reader, writer in (player, spectator):
+            writer.close()
+            await writer.wait_closed()
+
+        self.assertEqual([output_1["ok"], output_1["moves"]], [True, []])
+        self.assertEqual(output_2["ok"], True)
+        self.assertEqual([output_3["event"], output_3["moves"], output_3["fen"]], ["move", ["c3-c6"], output_2["fen"]])
+
+    async def test_2_start_tcp(self):
+        # Testing that a malformed move gets an error back, and the connection keeps answering afterwards.
+        listener = await self.server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await self.send(reader, writer, {"op": "new", "session": "a"})
+        output_1 = await self.send(reader, writer, {"op": "move", "session": "a", "start": "c3", "end": "c3x"})
+        output_2 = await self.send(reader, writer, {"op": "move", "session": "a", "start": "c3", "end": "c6"})
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual(output_1["ok"], False)
+        self.assertEqual([output_2["ok"], output_2["moves"]], [True, ["c3-c6"]])
+
+    # Tests relating to start_unix.
+    @unittest.skipIf(not hasattr(asyncio, "start_unix_server"), "Unix sockets are not available")
+    async def test_1_start_unix(self):
+        # Testing a request over a Unix socket.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "gess.sock")
+            await self.server.start_unix(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            output = await self.send(reader, writer, {"op": "new", "session": "a"})
+            writer.close()
+            await writer.wait_closed()
+
+        self.assertEqual([output["ok"], output["game_state"]], [True, "UNFINISHED"])
+
+if __name__ == "__main__":
+    unittest.main()
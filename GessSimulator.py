@@ -0,0 +1,200 @@
+# Description: Houses the headless batch simulator that plays complete GessGames between move-picking policies.
+#              Games run in parallel worker processes without printing anything, one JSON line per game is written
+#              to an optional results file, and a summary of throughput and win rates is returned.
+#              Run from the command line with: python GessSimulator.py --games 100 --black random --white greedy
+
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GessGame import COORDINATES, GessGame
+from GessEngine import GessEngine, WIN_SCORE, evaluate
+from GessMCTS import MCTSPlayer
+
+
+# Games still going after this many moves are stopped and recorded as a draw.
+MAX_GAME_MOVES = 300
+
+
+class RandomPolicy:
+    """This class picks a random legal move."""
+    def __init__(self, seed=None):
+        """Instantiates a RandomPolicy with an optional random seed."""
+        self._rng = random.Random(seed)
+
+    def choose_move(self, game):
+        """Returns a random legal move, or None if there isn't one."""
+        moves = list(game.iter_legal_square_moves(distinct=True))
+        if len(moves) == 0:
+            return None
+        start, end = self._rng.choice(moves)
+        return COORDINATES[start], COORDINATES[end]
+
+
+class GreedyPolicy:
+    """This class picks the legal move with the best evaluation one move ahead, breaking ties at random."""
+    def __init__(self, seed=None):
+        """Instantiates a GreedyPolicy with an optional random seed."""
+        self._rng = random.Random(seed)
+
+    def choose_move(self, game):
+        """Returns the legal move that scores best for the player to move, or None if there isn't one."""
+        player = game.get_current_player()
+        best_moves = []
+        best_score = None
+        for move in game.iter_legal_square_moves(distinct=True):
+            game.push_square_move(move[0], move[1])
+            state = game.get_game_state()
+            if state == "UNFINISHED":
+                score = -evaluate(game)
+            elif state == player + "_WON":
+                score = WIN_SCORE
+            else:
+                score = -WIN_SCORE
+            game.pop_move()
+
+            if best_score is None or score > best_score:
+                best_moves = [move]
+                best_score = score
+            elif score == best_score:
+                best_moves.append(move)
+
+        if len(best_moves) == 0:
+            return None
+        start, end = self._rng.choice(best_moves)
+        return COORDINATES[start], COORDINATES[end]
+
+
+class EnginePolicy:
+    """This class picks moves with the alpha-beta GessEngine."""
+    def __init__(self, seed=None, time_limit=0.2, node_limit=None):
+        """Instantiates an EnginePolicy with the engine's time and node limits. The seed is unused."""
+        self._engine = GessEngine(time_limit=time_limit, node_limit=node_limit)
+
+    def choose_move(self, game):
+        """Returns the engine's best move, or None if there isn't one."""
+        return self._engine.find_best_move(game).get_best_move()
+
+
+class MCTSPolicy:
+    """This class picks moves with a single-process MCTSPlayer."""
+    def __init__(self, seed=None, time_limit=0.2, node_limit=None):
+        """Instantiates an MCTSPolicy with the player's time limit, and the node limit as its iterations."""
+        self._player = MCTSPlayer(iterations=node_limit, time_limit=time_limit, seed=seed)
+
+    def choose_move(self, game):
+        """Returns the player's best move, or None if there isn't one."""
+        return self._player.find_best_move(game).get_best_move()
+
+
+# Policies by the name used on the command line.
+POLICIES = {"random": RandomPolicy, "greedy": GreedyPolicy, "engine": EnginePolicy, "mcts": MCTSPolicy}
+
+
+def make_policy(name, seed=None, time_limit=0.2, node_limit=None):
+    """Returns a new policy from its name. Search limits only apply to the engine and mcts policies."""
+    if name not in POLICIES:
+        raise ValueError("Unknown policy: " + str(name))
+    if name in ("engine", "mcts"):
+        return POLICIES[name](seed, time_limit, node_limit)
+    return POLICIES[name](seed)
+
+
+def play_game(index, black, white, seed=None, time_limit=0.2, node_limit=None, max_moves=MAX_GAME_MOVES):
+    """
+    Plays one complete game between two policy names, returning its record as a dictionary.
+    The result is the final game state, or "DRAW" if the game hit max_moves or a player had no legal move.
+    """
+    game_seed = None if seed is None else seed * 1000003 + index
+    policies = {"BLACK": make_policy(black, game_seed, time_limit, node_limit),
+                "WHITE": make_policy(white, None if game_seed is None else game_seed + 1, time_limit, node_limit)}
+    game = GessGame()
+    moves = []
+    start_time = time.perf_counter()
+    while game.get_game_state() == "UNFINISHED" and len(moves) < max_moves:
+        move = policies[game.get_current_player()].choose_move(game)
+        if move is None:
+            break
+        game.make_move(move[0], move[1])
+        moves.append(move[0] + "-" + move[1])
+
+    result = game.get_game_state()
+    if result == "UNFINISHED":
+        result = "DRAW"
+    return {"game": index, "black": black, "white": white, "result": result, "length": len(moves),
+            "seconds": time.perf_counter() - start_time, "moves": moves}
+
+
+def play_games(indices, black, white, seed, time_limit, node_limit, max_moves):
+    """Plays a batch of games in one worker process, returning their records."""
+    return [play_game(index, black, white, seed, time_limit, node_limit, max_moves) for index in indices]
+
+
+def run_games(games, black="random", white="random", workers=1, seed=None, time_limit=0.2, node_limit=None,
+              max_moves=MAX_GAME_MOVES, output=None, batch_size=8):
+    """
+    Plays a number of games between two policy names across worker processes, writing each game's record as a
+        JSON line to the output file if one is given.
+    Returns a summary dictionary with the games and moves played per second, the average game length, and the
+        share of games ending in each result.
+    """
+    batches = [range(first, min(first + batch_size, games)) for first in range(0, games, batch_size)]
+    arguments = (black, white, seed, time_limit, node_limit, max_moves)
+    results = {"BLACK_WON": 0, "WHITE_WON": 0, "DRAW": 0}
+    total_moves = 0
+    output_file = None if output is None else open(output, "w")
+    start_time = time.perf_counter()
+    try:
+        if workers <= 1:
+            finished = (play_games(batch, *arguments) for batch in batches)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            finished = executor.map(play_games, batches, *[[argument] * len(batches) for argument in arguments])
+
+        for records in finished:
+            for record in records:
+                results[record["result"]] += 1
+                total_moves += record["length"]
+                if output_file is not None:
+                    output_file.write(json.dumps(record) + "\n")
+        if executor is not None:
+            executor.shutdown()
+    finally:
+        if output_file is not None:
+            output_file.close()
+
+    elapsed = time.perf_counter() - start_time
+    return {"games": games, "black": black, "white": white, "workers": workers, "seconds": elapsed,
+            "games_per_second": games / elapsed if elapsed > 0 else 0.0,
+            "moves_per_second": total_moves / elapsed if elapsed > 0 else 0.0,
+            "average_length": total_moves / games if games > 0 else 0.0,
+            "win_rates": {result: count / games if games > 0 else 0.0 for result, count in results.items()}}
+
+
+def main(arguments=None):
+    """Runs the simulator from the command line, printing the summary as JSON."""
+    parser = argparse.ArgumentParser(description="Play complete Gess games between two policies.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--black", choices=sorted(POLICIES), default="random", help="policy playing black")
+    parser.add_argument("--white", choices=sorted(POLICIES), default="random", help="policy playing white")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for reproducible games")
+    parser.add_argument("--time-limit", type=float, default=0.2, help="seconds per engine or mcts move")
+    parser.add_argument("--node-limit", type=int, default=None, help="nodes per engine move, or mcts iterations")
+    parser.add_argument("--max-moves", type=int, default=MAX_GAME_MOVES, help="moves before a game is a draw")
+    parser.add_argument("--output", default=None, help="file to write one JSON line per game to")
+    options = parser.parse_args(arguments)
+
+    summary = run_games(options.games, options.black, options.white, options.workers, options.seed,
+                        options.time_limit, options.node_limit, options.max_moves, options.output)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
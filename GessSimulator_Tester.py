@@ -0,0 +1,112 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from GessGame import *
+from GessSimulator import *
+
+
+class TestGessSimulator(unittest.TestCase):
+    """
+    Contains unit tests for GessSimulator.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO POLICIES:
+    """
+    # Tests relating to make_policy.
+    def test_1_make_policy(self):
+        # Testing that each policy name makes a policy that picks a legal move.
+        game = GessGame()
+        output = [make_policy(name, 0, node_limit=50).choose_move(game) in game.legal_moves() for name in POLICIES]
+
+        self.assertEqual(output, [True] * len(POLICIES))
+
+    def test_2_make_policy(self):
+        # Testing that an unknown policy name is rejected.
+        with self.assertRaises(ValueError):
+            make_policy("perfect")
+
+    # Tests relating to GreedyPolicy.
+    def test_1_greedy_choose_move(self):
+        # Testing that the greedy policy never gives up a ring on its first move.
+        game = GessGame()
+        move = GreedyPolicy(0).choose_move(game)
+        game.make_move(*move)
+
+        self.assertEqual(game.get_game_state(), "UNFINISHED")
+
+    """
+    TESTS RELATING TO GAMES:
+    """
+    # Tests relating to play_game.
+    def test_1_play_game(self):
+        # Testing that a seeded game is replayed the same way, and that its moves are legal.
+        record_1 = play_game(0, "random", "greedy", seed=5)
+        record_2 = play_game(0, "random", "greedy", seed=5)
+        game = GessGame()
+        for move in record_1["moves"]:
+            start, end = move.split("-")
+            game.make_move(start, end)
+
+        self.assertEqual(record_1["moves"], record_2["moves"])
+        self.assertEqual(game.get_game_state(), record_1["result"])
+
+    def test_2_play_game(self):
+        # Testing that a game stopped at the move limit is a draw.
+        record = play_game(0, "greedy", "greedy", seed=1, max_moves=2)
+
+        self.assertEqual([record["result"], record["length"]], ["DRAW", 2])
+
+    def test_3_play_game(self):
+        # Testing a whole game with the engine on both sides, where each engine picks every move of its side.
+        record = play_game(0, "engine", "engine", seed=3, time_limit=None, node_limit=200, max_moves=40)
+        game = GessGame()
+        for move in record["moves"]:
+            start, end = move.split("-")
+            self.assertIn((start, end), game.legal_moves())
+            game.make_move(start, end)
+
+        self.assertGreater(record["length"], 2)
+        self.assertEqual(record["result"], "DRAW" if game.get_game_state() == "UNFINISHED" else game.get_game_state())
+
+    # Tests relating to run_games.
+    def test_1_run_games(self):
+        # Testing that every game is written to the output file and counted in the summary.
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "games.jsonl")
+        summary = run_games(5, "random", "random", seed=3, output=path, batch_size=2)
+        with open(path) as results:
+            records = [json.loads(line) for line in results]
+        os.remove(path)
+        os.rmdir(directory)
+
+        self.assertEqual([record["game"] for record in records], [0, 1, 2, 3, 4])
+        self.assertAlmostEqual(sum(summary["win_rates"].values()), 1.0)
+        self.assertEqual(summary["average_length"], sum(record["length"] for record in records) / 5)
+
+    def test_2_run_games(self):
+        # Testing that games played across worker processes match the ones played in a single process.
+        single = run_games(4, "random", "random", seed=4)
+        parallel = run_games(4, "random", "random", workers=2, seed=4, batch_size=1)
+
+        self.assertEqual(single["win_rates"], parallel["win_rates"])
+        self.assertEqual(single["average_length"], parallel["average_length"])
+
+    # Tests relating to main.
+    def test_1_main(self):
+        # Testing that the command line prints the summary as JSON.
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            summary = main(["--games", "2", "--seed", "6", "--white", "greedy"])
+
+        self.assertEqual(json.loads(stdout.getvalue()), summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
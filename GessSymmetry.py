@@ -0,0 +1,135 @@
+# Description: Houses the symmetry tools that map Gess positions to a canonical orientation.
+#              The rules are unchanged by a left-right mirror of the board, and by a top-bottom flip that also swaps
+#              the colors and the player to move, so every position has up to four equivalent forms. The starting
+#              position itself is only unchanged by the flip: the stone on i3 has no mirror image on l3.
+#              canonicalize picks one of the forms and returns a key for it, together with the transform that leads
+#              to it. Transposition tables, opening books and datasets can then hold a single entry for all four
+#              forms. Every transform undoes itself, so a move found in the canonical orientation is mapped back by
+#              applying the same transform to it again. The one exception to the symmetry is a move that destroys
+#              both players' last rings, which make_move always scores as a win for white.
+
+from GessGame import (COORDINATES, SQUARES, WIDTH, ZOBRIST_WHITE_TO_MOVE, Board, GessGame, get_zobrist,
+                      opponent_of)
+
+
+# Transforms, which combine as a bitwise OR. FLIP swaps the colors and the player to move as well as the rows.
+IDENTITY = 0
+MIRROR = 1
+FLIP = 2
+MIRROR_FLIP = MIRROR | FLIP
+TRANSFORMS = (IDENTITY, MIRROR, FLIP, MIRROR_FLIP)
+
+# Each 10-bit number with its bits in reverse order, so a 20-space row is mirrored with two lookups.
+REVERSED_HALVES = [int(format(_bits, "010b")[::-1], 2) for _bits in range(1 << 10)]
+ROW_MASK = (1 << WIDTH) - 1
+HALF_MASK = (1 << (WIDTH // 2)) - 1
+# Game states after the colors are swapped.
+SWAPPED_STATES = {"UNFINISHED": "UNFINISHED", "BLACK_WON": "WHITE_WON", "WHITE_WON": "BLACK_WON"}
+
+
+def transform_stones(stones, transform):
+    """Returns a bitboard of stones with the transform's mirror and flip applied to it, leaving colors alone."""
+    if transform == IDENTITY or stones == 0:
+        return stones
+    result = 0
+    for row in range(WIDTH):
+        bits = stones >> (row * WIDTH) & ROW_MASK
+        if bits == 0:
+            continue
+        if transform & MIRROR:
+            bits = REVERSED_HALVES[bits & HALF_MASK] << (WIDTH // 2) | REVERSED_HALVES[bits >> (WIDTH // 2)]
+        result |= bits << ((WIDTH - 1 - row if transform & FLIP else row) * WIDTH)
+    return result
+
+
+def transform_position(black, white, current_player, transform):
+    """Returns the (black, white, current player) position a transform leads to from a position."""
+    if transform & FLIP:
+        return transform_stones(white, transform), transform_stones(black, transform), opponent_of(current_player)
+    return transform_stones(black, transform), transform_stones(white, transform), current_player
+
+
+def get_position_key(black, white, current_player):
+    """Returns the 64-bit Zobrist hash of a position, the same as GessGame.position_hash would give."""
+    key = get_zobrist("BLACK", black) ^ get_zobrist("WHITE", white)
+    if current_player == "WHITE":
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    return key
+
+
+def canonicalize(black, white, current_player):
+    """
+    Returns a (key, transform) tuple for a position: the Zobrist hash of its canonical form, and the transform that
+        turns the position into that form. The canonical form is the one with the smallest (black, white, white to
+        move) bitboards, and a position that several transforms leave unchanged takes the lowest of them.
+    """
+    best = None
+    best_transform = IDENTITY
+    for transform in TRANSFORMS:
+        new_black, new_white, new_player = transform_position(black, white, current_player, transform)
+        candidate = (new_black, new_white, new_player == "WHITE")
+        if best is None or candidate < best:
+            best = candidate
+            best_transform = transform
+    return get_position_key(best[0], best[1], "WHITE" if best[2] else "BLACK"), best_transform
+
+
+def canonicalize_game(game):
+    """Returns the (key, transform) tuple of canonicalize for the position and player to move of a GessGame."""
+    board = game.get_board()
+    return canonicalize(board.get_stones("BLACK"), board.get_stones("WHITE"), game.get_current_player())
+
+
+def transform_game(game, transform):
+    """
+    Returns a new GessGame with a transform applied to a game's position, player to move and game state.
+    The new game has no moves to take back.
+    """
+    board = game.get_board()
+    black, white, current_player = transform_position(board.get_stones("BLACK"), board.get_stones("WHITE"),
+                                                      game.get_current_player(), transform)
+    game_state = game.get_game_state()
+    if transform & FLIP:
+        game_state = SWAPPED_STATES[game_state]
+
+    new_board = Board()
+    new_board.load_stones(black, white)
+    return GessGame.from_bytes(new_board.to_bytes(current_player, game_state))
+
+
+def transform_square(square, transform):
+    """Returns the square index a transform moves a square index to."""
+    row, column = divmod(square, WIDTH)
+    if transform & MIRROR:
+        column = WIDTH - 1 - column
+    if transform & FLIP:
+        row = WIDTH - 1 - row
+    return row * WIDTH + column
+
+
+def transform_coordinate(coordinate, transform):
+    """
+    Returns the coordinate a transform moves a coordinate to. Coordinates past the board's edge, such as "c21",
+        are worked out from their letter and number.
+    """
+    if coordinate in SQUARES:
+        return COORDINATES[transform_square(SQUARES[coordinate], transform)]
+    letter, number = coordinate[0], int(coordinate[1:])
+    if transform & MIRROR:
+        letter = chr(2 * ord("a") + WIDTH - 1 - ord(letter))
+    if transform & FLIP:
+        number = WIDTH + 1 - number
+    return letter + str(number)
+
+
+def transform_move(start, end, transform):
+    """
+    Returns the (start, end) coordinates a transform moves a move to. Applying the transform that canonicalize
+        returned to a move found in the canonical form gives the move in the original position.
+    """
+    return transform_coordinate(start, transform), transform_coordinate(end, transform)
+
+
+def transform_square_move(start, end, transform):
+    """Version of transform_move that takes and returns square indices."""
+    return transform_square(start, transform), transform_square(end, transform)
@@ -0,0 +1,92 @@
+import unittest
+from GessGame import *
+from GessSymmetry import *
+from GessBatch_Tester import random_games
+
+
+class TestGessSymmetry(unittest.TestCase):
+    """
+    Contains unit tests for GessSymmetry.py
+    The tests for each class are separated by docstrings.
+    The tests for each method area separated by their own comments. The tests for each method starts at 1,
+    to help track potential future implementations of tests.
+    """
+
+    """
+    TESTS RELATING TO MODULE FUNCTIONS:
+    """
+    # Tests relating to transform_position.
+    def test_1_transform_position(self):
+        # Testing that a flip leaves the starting position's stones alone and only changes who is to move.
+        board = Board()
+        black, white = board.get_stones("BLACK"), board.get_stones("WHITE")
+        output = transform_position(black, white, "BLACK", FLIP)
+
+        self.assertEqual(output, (black, white, "WHITE"))
+        self.assertEqual(transform_position(black, white, "BLACK", MIRROR)[:2] == (black, white), False)
+
+    def test_2_transform_position(self):
+        # Testing that applying a transform twice gives back the position.
+        output = []
+        for game in random_games(6, 8, 30):
+            board = game.get_board()
+            position = (board.get_stones("BLACK"), board.get_stones("WHITE"), game.get_current_player())
+            output.append([transform_position(*transform_position(*position, transform), transform) == position
+                           for transform in TRANSFORMS])
+
+        self.assertEqual(output, [[True] * 4] * 6)
+
+    # Tests relating to canonicalize.
+    def test_1_canonicalize(self):
+        # Testing that all four forms of a position get the same key, and that the transform leads to the key.
+        output = []
+        for game in random_games(8, 2, 30):
+            keys = set()
+            for transform in TRANSFORMS:
+                form = transform_game(game, transform)
+                key, canonical = canonicalize_game(form)
+                keys.add(key)
+                output.append(transform_game(form, canonical).position_hash() == key)
+            output.append(len(keys) == 1)
+
+        self.assertEqual(output, [True] * 40)
+
+    def test_2_canonicalize(self):
+        # Testing that the starting position with either player to move is one canonical position.
+        board = Board()
+        output_1 = canonicalize(board.get_stones("BLACK"), board.get_stones("WHITE"), "BLACK")
+        output_2 = canonicalize(board.get_stones("BLACK"), board.get_stones("WHITE"), "WHITE")
+
+        self.assertEqual(output_1, (GessGame().position_hash(), IDENTITY))
+        self.assertEqual(output_2, (output_1[0], FLIP))
+
+    # Tests relating to transform_game.
+    def test_1_transform_game(self):
+        # Testing that the legal moves of a transformed game are the transformed legal moves of the game.
+        output = []
+        for game in random_games(6, 14, 30):
+            for transform in TRANSFORMS:
+                moves = {transform_move(start, end, transform) for start, end in game.legal_moves()}
+                output.append(moves == set(transform_game(game, transform).legal_moves()))
+
+        self.assertEqual(output, [True] * 24)
+
+    def test_2_transform_game(self):
+        # Testing that a flip swaps the player to move and the winner.
+        game = GessGame()
+        game.resign_game()
+        output = transform_game(game, FLIP)
+
+        self.assertEqual([output.get_current_player(), output.get_game_state()], ["WHITE", "BLACK_WON"])
+
+    # Tests relating to transform_move.
+    def test_1_transform_move(self):
+        # Testing moves on the board and past its edge, for each transform.
+        output = [transform_move("c3", "c21", transform) for transform in TRANSFORMS]
+
+        self.assertEqual(output, [("c3", "c21"), ("r3", "r21"), ("c18", "c0"), ("r18", "r0")])
+        self.assertEqual(transform_square_move(SQUARES["c3"], SQUARES["f6"], MIRROR_FLIP),
+                         (SQUARES["r18"], SQUARES["o15"]))
+
+if __name__ == "__main__":
+    unittest.main()